@@ -155,8 +155,11 @@ class Agent:
         self.learning = LearningManager()
         
         # Market Analysis
-        market_data_sources = self.settings.get("market_analysis", {}).get("data_sources", {})
-        self.market_analyzer = MarketAnalyzer(data_sources=market_data_sources)
+        market_settings = self.settings.get("market_analysis", {})
+        self.market_analyzer = MarketAnalyzer(
+            data_sources=market_settings.get("data_sources", {}),
+            redis_url=market_settings.get("redis_url"),
+        )
         self.sentiment_analyzer = SentimentAnalyzer(data_sources={"social": "twitter"})
 
         # Initialize wallets
@@ -220,6 +223,7 @@ class Agent:
         try:
             cleanup_tasks = [
                 self.groq.cleanup() if hasattr(self.groq, 'cleanup') else None,
+                self.market_analyzer.cleanup() if hasattr(self.market_analyzer, 'cleanup') else None,
                 self.memory.cleanup() if hasattr(self.memory, 'cleanup') else None,
                 self.security.cleanup() if hasattr(self.security, 'cleanup') else None,
                 self.solana_wallet.cleanup() if hasattr(self.solana_wallet, 'cleanup') else None,
@@ -1060,6 +1064,7 @@ class Agent:
         try:
             cleanup_tasks = [
                 self.groq.cleanup(),
+                self.market_analyzer.cleanup(),
                 self.memory.cleanup(),
                 self.security.cleanup(),
                 self.solana_wallet.cleanup(),
@@ -6,6 +6,7 @@ from web3 import Web3
 from web3.middleware import geth_poa_middleware
 from eth_account import Account
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from web3.types import Wei
 
 logger = logging.getLogger(__name__)
@@ -16,6 +17,7 @@ class EthereumWallet:
         rpc_url: str,
         private_key: Optional[str] = None,
         zksync_url: Optional[str] = None,
+        max_workers: int = 32,
     ):
         if not rpc_url:
             raise ValueError("RPC URL is required")
@@ -59,8 +61,17 @@ class EthereumWallet:
             except Exception as e:
                 logger.error(f"Failed to initialize zkSync: {e}")
                 self.zksync_enabled = False
-                
-        self._loop = asyncio.get_event_loop()
+
+        # Dedicated pool for blocking RPC calls so they don't compete with
+        # other users of the loop's default executor
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="web3"
+        )
+
+    async def _run(self, func, *args):
+        """Run a blocking web3 call on the wallet's thread pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
 
     def _format_private_key(self, key: str) -> str:
         """Format private key to correct format"""
@@ -89,16 +100,10 @@ class EthereumWallet:
     async def _check_connection(self) -> Tuple[bool, Optional[int]]:
         """Check connection to Ethereum node and get chain ID"""
         try:
-            connected = await self._loop.run_in_executor(
-                None, 
-                self.web3.is_connected
-            )
+            connected = await self._run(self.web3.is_connected)
             
             if connected:
-                chain_id = await self._loop.run_in_executor(
-                    None,
-                    lambda: self.web3.eth.chain_id
-                )
+                chain_id = await self._run(lambda: self.web3.eth.chain_id)
                 logger.info(f"Connected to network with chain ID: {chain_id}")
                 return True, chain_id
             else:
@@ -118,11 +123,7 @@ class EthereumWallet:
                 return False
 
             # Get balance without requiring initialization
-            balance_wei = await self._loop.run_in_executor(
-                None,
-                self.web3.eth.get_balance,
-                self.address
-            )
+            balance_wei = await self._run(self.web3.eth.get_balance, self.address)
             
             balance_eth = self.web3.from_wei(balance_wei, 'ether')
             logger.info(f"Initial balance: {balance_eth} ETH")
@@ -146,10 +147,7 @@ class EthereumWallet:
 
             # Initialize zkSync if enabled
             if self.zksync_enabled:
-                zk_connected = await self._loop.run_in_executor(
-                    None,
-                    self.zksync_web3.is_connected
-                )
+                zk_connected = await self._run(self.zksync_web3.is_connected)
                 if not zk_connected:
                     logger.warning("Failed to connect to zkSync node")
                     self.zksync_enabled = False
@@ -165,11 +163,7 @@ class EthereumWallet:
     async def get_balance(self) -> float:
         """Get ETH balance for wallet address"""
         try:
-            balance_wei = await self._loop.run_in_executor(
-                None,
-                self.web3.eth.get_balance,
-                self.address
-            )
+            balance_wei = await self._run(self.web3.eth.get_balance, self.address)
             
             return float(self.web3.from_wei(balance_wei, 'ether'))
             
@@ -182,17 +176,12 @@ class EthereumWallet:
         try:
             # Close web3 connections
             if hasattr(self.web3.provider, 'close'):
-                await self._loop.run_in_executor(
-                    None,
-                    self.web3.provider.close
-                )
+                await self._run(self.web3.provider.close)
             
             if self.zksync_enabled and hasattr(self.zksync_web3.provider, 'close'):
-                await self._loop.run_in_executor(
-                    None,
-                    self.zksync_web3.provider.close
-                )
+                await self._run(self.zksync_web3.provider.close)
                 
+            self._executor.shutdown(wait=False, cancel_futures=True)
             self._initialized = False
             logger.info("Ethereum wallet cleaned up successfully")
             
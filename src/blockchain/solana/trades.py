@@ -4,6 +4,7 @@ from dataclasses import dataclass
 import aiohttp
 import base64
 import base58
+import orjson
 from rsa import PublicKey
 from solana.transaction import VersionedTransaction
 from solana.rpc.commitment import Confirmed
@@ -16,6 +17,10 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+def _json_dumps(obj) -> str:
+    return orjson.dumps(obj).decode()
+
+
 @dataclass
 class SwapQuote:
     """Jupiter swap quote information."""
@@ -76,13 +81,13 @@ async def trade(
             f"maxAccounts=20"
         )
 
-        async with aiohttp.ClientSession() as session:
+        async with aiohttp.ClientSession(json_serialize=_json_dumps) as session:
             # Get quote
             async with session.get(quote_url) as response:
                 if response.status != 200:
                     error_text = await response.text()
                     raise Exception(f"Quote failed: {error_text}")
-                quote_response = await response.json()
+                quote_response = orjson.loads(await response.read())
 
             logger.info("Getting swap transaction")
 
@@ -102,7 +107,7 @@ async def trade(
                     error_text = await response.text()
                     raise Exception(f"Swap transaction failed: {error_text}")
 
-                swap_data = await response.json()
+                swap_data = orjson.loads(await response.read())
 
             # Deserialize transaction
             tx_data = base64.b64decode(swap_data["swapTransaction"])
@@ -157,11 +162,11 @@ class JupiterTrader:
             f"slippageBps={slippage_bps}"
         )
 
-        async with aiohttp.ClientSession() as session:
+        async with aiohttp.ClientSession(json_serialize=_json_dumps) as session:
             async with session.get(quote_url) as response:
                 if response.status != 200:
                     raise Exception(await response.text())
-                data = await response.json()
+                data = orjson.loads(await response.read())
 
                 return SwapQuote(
                     input_mint=str(input_mint),
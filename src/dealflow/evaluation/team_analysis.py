@@ -1,3 +1,4 @@
+import asyncio
 from dataclasses import dataclass
 from typing import Dict, List
 
@@ -16,36 +17,69 @@ class TeamAnalyzer:
     def __init__(self):
         self.github_client = None  # Initialize GitHub API client
         self.linkedin_client = None  # Initialize LinkedIn API client
+        self.max_concurrent_requests = 10
+        self.category_weights = {"technical": 0.4, "business": 0.3, "product": 0.3}
+        # Fixed role vocabulary; unknown roles fall back to "business"
+        self.role_categories = {
+            "cto": "technical",
+            "engineer": "technical",
+            "developer": "technical",
+            "architect": "technical",
+            "researcher": "technical",
+            "ceo": "business",
+            "coo": "business",
+            "cfo": "business",
+            "founder": "business",
+            "bd": "business",
+            "marketing": "business",
+            "cpo": "product",
+            "product": "product",
+            "product manager": "product",
+            "designer": "product",
+        }
 
     async def analyze_team(self, team_data: List[Dict]) -> List[TeamMember]:
-        analyzed_team = []
-        for member in team_data:
-            github_score = await self._analyze_github(member["github"])
-            linkedin_score = await self._analyze_linkedin(member["linkedin"])
+        # Separate caps so one slow host cannot starve the other
+        github_limit = asyncio.Semaphore(self.max_concurrent_requests)
+        linkedin_limit = asyncio.Semaphore(self.max_concurrent_requests)
+
+        async def analyze_member(member: Dict) -> TeamMember:
+            async def github() -> float:
+                async with github_limit:
+                    return await self._analyze_github(member["github"])
+
+            async def linkedin() -> float:
+                async with linkedin_limit:
+                    return await self._analyze_linkedin(member["linkedin"])
+
+            github_score, linkedin_score = await asyncio.gather(github(), linkedin())
             experience_score = self._evaluate_experience(member["experience"])
 
             score = (github_score + linkedin_score + experience_score) / 3
 
-            analyzed_team.append(
-                TeamMember(
-                    name=member["name"],
-                    role=member["role"],
-                    experience=member["experience"],
-                    github=member["github"],
-                    linkedin=member["linkedin"],
-                    score=score,
-                )
+            return TeamMember(
+                name=member["name"],
+                role=member["role"],
+                experience=member["experience"],
+                github=member["github"],
+                linkedin=member["linkedin"],
+                score=score,
             )
-        return analyzed_team
+
+        return list(await asyncio.gather(*(analyze_member(m) for m in team_data)))
 
     async def calculate_team_score(self, team: List[TeamMember]) -> float:
-        weights = {"technical": 0.4, "business": 0.3, "product": 0.3}
+        weights = self.category_weights
+        role_categories = self.role_categories
 
-        scores = {role: [] for role in weights}
+        # Single pass keeping the best score per category; a category with no
+        # members counts as 0, but a lone negative score is kept as is
+        best: Dict[str, float] = {}
         for member in team:
-            role_category = self._categorize_role(member.role)
-            scores[role_category].append(member.score)
+            category = role_categories.get(member.role.lower(), "business")
+            if category not in best or member.score > best[category]:
+                best[category] = member.score
 
         return sum(
-            max(scores[role], default=0) * weight for role, weight in weights.items()
+            best.get(category, 0.0) * weight for category, weight in weights.items()
         )
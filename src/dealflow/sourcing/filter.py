@@ -19,23 +19,25 @@ class ProjectFilter:
         self.filtered_projects = pd.DataFrame()
 
     async def apply_filters(self, projects: pd.DataFrame) -> pd.DataFrame:
-        filtered = projects.copy()
-
-        filtered = filtered[
-            (filtered["github_stars"] >= self.criteria.min_github_stars)
-            & (filtered["tvl"] >= self.criteria.min_tvl)
-            & (filtered["team_size"] >= self.criteria.min_team_size)
-            & (filtered["age_months"] <= self.criteria.max_age_months)
-        ]
+        # Build one combined mask and slice once, instead of copying the
+        # whole frame up front and re-slicing per predicate
+        mask = (
+            (projects["github_stars"] >= self.criteria.min_github_stars)
+            & (projects["tvl"] >= self.criteria.min_tvl)
+            & (projects["team_size"] >= self.criteria.min_team_size)
+            & (projects["age_months"] <= self.criteria.max_age_months)
+        )
 
         if self.criteria.required_audits:
-            filtered = filtered[filtered["has_audit"] == True]
+            mask &= projects["has_audit"] == True
 
-        filtered = filtered[
-            filtered["chains"].apply(
-                lambda x: all(chain in x for chain in self.criteria.required_chains)
+        required_chains = self.criteria.required_chains
+        if required_chains:
+            mask &= projects["chains"].map(
+                lambda x: all(chain in x for chain in required_chains)
             )
-        ]
+
+        filtered = projects.loc[mask]
 
         self.filtered_projects = filtered
         return filtered
@@ -44,13 +46,13 @@ class ProjectFilter:
         if self.filtered_projects.empty:
             return pd.DataFrame()
 
-        for metric, weight in weights.items():
-            self.filtered_projects[f"{metric}_weighted"] = (
-                self.filtered_projects[metric] * weight
-            )
-
-        self.filtered_projects["total_score"] = sum(
-            self.filtered_projects[f"{metric}_weighted"] for metric in weights.keys()
-        )
+        # Scores are attached to a new frame so filtered_projects stays untouched
+        projects = self.filtered_projects
+        weighted = {
+            f"{metric}_weighted": projects[metric] * weight
+            for metric, weight in weights.items()
+        }
+        total_score = sum(weighted.values())
 
-        return self.filtered_projects.sort_values("total_score", ascending=False)
+        ranked = projects.assign(**weighted, total_score=total_score)
+        return ranked.sort_values("total_score", ascending=False)
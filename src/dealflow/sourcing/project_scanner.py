@@ -1,18 +1,24 @@
-from typing import Dict, List
+from typing import Any, Dict, List
 import asyncio
 from datetime import datetime
 import aiohttp
+import orjson
 import pandas as pd
 
 
+def _json_dumps(obj: Any) -> str:
+    return orjson.dumps(obj).decode()
+
+
 class ProjectScanner:
     def __init__(self, sources: Dict[str, str]):
         self.sources = sources
         self.scanned_projects = pd.DataFrame()
+        self.chain_matrix = pd.DataFrame()
 
     async def scan_sources(self) -> pd.DataFrame:
         tasks = []
-        async with aiohttp.ClientSession() as session:
+        async with aiohttp.ClientSession(json_serialize=_json_dumps) as session:
             for source_name, url in self.sources.items():
                 task = asyncio.create_task(self._scan_source(session, source_name, url))
                 tasks.append(task)
@@ -21,8 +27,27 @@ class ProjectScanner:
 
         all_projects = pd.concat(results, ignore_index=True)
         self.scanned_projects = all_projects
+        self.chain_matrix = self._build_chain_matrix(all_projects)
         return all_projects
 
+    def _build_chain_matrix(self, projects: pd.DataFrame) -> pd.DataFrame:
+        """One boolean column per chain, built once at ingest"""
+        if projects.empty or "chains" not in projects:
+            return pd.DataFrame(index=projects.index)
+
+        chains = projects["chains"].explode().dropna()
+        matrix = pd.crosstab(chains.index, chains).astype(bool)
+        return matrix.reindex(projects.index, fill_value=False)
+
+    def projects_on_chains(self, chains: List[str]) -> pd.Series:
+        """Mask of scanned projects deployed on every chain in `chains`"""
+        missing = [c for c in chains if c not in self.chain_matrix.columns]
+        if missing:
+            return pd.Series(False, index=self.scanned_projects.index)
+        if not chains:
+            return pd.Series(True, index=self.scanned_projects.index)
+        return self.chain_matrix[chains].all(axis=1)
+
     async def _scan_source(
         self, session: aiohttp.ClientSession, source_name: str, url: str
     ) -> pd.DataFrame:
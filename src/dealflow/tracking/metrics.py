@@ -1,9 +1,24 @@
 from dataclasses import dataclass
+from enum import Enum
 from typing import Dict, List, Optional
 from datetime import datetime
 import pandas as pd
 
 
+class DealStage(Enum):
+    SOURCED = "sourced"
+    SCREENING = "screening"
+    DEEP_DIVE = "deep_dive"
+    COMMITTEE = "committee"
+    NEGOTIATION = "negotiation"
+    CLOSED = "closed"
+    REJECTED = "rejected"
+
+
+# Stage is low-cardinality and filtered on constantly, so store it as codes
+STAGE_DTYPE = pd.CategoricalDtype([stage.value for stage in DealStage])
+
+
 @dataclass
 class DealMetrics:
     deal_id: str
@@ -25,6 +40,7 @@ class MetricsTracker:
     async def track_deal(self, metrics: DealMetrics):
         df = pd.DataFrame([metrics.__dict__])
         self.metrics = pd.concat([self.metrics, df], ignore_index=True)
+        self.metrics["stage"] = self.metrics["stage"].astype(STAGE_DTYPE)
         await self._update_kpis()
 
     async def _update_kpis(self):
@@ -1,19 +1,8 @@
 from dataclasses import dataclass
-from enum import Enum
 from typing import Dict, List, Optional
 from datetime import datetime
 
-from dealflow.tracking.metrics import DealMetrics, MetricsTracker
-
-
-class DealStage(Enum):
-    SOURCED = "sourced"
-    SCREENING = "screening"
-    DEEP_DIVE = "deep_dive"
-    COMMITTEE = "committee"
-    NEGOTIATION = "negotiation"
-    CLOSED = "closed"
-    REJECTED = "rejected"
+from dealflow.tracking.metrics import DealMetrics, DealStage, MetricsTracker
 
 
 @dataclass
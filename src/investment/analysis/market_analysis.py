@@ -1,16 +1,154 @@
 # src/investment/analysis/market_analysis.py
 import asyncio
 import json
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 import logging
+import weakref
 import aiohttp
+import msgspec
+import orjson
+import redis.asyncio as redis
+import simdjson
 from datetime import datetime
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import (
+    RetryCallState,
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+
+
+async def _json(response: aiohttp.ClientResponse) -> Any:
+    """Decode a response body with orjson, skipping aiohttp's str decode"""
+    return orjson.loads(await response.read())
+
+
+def _json_dumps(obj: Any) -> str:
+    return orjson.dumps(obj).decode()
+
+
+class _JupiterPriceData(msgspec.Struct):
+    price: Optional[float] = None
+
+
+class _JupiterPrice(msgspec.Struct):
+    """Jupiter /price response; only the fields we read"""
+
+    data: _JupiterPriceData = msgspec.field(default_factory=_JupiterPriceData)
+
+
+class _CoinGeckoQuote(msgspec.Struct):
+    """One token entry of a CoinGecko /simple/price response"""
+
+    usd: float = 0.0
+    usd_24h_vol: float = 0.0
+
+
+# Typed decoders for the small, known schemas: unread fields are skipped
+# without allocating Python objects for them
+_jupiter_price_decoder = msgspec.json.Decoder(_JupiterPrice)
+_coingecko_quotes_decoder = msgspec.json.Decoder(Dict[str, _CoinGeckoQuote])
+
+
+# Lazy parser for large payloads where only a field or two is read. The
+# parsed document is only valid until the next parse, so callers must pull
+# their fields out before awaiting again.
+_parser = simdjson.Parser()
+
+
+async def _json_field(response: aiohttp.ClientResponse, pointer: str) -> Any:
+    """Parse a response lazily and return the value at a JSON pointer"""
+    raw = await response.read()
+    try:
+        return _parser.parse(raw).at_pointer(pointer)
+    except (KeyError, IndexError, TypeError, ValueError):
+        return None
+
+
+_backoff = wait_exponential_jitter(initial=1, max=30)
+
+
+def _wait_retry_after(retry_state: RetryCallState) -> float:
+    """Honour a 429's Retry-After header, else back off with jitter"""
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    if isinstance(exc, aiohttp.ClientResponseError) and exc.status == 429 and exc.headers:
+        try:
+            return min(float(exc.headers.get("Retry-After", "")), 30.0)
+        except ValueError:
+            pass
+    return _backoff(retry_state)
+
+
+_market_retry = retry(
+    stop=stop_after_attempt(3),
+    wait=_wait_retry_after,
+    retry=retry_if_exception_type(aiohttp.ClientError),
+    # Surface the last network error rather than a tenacity.RetryError
+    reraise=True,
+)
+
+
+def _rate_limited(response: aiohttp.ClientResponse) -> aiohttp.ClientResponseError:
+    return aiohttp.ClientResponseError(
+        response.request_info,
+        response.history,
+        status=response.status,
+        message="Rate limited",
+        headers=response.headers,
+    )
+
+
+# One session per event loop: both classes hit the same two hosts, so they
+# share a connection pool, DNS cache and TLS sessions. A session is bound to
+# the loop it was created in, so each new loop (asyncio.run, tests) gets its own
+_SESSIONS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """Get or create the market data session for the running loop"""
+    loop = asyncio.get_running_loop()
+    session = _SESSIONS.get(loop)
+    # No await between the check and the store, so no lock is needed
+    if session is None or session.closed:
+        session = _SESSIONS[loop] = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=10),
+            json_serialize=_json_dumps,
+            # Every request goes to one of two hosts (Jupiter, CoinGecko),
+            # so cap per-host fan-out and keep their DNS answers cached
+            connector=aiohttp.TCPConnector(
+                ssl=False,  # Disable SSL verification if needed
+                limit=50,
+                limit_per_host=20,
+                use_dns_cache=True,
+                ttl_dns_cache=600,
+                enable_cleanup_closed=True,
+                keepalive_timeout=75,
+            ),
+        )
+    return session
+
+
+async def close_session() -> None:
+    """Close the market data session of the running loop"""
+    session = _SESSIONS.pop(asyncio.get_running_loop(), None)
+    if session is not None and not session.closed:
+        await session.close()
+
 
 class MarketAnalyzer:
-    def __init__(self, data_sources: Optional[Dict[str, str]] = None):
-        self._session: Optional[aiohttp.ClientSession] = None
+    def __init__(
+        self,
+        data_sources: Optional[Dict[str, str]] = None,
+        redis_url: Optional[str] = None,
+    ):
         self.logger = logging.getLogger(__name__)
+        # Optional Redis cache in front of the price/volume endpoints
+        self.cache: Optional[redis.Redis] = redis.from_url(redis_url) if redis_url else None
+        self.price_ttl = 30
+        self.volume_ttl = 300
         self.coingecko_api = "https://api.coingecko.com/api/v3"
         self.jupiter_api_base = "https://quote-api.jup.ag/v6"
         self.data_sources = data_sources or {
@@ -22,14 +160,8 @@ class MarketAnalyzer:
 
     @property
     async def session(self) -> aiohttp.ClientSession:
-        """Get or create session"""
-        if self._session is None or self._session.closed:
-            timeout = aiohttp.ClientTimeout(total=10)
-            self._session = aiohttp.ClientSession(
-                timeout=timeout,
-                connector=aiohttp.TCPConnector(ssl=False)  # Disable SSL verification if needed
-            )
-        return self._session
+        """Get the shared session"""
+        return await get_session()
 
     async def initialize(self) -> None:
         """Initialize the market analyzer"""
@@ -64,11 +196,26 @@ class MarketAnalyzer:
             if not self.initialized:
                 raise RuntimeError("MarketAnalyzer not initialized")
 
-            market_data = {}
-            if "prices" in self.data_sources:
-                market_data["prices"] = await self.fetch_price("solana")
-            if "volume" in self.data_sources:
-                market_data["volume"] = await self.fetch_volume()
+            if (
+                self.data_sources.get("prices") == "coingecko"
+                and self.data_sources.get("volume") == "coingecko"
+            ):
+                # CoinGecko returns both in one simple/price call
+                quote = (await self.fetch_price_and_volume(["solana"])).get("solana")
+                success = quote is not None
+                market_data = {
+                    "prices": {"price": quote["price"] if success else 0.0, "success": success},
+                    "volume": {"volume": quote["volume"] if success else 0.0, "success": success},
+                }
+            else:
+                # Price and volume come from different hosts; fetch them concurrently
+                fetches = {}
+                if "prices" in self.data_sources:
+                    fetches["prices"] = self.fetch_price("solana")
+                if "volume" in self.data_sources:
+                    fetches["volume"] = self.fetch_volume()
+
+                market_data = dict(zip(fetches, await asyncio.gather(*fetches.values())))
             if "social" in self.data_sources:
                 market_data["social"] = self._fetch_social_sentiment()
 
@@ -77,11 +224,83 @@ class MarketAnalyzer:
             self.logger.error(f"Error getting market data: {e}")
             raise
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10)
-    )
+    async def _cached(
+        self, key: str, ttl: int, fetch: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """Serve a fetch from Redis when fresh, otherwise fetch and store it"""
+        if self.cache is None:
+            return await fetch()
+
+        try:
+            cached = await self.cache.get(key)
+            if cached is not None:
+                return orjson.loads(cached)
+        except redis.RedisError as e:
+            self.logger.warning(f"Market cache read failed for {key}: {e}")
+
+        result = await fetch()
+        if result.get("success"):
+            try:
+                await self.cache.set(key, orjson.dumps(result), ex=ttl)
+            except redis.RedisError as e:
+                self.logger.warning(f"Market cache write failed for {key}: {e}")
+        return result
+
     async def fetch_price(self, token: str) -> Dict[str, Any]:
+        """Fetch token price, served from cache when available"""
+        return await self._cached(
+            f"mkt:price:{token.lower()}", self.price_ttl, lambda: self._fetch_price(token)
+        )
+
+    async def fetch_volume(self) -> Dict[str, Any]:
+        """Fetch trading volume, served from cache when available"""
+        return await self._cached("mkt:volume:solana", self.volume_ttl, self._fetch_volume)
+
+    async def fetch_price_and_volume(self, tokens: List[str]) -> Dict[str, Dict[str, float]]:
+        """Fetch USD price and 24h volume for several tokens in one request"""
+        ids = ",".join(sorted(t.lower() for t in tokens))
+
+        async def fetch() -> Dict[str, Any]:
+            quotes = await self._fetch_price_and_volume(ids)
+            return {"quotes": quotes, "success": bool(quotes)}
+
+        result = await self._cached(f"mkt:simple:{ids}", self.price_ttl, fetch)
+        return result["quotes"]
+
+    @_market_retry
+    async def _fetch_price_and_volume(self, ids: str) -> Dict[str, Dict[str, float]]:
+        try:
+            session = await self.session
+            url = f"{self.coingecko_api}/simple/price"
+            params = {
+                "ids": ids,
+                "vs_currencies": "usd",
+                "include_24hr_vol": "true"
+            }
+
+            async with session.get(url, params=params) as response:
+                if response.status == 200:
+                    quotes = _coingecko_quotes_decoder.decode(await response.read())
+                    return {
+                        token: {"price": quote.usd, "volume": quote.usd_24h_vol}
+                        for token, quote in quotes.items()
+                    }
+                elif response.status == 429:
+                    self.logger.warning("Rate limit reached for CoinGecko API")
+                    raise _rate_limited(response)
+
+                self.logger.warning(f"Failed to fetch prices for {ids}: {response.status}")
+
+        except aiohttp.ClientError as e:
+            self.logger.error(f"Network error fetching prices for {ids}: {str(e)}")
+            raise
+        except Exception as e:
+            self.logger.error(f"Price/volume fetch error: {str(e)}")
+
+        return {}
+
+    @_market_retry
+    async def _fetch_price(self, token: str) -> Dict[str, Any]:
         """Fetch token price with retries"""
         try:
             session = await self.session
@@ -90,10 +309,10 @@ class MarketAnalyzer:
 
             async with session.get(url, params=params) as response:
                 if response.status == 200:
-                    data = await response.json()
-                    if isinstance(data.get('data', {}).get('price'), (int, float)):
+                    price = _jupiter_price_decoder.decode(await response.read()).data.price
+                    if price is not None:
                         return {
-                            "price": float(data['data']['price']),
+                            "price": price,
                             "success": True
                         }
                 elif response.status == 404:
@@ -101,7 +320,7 @@ class MarketAnalyzer:
                     return {"price": 0.0, "success": False}
                 elif response.status == 429:
                     self.logger.warning("Rate limit reached for Jupiter API")
-                    await asyncio.sleep(1)  # Add delay before retry
+                    raise _rate_limited(response)
 
                 self.logger.warning(f"Failed to fetch price for {token}: {response.status}")
 
@@ -114,11 +333,8 @@ class MarketAnalyzer:
 
         return {"price": 0.0, "success": False}
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10)
-    )
-    async def fetch_volume(self) -> Dict[str, Any]:
+    @_market_retry
+    async def _fetch_volume(self) -> Dict[str, Any]:
         """Fetch trading volume with validation"""
         try:
             session = await self.session
@@ -131,19 +347,19 @@ class MarketAnalyzer:
 
             async with session.get(url, params=params) as response:
                 if response.status == 200:
-                    data = await response.json()
-                    volume = data.get('solana', {}).get('usd_24h_vol', 0)
-
-                    if isinstance(volume, (int, float)):
+                    try:
+                        quotes = _coingecko_quotes_decoder.decode(await response.read())
+                    except msgspec.ValidationError as e:
+                        self.logger.error(f"Invalid volume data: {e}")
+                    else:
+                        quote = quotes.get("solana", _CoinGeckoQuote())
                         return {
-                            "volume": float(volume),
+                            "volume": quote.usd_24h_vol,
                             "success": True
                         }
-
-                    self.logger.error(f"Invalid volume data type: {type(volume)}")
                 elif response.status == 429:
                     self.logger.warning("Rate limit reached for CoinGecko API")
-                    await asyncio.sleep(1)  # Add delay before retry
+                    raise _rate_limited(response)
 
                 self.logger.warning(f"Failed to fetch volume: {response.status}")
 
@@ -157,8 +373,9 @@ class MarketAnalyzer:
 
     async def cleanup(self):
         """Cleanup resources"""
-        if self._session and not self._session.closed:
-            await self._session.close()
+        await close_session()
+        if self.cache is not None:
+            await self.cache.aclose()
 
     def _fetch_social_sentiment(self) -> Dict[str, Any]:
         """Fetch social sentiment data from the data source"""
@@ -177,14 +394,30 @@ import aiohttp
 import asyncio
 from typing import Dict, Any, Optional
 import logging
+import time
 from datetime import datetime
 
+# Timestamps are reported at one-second resolution, so responses within the
+# same second share one string instead of formatting a new one each time
+_last_ts_second = 0
+_last_ts_iso = ""
+
+
+def _now_iso() -> str:
+    global _last_ts_second, _last_ts_iso
+    second = int(time.time())
+    if second != _last_ts_second:
+        _last_ts_iso = datetime.fromtimestamp(second).isoformat()
+        _last_ts_second = second
+    return _last_ts_iso
+
+
 class MarketFetcher:
     """Handles all market data fetching with proper error handling"""
     
     def __init__(self):
-        self._session: Optional[aiohttp.ClientSession] = None
         self.logger = logging.getLogger(__name__)
+        self.timeout = aiohttp.ClientTimeout(total=30)
         
         # Correct SOL token addresses
         self.SOL_MINT = "So11111111111111111111111111111111111111112"
@@ -196,12 +429,7 @@ class MarketFetcher:
 
     @property
     async def session(self) -> aiohttp.ClientSession:
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=30),
-                connector=aiohttp.TCPConnector(ssl=False)
-            )
-        return self._session
+        return await get_session()
 
     async def fetch_price(self, token: str) -> Dict[str, Any]:
         """Fetch token price with proper error handling"""
@@ -218,21 +446,21 @@ class MarketFetcher:
             
             url = f"{self.JUPITER_API}/quote"
             
-            async with session.get(url, params=quote_params) as response:
+            async with session.get(url, params=quote_params, timeout=self.timeout) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = await _json(response)
                     if 'data' in data:
                         return {
                             'price': float(data['data']['outAmount']) / 1e9,
                             'success': True,
-                            'timestamp': datetime.now().isoformat()
+                            'timestamp': _now_iso()
                         }
                 
                 self.logger.error(f"Failed to fetch price: {response.status}")
                 return {
                     'price': 0.0,
                     'success': False,
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': _now_iso()
                 }
                 
         except Exception as e:
@@ -240,7 +468,7 @@ class MarketFetcher:
             return {
                 'price': 0.0,
                 'success': False,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': _now_iso()
             }
 
     async def fetch_volume(self) -> Dict[str, Any]:
@@ -249,12 +477,10 @@ class MarketFetcher:
             session = await self.session
             url = f"{self.COINGECKO_API}/coins/solana"
             
-            async with session.get(url) as response:
+            async with session.get(url, timeout=self.timeout) as response:
                 if response.status == 200:
-                    data = await response.json()
-                    
-                    # Extract volume with type checking
-                    volume = data.get('market_data', {}).get('total_volume', {}).get('usd', 0)
+                    # Only one scalar is read from this ~100 KB payload
+                    volume = await _json_field(response, "/market_data/total_volume/usd")
                     
                     if not isinstance(volume, (int, float)):
                         volume = float(volume) if volume else 0.0
@@ -262,13 +488,13 @@ class MarketFetcher:
                     return {
                         'volume': volume,
                         'success': True,
-                        'timestamp': datetime.now().isoformat()
+                        'timestamp': _now_iso()
                     }
                 
                 return {
                     'volume': 0.0,
                     'success': False,
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': _now_iso()
                 }
                 
         except Exception as e:
@@ -276,10 +502,9 @@ class MarketFetcher:
             return {
                 'volume': 0.0,
                 'success': False,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': _now_iso()
             }
 
     async def cleanup(self):
         """Cleanup resources"""
-        if self._session and not self._session.closed:
-            await self._session.close()
\ No newline at end of file
+        await close_session()
\ No newline at end of file
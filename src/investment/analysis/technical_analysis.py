@@ -1,10 +1,26 @@
 from dataclasses import dataclass
 import asyncio
+from collections import defaultdict, deque
 from datetime import datetime
-from typing import Dict, List
-import pandas as pd
+from typing import Deque, Dict, List, Tuple
 import numpy as np
 
+# (POSIX timestamp, overall score) rows of a token's sentiment history
+HISTORY_DTYPE = np.dtype([("t", "f8"), ("s", "f8")])
+
+_TIMEFRAME_SECONDS = {"m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+
+def _timeframe_seconds(timeframe: str) -> int:
+    """Bucket width in seconds for a timeframe such as 15m or 1d"""
+    count, unit = timeframe[:-1] or "1", timeframe[-1:]
+    if unit not in _TIMEFRAME_SECONDS or not count.isdigit() or int(count) == 0:
+        raise ValueError(
+            f"Invalid timeframe {timeframe!r}: expected <count><unit> with unit "
+            f"in {sorted(_TIMEFRAME_SECONDS)}"
+        )
+    return int(count) * _TIMEFRAME_SECONDS[unit]
+
 
 @dataclass
 class SentimentMetrics:
@@ -17,15 +33,21 @@ class SentimentMetrics:
 
 
 class SentimentAnalyzer:
-    def __init__(self):
+    def __init__(self, max_history: int = 10_000):
         self.nlp_model = self._load_nlp_model()
-        self.sentiment_history = pd.DataFrame()
+        # Per-token ring buffers: constant-time appends and no scan over
+        # other tokens' rows when computing trends
+        self.sentiment_history: Dict[str, Deque[Tuple[float, float]]] = defaultdict(
+            lambda: deque(maxlen=max_history)
+        )
 
     async def analyze_sentiment(self, token: str) -> SentimentMetrics:
-        social_metrics = await self._analyze_social_sentiment(token)
-        news_metrics = await self._analyze_news_sentiment(token)
-        market_metrics = await self._analyze_market_sentiment(token)
-        dev_metrics = await self._analyze_developer_sentiment(token)
+        social_metrics, news_metrics, market_metrics, dev_metrics = await asyncio.gather(
+            self._analyze_social_sentiment(token),
+            self._analyze_news_sentiment(token),
+            self._analyze_market_sentiment(token),
+            self._analyze_developer_sentiment(token),
+        )
 
         overall_score = self._calculate_overall_sentiment(
             social_metrics, news_metrics, market_metrics, dev_metrics
@@ -44,18 +66,19 @@ class SentimentAnalyzer:
         return metrics
 
     async def _analyze_social_sentiment(self, token: str) -> Dict:
-        twitter_sentiment = await self._analyze_twitter(token)
-        discord_sentiment = await self._analyze_discord(token)
-        telegram_sentiment = await self._analyze_telegram(token)
+        twitter_sentiment, discord_sentiment, telegram_sentiment = await asyncio.gather(
+            self._analyze_twitter(token),
+            self._analyze_discord(token),
+            self._analyze_telegram(token),
+        )
 
         return {
-            "score": np.mean(
-                [
-                    twitter_sentiment["score"],
-                    discord_sentiment["score"],
-                    telegram_sentiment["score"],
-                ]
-            ),
+            "score": (
+                twitter_sentiment["score"]
+                + discord_sentiment["score"]
+                + telegram_sentiment["score"]
+            )
+            / 3.0,
             "metrics": {
                 "twitter": twitter_sentiment,
                 "discord": discord_sentiment,
@@ -63,8 +86,15 @@ class SentimentAnalyzer:
             },
         }
 
+    async def _store_sentiment_history(self, token: str, metrics: SentimentMetrics):
+        self.sentiment_history[token].append(
+            (metrics.timestamp.timestamp(), metrics.overall_score)
+        )
+
     async def analyze_sentiment_trends(self, token: str, timeframe: str) -> Dict:
-        history = self.sentiment_history[self.sentiment_history["token"] == token]
+        history = np.fromiter(
+            self.sentiment_history.get(token, ()), dtype=HISTORY_DTYPE
+        )
         history = self._resample_history(history, timeframe)
 
         trends = {
@@ -80,6 +110,74 @@ class SentimentAnalyzer:
 
         return trends
 
+    def _resample_history(self, history: np.ndarray, timeframe: str) -> np.ndarray:
+        """Mean score per timeframe bucket (e.g. "15m", "4h", "1d", "1w")"""
+        width = _timeframe_seconds(timeframe)
+        if history.size == 0:
+            return history
+        buckets, inverse = np.unique(history["t"] // width, return_inverse=True)
+        resampled = np.empty(buckets.size, dtype=HISTORY_DTYPE)
+        resampled["t"] = buckets * width
+        resampled["s"] = np.bincount(inverse, weights=history["s"]) / np.bincount(
+            inverse
+        )
+        return resampled
+
+    def _calculate_sentiment_change(self, history: np.ndarray) -> float:
+        if history.size < 2:
+            return 0.0
+        return float(history["s"][-1] - history["s"][0])
+
+    def _calculate_sentiment_volatility(self, history: np.ndarray) -> float:
+        if history.size < 2:
+            return 0.0
+        return float(history["s"].std(ddof=1))
+
+    def _calculate_sentiment_momentum(
+        self, history: np.ndarray, window: int = 5
+    ) -> float:
+        """Average score change over the last window buckets"""
+        if history.size < 2:
+            return 0.0
+        return float(np.diff(history["s"][-(window + 1):]).mean())
+
+    def _identify_sentiment_extremes(self, history: np.ndarray) -> Dict:
+        if history.size == 0:
+            return {}
+        high = history[history["s"].argmax()]
+        low = history[history["s"].argmin()]
+        return {
+            "max": {
+                "timestamp": datetime.fromtimestamp(high["t"]),
+                "score": float(high["s"]),
+            },
+            "min": {
+                "timestamp": datetime.fromtimestamp(low["t"]),
+                "score": float(low["s"]),
+            },
+        }
+
+    def _detect_sentiment_anomalies(
+        self, history: np.ndarray, threshold: float = 3.0
+    ) -> List[Dict]:
+        """Buckets whose score is more than threshold std devs from the mean"""
+        if history.size < 2:
+            return []
+        scores = history["s"]
+        std = scores.std(ddof=1)
+        if std == 0:
+            return []
+        z = (scores - scores.mean()) / std
+        outliers = np.abs(z) > threshold
+        return [
+            {
+                "timestamp": datetime.fromtimestamp(row["t"]),
+                "score": float(row["s"]),
+                "z_score": float(z_i),
+            }
+            for row, z_i in zip(history[outliers], z[outliers])
+        ]
+
     async def generate_sentiment_report(self, token: str) -> Dict:
         current_sentiment = await self.analyze_sentiment(token)
         trends = await self.analyze_sentiment_trends(token, "1d")
@@ -17,6 +17,7 @@ class PortfolioAllocator:
         self.strategy = strategy
         self.current_allocations = {}
         self.historical_allocations = pd.DataFrame()
+        self.assets: List[str] = []
 
     async def optimize_allocation(
         self, market_data: pd.DataFrame, risk_metrics: Dict
@@ -39,12 +40,25 @@ class PortfolioAllocator:
             )
         return {}
 
-    def _calculate_returns(self, market_data: pd.DataFrame) -> pd.DataFrame:
-        return market_data.pct_change().dropna()
+    def _calculate_returns(self, market_data: pd.DataFrame) -> np.ndarray:
+        # Simple returns on a plain float64 array; columns follow self.assets
+        self.assets = list(market_data.columns)
+        prices = market_data.to_numpy(dtype=np.float64)
+        returns = prices[1:] / prices[:-1] - 1
+        return returns[~np.isnan(returns).any(axis=1)]
 
-    def _calculate_risks(self, returns: pd.DataFrame) -> Dict[str, float]:
+    def _calculate_risks(self, returns: np.ndarray) -> Dict[str, np.ndarray]:
         return {
-            "volatility": returns.std(),
-            "var": self._calculate_var(returns),
-            "correlation": returns.corr(),
+            "volatility": returns.std(axis=0, ddof=1),
+            "var": np.quantile(returns, 0.05, axis=0),
+            "correlation": np.corrcoef(returns, rowvar=False),
+        }
+
+    def _calculate_weights(
+        self, positions: Dict[str, float], prices: Dict[str, float]
+    ) -> Dict[str, float]:
+        values = {token: amount * prices[token] for token, amount in positions.items()}
+        total = sum(values.values())
+        return {
+            token: (value / total if total else 0.0) for token, value in values.items()
         }
@@ -1,20 +1,74 @@
 import pandas as pd
 import numpy as np
-from typing import Dict
+from numba import njit
+from typing import Dict, List
+
+
+@njit(cache=True)
+def _drawdowns(returns: np.ndarray) -> np.ndarray:
+    """Drawdown series in one pass: compound, track the running peak, compare.
+
+    Like pandas cumprod/expanding().max(), a NaN return yields NaN at that
+    position and is skipped rather than poisoning every later value.
+    """
+    out = np.empty_like(returns)
+    cumulative = 1.0
+    peak = -np.inf
+    for i in range(returns.shape[0]):
+        if np.isnan(returns[i]):
+            out[i] = np.nan
+            continue
+        cumulative *= 1.0 + returns[i]
+        if cumulative > peak:
+            peak = cumulative
+        out[i] = cumulative / peak - 1.0
+    return out
+
+
+def calculate_portfolio_value(
+    positions: Dict[str, float], prices: Dict[str, float]
+) -> float:
+    """Mark-to-market value: dot product of position sizes and their prices"""
+    tokens = list(positions)
+    position_vec = np.fromiter(
+        (positions[t] for t in tokens), dtype=np.float64, count=len(tokens)
+    )
+    price_vec = np.fromiter(
+        (prices[t] for t in tokens), dtype=np.float64, count=len(tokens)
+    )
+    return float(position_vec @ price_vec)
 
 
 class PortfolioPerformance:
-    def __init__(self):
-        self.performance_history = pd.DataFrame()
+    def __init__(self, history_batch_size: int = 1024):
+        # Metrics are buffered as dicts and concatenated in batches, since
+        # appending to a DataFrame copies the whole frame on every tick
+        self._history_frame = pd.DataFrame()
+        self._history_buffer: List[Dict] = []
+        self.history_batch_size = history_batch_size
         self.metrics = {}
 
+    @property
+    def performance_history(self) -> pd.DataFrame:
+        self._flush_history()
+        return self._history_frame
+
+    def _flush_history(self):
+        if not self._history_buffer:
+            return
+        self._history_frame = pd.concat(
+            [self._history_frame, pd.DataFrame(self._history_buffer)],
+            ignore_index=True,
+        )
+        self._history_buffer.clear()
+
     async def calculate_performance(
         self,
         positions: Dict[str, float],
         prices: Dict[str, float],
         benchmark: str = "SOL",
     ) -> Dict:
-        portfolio_value = self._calculate_portfolio_value(positions, prices)
+        portfolio_value = calculate_portfolio_value(positions, prices)
         returns = self._calculate_returns(portfolio_value)
         benchmark_returns = await self._get_benchmark_returns(benchmark)
 
@@ -28,9 +82,9 @@ class PortfolioPerformance:
             "volatility": self._calculate_volatility(returns),
         }
         self.metrics = metrics
-        self.performance_history = self.performance_history.append(
-            metrics, ignore_index=True
-        )
+        self._history_buffer.append(metrics)
+        if len(self._history_buffer) >= self.history_batch_size:
+            self._flush_history()
         return metrics
 
     async def analyze_attribution(
@@ -47,11 +101,6 @@ class PortfolioPerformance:
             ),
         }
 
-    def _calculate_portfolio_value(
-        self, positions: Dict[str, float], prices: Dict[str, float]
-    ) -> float:
-        return sum(positions[token] * prices[token] for token in positions)
-
     def _calculate_sharpe_ratio(
         self, returns: float, risk_free_rate: float = 0.01
     ) -> float:
@@ -60,14 +109,12 @@ class PortfolioPerformance:
         return np.mean(excess_returns) / np.std(excess_returns)
 
     def _calculate_drawdown(self, returns: pd.Series) -> Dict:
-        cum_returns = (1 + returns).cumprod()
-        rolling_max = cum_returns.expanding(min_periods=1).max()
-        drawdowns = cum_returns / rolling_max - 1
+        drawdowns = _drawdowns(returns.to_numpy(dtype=np.float64))
 
         return {
-            "max_drawdown": drawdowns.min(),
-            "current_drawdown": drawdowns.iloc[-1],
-            "avg_drawdown": drawdowns.mean(),
+            "max_drawdown": np.nanmin(drawdowns),
+            "current_drawdown": drawdowns[-1],
+            "avg_drawdown": np.nanmean(drawdowns),
         }
 
     async def generate_performance_report(self, timeframe: str = "1M") -> Dict:
@@ -85,9 +132,12 @@ class PortfolioPerformance:
 
     def _calculate_returns(self, portfolio_value: float) -> float:
         # Calculate the returns of the portfolio
-        if self.performance_history.empty:
+        if self._history_buffer:
+            previous_value = self._history_buffer[-1]["portfolio_value"]
+        elif not self._history_frame.empty:
+            previous_value = self._history_frame.iloc[-1]["portfolio_value"]
+        else:
             return 0.0
-        previous_value = self.performance_history.iloc[-1]["portfolio_value"]
         return (portfolio_value - previous_value) / previous_value
 
     async def _get_benchmark_returns(self, benchmark: str) -> float:
@@ -100,8 +150,16 @@ class PortfolioPerformance:
         return returns - benchmark_returns
 
     def _calculate_beta(self, returns: float, benchmark_returns: float) -> float:
-        # Calculate beta
-        return np.cov(returns, benchmark_returns)[0, 1] / np.var(benchmark_returns)
+        # Calculate beta as cov(r, b) / var(b) from centred series, without
+        # building the full covariance matrix
+        r = np.atleast_1d(np.asarray(returns, dtype=np.float64))
+        b = np.atleast_1d(np.asarray(benchmark_returns, dtype=np.float64))
+        r = r - r.mean()
+        b = b - b.mean()
+        benchmark_var = np.einsum("i,i->", b, b)
+        if benchmark_var == 0:
+            return 0.0
+        return float(np.einsum("i,i->", r, b) / benchmark_var)
 
     def _calculate_volatility(self, returns: float) -> float:
         # Calculate volatility
@@ -3,6 +3,8 @@ from typing import Dict, List, Optional
 import pandas as pd
 import numpy as np
 
+from .performance import calculate_portfolio_value
+
 
 @dataclass
 class RebalanceConfig:
@@ -16,26 +18,43 @@ class PortfolioRebalancer:
     def __init__(self, config: RebalanceConfig):
         self.config = config
         self.rebalance_history = pd.DataFrame()
+        # Target weights as an aligned vector for the per-tick drift check
+        self._target_tokens = list(config.target_weights)
+        self._target_vec = np.array(
+            [config.target_weights[t] for t in self._target_tokens], dtype=np.float64
+        )
 
-    async def check_rebalance_needed(self, current_positions: Dict) -> bool:
-        current_weights = self._calculate_weights(current_positions)
-        max_drift = max(
-            abs(current_weights[token] - self.config.target_weights[token])
-            for token in current_weights
+    async def check_rebalance_needed(
+        self, current_positions: Dict, market_prices: Dict
+    ) -> bool:
+        current_weights = self._calculate_weights(current_positions, market_prices)
+        current_vec = np.fromiter(
+            (current_weights.get(t, 0.0) for t in self._target_tokens),
+            dtype=np.float64,
+            count=len(self._target_tokens),
         )
+        max_drift = float(np.abs(current_vec - self._target_vec).max(initial=0.0))
+
+        # Holdings with no target drift by their whole weight
+        for token, weight in current_weights.items():
+            if token not in self.config.target_weights and weight > max_drift:
+                max_drift = weight
+
         return max_drift > self.config.threshold
 
     async def generate_rebalance_trades(
         self, current_positions: Dict, market_prices: Dict
     ) -> List[Dict]:
         trades = []
-        current_weights = self._calculate_weights(current_positions)
+        current_weights = self._calculate_weights(current_positions, market_prices)
+        # Invariant across the loop, so value the portfolio once
+        portfolio_value = calculate_portfolio_value(current_positions, market_prices)
 
         for token, target in self.config.target_weights.items():
             current = current_weights.get(token, 0)
             if abs(current - target) > self.config.threshold:
                 trade = self._calculate_trade(
-                    token, current, target, current_positions, market_prices
+                    token, current, target, portfolio_value, market_prices
                 )
                 if trade:
                     trades.append(trade)
@@ -47,11 +66,9 @@ class PortfolioRebalancer:
         token: str,
         current_weight: float,
         target_weight: float,
-        positions: Dict,
+        portfolio_value: float,
         prices: Dict,
     ) -> Optional[Dict]:
-        portfolio_value = sum(positions[t] * prices[t] for t in positions)
-
         target_value = portfolio_value * target_weight
         current_value = portfolio_value * current_weight
         trade_value = target_value - current_value
@@ -65,3 +82,11 @@ class PortfolioRebalancer:
             "amount": abs(trade_value) / prices[token],
             "estimated_price": prices[token],
         }
+
+    def _calculate_weights(self, positions: Dict, prices: Dict) -> Dict[str, float]:
+        # Value weights, so they line up with portfolio_value in _calculate_trade
+        values = {token: amount * prices[token] for token, amount in positions.items()}
+        total = sum(values.values())
+        return {
+            token: (value / total if total else 0.0) for token, value in values.items()
+        }
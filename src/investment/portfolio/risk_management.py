@@ -1,6 +1,36 @@
-from typing import Dict, List
+from typing import Awaitable, Callable, Dict, List, Tuple
+import asyncio
+import math
 import pandas as pd
 import numpy as np
+from cachetools import TTLCache
+from numba import njit
+
+# Daily -> annual volatility (crypto trades every day)
+_ANNUALIZE = math.sqrt(365)
+
+
+@njit(cache=True)
+def _portfolio_stats(returns: np.ndarray, confidence: float):
+    """Annualized volatility, VaR and expected shortfall in one walk of the data"""
+    n = returns.shape[0]
+    if n == 0:
+        return np.nan, np.nan, np.nan
+    tail = np.empty(n)
+    mean = 0.0
+    m2 = 0.0
+    for i in range(n):
+        x = returns[i]
+        tail[i] = x
+        # Welford's update keeps the variance stable without a second pass
+        delta = x - mean
+        mean += delta / (i + 1)
+        m2 += delta * (x - mean)
+
+    std = math.sqrt(m2 / (n - 1)) if n > 1 else np.nan
+    k = min(int((1 - confidence) * n), n - 1)
+    tail = np.partition(tail, k)
+    return std * _ANNUALIZE, tail[k], tail[: k + 1].mean()
 
 
 class RiskManager:
@@ -9,6 +39,14 @@ class RiskManager:
         self.risk_metrics = {}
         self.violations = []
 
+        # Volatility/correlation reads repeat within a polling window, so
+        # keep them for a few seconds; per-token locks stop concurrent
+        # misses from fetching the same token twice
+        ttl = risk_limits.get("vol_ttl", 5)
+        self._vol_cache = TTLCache(maxsize=512, ttl=ttl)
+        self._corr_cache = TTLCache(maxsize=512, ttl=ttl)
+        self._lookup_locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+
     async def check_portfolio_risk(
         self, positions: Dict, market_data: pd.DataFrame
     ) -> Dict:
@@ -34,27 +72,84 @@ class RiskManager:
             "take_profit": self._calculate_take_profit(volatility),
         }
 
+    async def _get_volatility(self, token: str) -> float:
+        return await self._cached_lookup(
+            "volatility", self._vol_cache, token, self._fetch_volatility
+        )
+
+    async def _get_correlation(self, token: str) -> float:
+        return await self._cached_lookup(
+            "correlation", self._corr_cache, token, self._fetch_correlation
+        )
+
+    async def _cached_lookup(
+        self,
+        kind: str,
+        cache: TTLCache,
+        token: str,
+        fetch: Callable[[str], Awaitable[float]],
+    ) -> float:
+        if token in cache:
+            return cache[token]
+
+        key = (kind, token)
+        lock = self._lookup_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another caller may have filled it while we waited
+            if token in cache:
+                return cache[token]
+            try:
+                value = await fetch(token)
+                cache[token] = value
+                return value
+            finally:
+                # Only needed while the fetch is in flight; callers already
+                # queued keep their reference and will find the cache filled
+                if self._lookup_locks.get(key) is lock:
+                    del self._lookup_locks[key]
+
     async def _calculate_risk_metrics(
         self, positions: Dict, market_data: pd.DataFrame
     ) -> Dict:
-        returns = market_data.pct_change().dropna()
-        weighted_returns = self._calculate_weighted_returns(returns, positions)
+        # The return statistics are pure NumPy work; run them in a thread so
+        # the liquidity lookup's I/O overlaps with them
+        market_risk, liquidity = await asyncio.gather(
+            asyncio.to_thread(self._calculate_market_risk, positions, market_data),
+            self._calculate_liquidity_risk(positions),
+        )
 
         return {
-            "volatility": self._calculate_portfolio_volatility(weighted_returns),
-            "var": self._calculate_value_at_risk(weighted_returns),
-            "expected_shortfall": self._calculate_expected_shortfall(weighted_returns),
+            **market_risk,
             "concentration": self._calculate_concentration_risk(positions),
-            "liquidity": await self._calculate_liquidity_risk(positions),
+            "liquidity": liquidity,
         }
 
-    def _calculate_portfolio_volatility(self, weighted_returns: pd.Series) -> float:
-        return weighted_returns.std() * np.sqrt(365)
+    def _calculate_market_risk(
+        self, positions: Dict, market_data: pd.DataFrame
+    ) -> Dict:
+        returns = market_data.pct_change().dropna()
+        weighted_returns = self._calculate_weighted_returns(returns, positions)
+
+        volatility, var, expected_shortfall = _portfolio_stats(
+            np.asarray(weighted_returns, dtype=np.float64), 0.95
+        )
 
-    def _calculate_value_at_risk(
-        self, weighted_returns: pd.Series, confidence: float = 0.95
-    ) -> float:
-        return np.percentile(weighted_returns, (1 - confidence) * 100)
+        return {
+            "volatility": volatility,
+            "var": var,
+            "expected_shortfall": expected_shortfall,
+        }
+
+    def _calculate_weighted_returns(
+        self, returns: pd.DataFrame, positions: Dict
+    ) -> np.ndarray:
+        # One BLAS matrix-vector product; tokens without a position weigh 0
+        weights = np.fromiter(
+            (positions.get(token, {}).get("weight", 0.0) for token in returns.columns),
+            dtype=np.float64,
+            count=len(returns.columns),
+        )
+        return returns.to_numpy(dtype=np.float64) @ weights
 
     async def generate_risk_report(self) -> Dict:
         return {
@@ -1,12 +1,15 @@
 # entry_exit.py
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional
+import asyncio
+import time
 import pandas as pd
 import numpy as np
 from datetime import datetime
 
 
-@dataclass
+# slots=True (Python 3.10+): signals are created in batches, skip the per-instance __dict__
+@dataclass(slots=True)
 class Signal:
     token: str
     type: str  # entry, exit
@@ -16,6 +19,20 @@ class Signal:
     confidence: float
     timestamp: datetime
     indicators: Dict[str, float]
+    # Monotonic creation time, used for expiry instead of wall-clock math
+    created_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass(slots=True)
+class SignalBatch:
+    """Column-wise view of raw signals; rows become Signal objects only on output"""
+
+    rows: List[Dict]
+    strengths: np.ndarray
+    confidences: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.rows)
 
 
 class EntryExitStrategy:
@@ -24,11 +41,23 @@ class EntryExitStrategy:
         self.signals: List[Signal] = []
         self.active_positions = {}
         self.trade_history = pd.DataFrame()
+        self.min_confidence = config["min_confidence"]
+        self.signal_timeout = config["signal_timeout"]
+
+        # Source -> weight as an index table, so combining a batch of
+        # signals is one vectorized multiply
+        sources = list(config["signal_weights"])
+        self._source_idx = {source: i for i, source in enumerate(sources)}
+        self._weight_lookup = np.array(
+            [config["signal_weights"][source] for source in sources], dtype=np.float64
+        )
 
     async def generate_signals(self, market_data: pd.DataFrame) -> List[Signal]:
-        technical_signals = await self._analyze_technical_indicators(market_data)
-        sentiment_signals = await self._analyze_sentiment_indicators(market_data)
-        onchain_signals = await self._analyze_onchain_indicators(market_data)
+        technical_signals, sentiment_signals, onchain_signals = await asyncio.gather(
+            self._analyze_technical_indicators(market_data),
+            self._analyze_sentiment_indicators(market_data),
+            self._analyze_onchain_indicators(market_data),
+        )
 
         combined_signals = self._combine_signals(
             technical_signals, sentiment_signals, onchain_signals
@@ -37,11 +66,13 @@ class EntryExitStrategy:
         return self._filter_signals(combined_signals)
 
     async def validate_signal(self, signal: Signal) -> bool:
-        risk_check = await self._check_risk_parameters(signal)
-        market_check = await self._check_market_conditions(signal)
-        portfolio_check = await self._check_portfolio_constraints(signal)
+        checks = await asyncio.gather(
+            self._check_risk_parameters(signal),
+            self._check_market_conditions(signal),
+            self._check_portfolio_constraints(signal),
+        )
 
-        return all([risk_check, market_check, portfolio_check])
+        return all(checks)
 
     async def execute_signal(self, signal: Signal) -> Dict:
         if not await self.validate_signal(signal):
@@ -127,43 +158,57 @@ class EntryExitStrategy:
 
         return signals
 
-    def _combine_signals(self, *signal_lists) -> List[Signal]:
+    def _combine_signals(self, *signal_lists) -> SignalBatch:
         all_signals = []
         for signals in signal_lists:
             all_signals.extend(signals)
 
         return self._weight_and_combine_signals(all_signals)
 
-    def _weight_and_combine_signals(self, signals: List[Dict]) -> List[Signal]:
-        weighted_signals = []
-        for signal in signals:
-            weight = self.config["signal_weights"][signal["source"]]
-            confidence = signal["strength"] * weight
-
-            if confidence >= self.config["min_confidence"]:
-                weighted_signals.append(
-                    Signal(
-                        token=signal.get("token"),
-                        type=signal["type"],
-                        action=signal["action"],
-                        strength=signal["strength"],
-                        price=signal.get("price", 0),
-                        confidence=confidence,
-                        timestamp=datetime.now(),
-                        indicators=signal.get("indicators", {}),
-                    )
+    def _weight_and_combine_signals(self, signals: List[Dict]) -> SignalBatch:
+        count = len(signals)
+        strengths = np.fromiter(
+            (s["strength"] for s in signals), dtype=np.float64, count=count
+        )
+        source_idx = np.fromiter(
+            (self._source_idx[s["source"]] for s in signals), dtype=np.intp, count=count
+        )
+        confidences = strengths * self._weight_lookup[source_idx]
+
+        return SignalBatch(rows=signals, strengths=strengths, confidences=confidences)
+
+    def _filter_signals(self, batch: SignalBatch) -> List[Signal]:
+        confidences = batch.confidences
+        keep = np.flatnonzero(confidences >= self.min_confidence)
+        # Highest confidence first; stable so ties keep arrival order
+        keep = keep[np.argsort(-confidences[keep], kind="stable")]
+
+        # One clock read per batch is fresh enough
+        now = datetime.now()
+        created_at = time.monotonic()
+        filtered = []
+        for i in keep:
+            signal = batch.rows[i]
+            filtered.append(
+                Signal(
+                    token=signal.get("token"),
+                    type=signal["type"],
+                    action=signal["action"],
+                    strength=signal["strength"],
+                    price=signal.get("price", 0),
+                    confidence=float(confidences[i]),
+                    timestamp=now,
+                    indicators=signal.get("indicators", {}),
+                    created_at=created_at,
                 )
+            )
 
-        return weighted_signals
+        return filtered
 
     async def _execute_trade(self, params: Dict) -> Dict:
         # Implement trade execution using Jupiter/Orca
         pass
 
     async def get_active_signals(self) -> List[Signal]:
-        return [
-            signal
-            for signal in self.signals
-            if (datetime.now() - signal.timestamp).seconds
-            < self.config["signal_timeout"]
-        ]
+        cutoff = time.monotonic() - self.signal_timeout
+        return [signal for signal in self.signals if signal.created_at > cutoff]
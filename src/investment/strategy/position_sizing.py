@@ -3,7 +3,7 @@ from typing import Dict, Optional
 import numpy as np
 
 
-@dataclass
+@dataclass(slots=True)
 class PositionSize:
     token: str
     size: float
@@ -19,6 +19,7 @@ class PositionSizer:
         self.portfolio_value = 0
         self.risk_per_trade = config["risk_per_trade"]
         self.max_position_size = config["max_position_size"]
+        self.reward_risk_ratio = config["reward_risk_ratio"]
 
     async def calculate_position_size(
         self, token: str, entry_price: float, stop_loss: float
@@ -47,4 +48,4 @@ class PositionSizer:
 
     def _calculate_take_profit(self, entry: float, stop: float) -> float:
         risk = abs(entry - stop)
-        return entry + (risk * self.config["reward_risk_ratio"])
+        return entry + (risk * self.reward_risk_ratio)
@@ -1,10 +1,83 @@
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Callable, Dict, List
 from datetime import datetime
+from operator import itemgetter
+import numpy as np
 import pandas as pd
-
-
-@dataclass
+from numba import njit
+
+
+@njit(cache=True)
+def _wilder_mean(values: np.ndarray, period: int) -> np.ndarray:
+    """Wilder smoothing of values[1:], seeded by the simple mean of the first period
+
+    NaNs are skipped like pandas ewm(adjust=False, ignore_na=False): the
+    average carries over a gap while its weight keeps decaying.
+    """
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    if n <= period:
+        return out
+
+    total = 0.0
+    count = 0
+    for i in range(1, period + 1):
+        if values[i] == values[i]:
+            total += values[i]
+            count += 1
+    avg = total / count if count else np.nan
+    out[period] = avg
+
+    alpha = 1.0 / period
+    old_wt = 1.0
+    for i in range(period + 1, n):
+        value = values[i]
+        if avg != avg:
+            if value == value:
+                avg = value
+                old_wt = 1.0
+        else:
+            old_wt *= 1.0 - alpha
+            if value == value:
+                avg = (old_wt * avg + alpha * value) / (old_wt + alpha)
+                old_wt = 1.0
+        out[i] = avg
+    return out
+
+
+@njit(cache=True)
+def _ema(values: np.ndarray, span: int) -> np.ndarray:
+    """Exponential moving average matching pandas ewm(span=span, adjust=True)
+
+    NaNs are skipped with ignore_na=False semantics: they add no weight but
+    the older observations keep decaying across the gap.
+    """
+    decay = 1.0 - 2.0 / (span + 1.0)
+    out = np.empty_like(values)
+    num = 0.0
+    den = 0.0
+    for i in range(values.shape[0]):
+        num *= decay
+        den *= decay
+        if values[i] == values[i]:
+            num += values[i]
+            den += 1.0
+        out[i] = num / den if den > 0.0 else np.nan
+    return out
+
+
+def _rsi(close: np.ndarray, period: int = 14) -> np.ndarray:
+    """Wilder RSI of a close array; NaN until period deltas are available"""
+    delta = np.diff(close, prepend=close[:1])
+    # Written so a NaN delta stays NaN and the smoothing skips the gap
+    avg_gain = _wilder_mean(np.where(delta < 0, 0.0, delta), period)
+    avg_loss = _wilder_mean(np.where(delta > 0, 0.0, -delta), period)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return 100 - 100 / (1 + avg_gain / avg_loss)
+
+
+@dataclass(slots=True)
 class SignalParams:
     timeframe: str
     indicators: List[str]
@@ -20,9 +93,12 @@ class SignalGenerator:
 
     async def generate_signals(self, market_data: pd.DataFrame) -> List[Dict]:
         indicator_signals = {}
+        # Pull the close column out once; every indicator works on the raw array
+        close = market_data["close"].to_numpy(dtype=np.float64)
+        index = market_data.index
 
-        for indicator in self.params.indicators:
-            values = await self._calculate_indicator(indicator, market_data)
+        for indicator, calculate in self.indicators.items():
+            values = calculate(close, index)
             signals = self._evaluate_indicator(indicator, values)
             indicator_signals[indicator] = signals
 
@@ -31,33 +107,60 @@ class SignalGenerator:
 
         return filtered_signals
 
-    async def _calculate_indicator(
-        self, indicator: str, data: pd.DataFrame
+    def _initialize_indicators(self) -> Dict[str, Callable]:
+        """Resolve the configured indicators to their calculators once"""
+        calculators = {
+            "rsi": self._calculate_rsi,
+            "macd": self._calculate_macd,
+            "bollinger": self._calculate_bollinger_bands,
+        }
+        unknown = set(self.params.indicators) - calculators.keys()
+        if unknown:
+            raise ValueError(f"Unsupported indicators: {sorted(unknown)}")
+
+        return {name: calculators[name] for name in self.params.indicators}
+
+    def _calculate_rsi(
+        self, close: np.ndarray, index: pd.Index, period: int = 14
     ) -> pd.Series:
-        if indicator == "rsi":
-            return self._calculate_rsi(data)
-        elif indicator == "macd":
-            return self._calculate_macd(data)
-        elif indicator == "bollinger":
-            return self._calculate_bollinger_bands(data)
-
-    def _calculate_rsi(self, data: pd.DataFrame, period: int = 14) -> pd.Series:
-        delta = data["close"].diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-
-        rs = gain / loss
-        return 100 - (100 / (1 + rs))
+        return pd.Series(_rsi(close, period), index=index)
 
     def _calculate_macd(
-        self, data: pd.DataFrame, fast: int = 12, slow: int = 26, signal: int = 9
+        self,
+        close: np.ndarray,
+        index: pd.Index,
+        fast: int = 12,
+        slow: int = 26,
+        signal: int = 9,
     ) -> Dict[str, pd.Series]:
-        exp1 = data["close"].ewm(span=fast).mean()
-        exp2 = data["close"].ewm(span=slow).mean()
-        macd = exp1 - exp2
-        signal_line = macd.ewm(span=signal).mean()
-
-        return {"macd": macd, "signal": signal_line, "histogram": macd - signal_line}
+        macd = _ema(close, fast) - _ema(close, slow)
+        signal_line = _ema(macd, signal)
+
+        return {
+            "macd": pd.Series(macd, index=index),
+            "signal": pd.Series(signal_line, index=index),
+            "histogram": pd.Series(macd - signal_line, index=index),
+        }
+
+    def _calculate_bollinger_bands(
+        self,
+        close: np.ndarray,
+        index: pd.Index,
+        period: int = 20,
+        num_std: float = 2.0,
+    ) -> Dict[str, pd.Series]:
+        middle = np.full(close.shape[0], np.nan)
+        width = np.full(close.shape[0], np.nan)
+        if close.shape[0] >= period:
+            windows = np.lib.stride_tricks.sliding_window_view(close, period)
+            middle[period - 1 :] = windows.mean(axis=1)
+            width[period - 1 :] = num_std * windows.std(axis=1, ddof=1)
+
+        return {
+            "upper": pd.Series(middle + width, index=index),
+            "middle": pd.Series(middle, index=index),
+            "lower": pd.Series(middle - width, index=index),
+        }
 
     def _evaluate_indicator(self, indicator: str, values: pd.Series) -> List[Dict]:
         threshold = self.params.thresholds[indicator]
@@ -84,11 +187,7 @@ class SignalGenerator:
         return combined
 
     def _filter_signals(self, signals: List[Dict]) -> List[Dict]:
-        filtered = []
         min_strength = self.params.thresholds["min_signal_strength"]
+        filtered = [signal for signal in signals if signal["strength"] >= min_strength]
 
-        for signal in signals:
-            if signal["strength"] >= min_strength:
-                filtered.append(signal)
-
-        return sorted(filtered, key=lambda x: x["strength"], reverse=True)
+        return sorted(filtered, key=itemgetter("strength"), reverse=True)
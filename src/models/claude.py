@@ -1,10 +1,44 @@
-from anthropic import Anthropic
-from typing import Dict, List, Optional, Any, Union
+from anthropic import AsyncAnthropic
+from typing import AsyncIterator, Deque, Dict, List, Optional, Any, Union
+from collections import deque
+import asyncio
 import logging
-import json
+import orjson
+import httpx
+from tenacity import retry, stop_after_attempt, wait_exponential
 
 logger = logging.getLogger(__name__)
 
+# Fixed prompt text around the per-call payload
+_SENTIMENT_PROMPT_HEAD = (
+    "Analyze the sentiment of the following text and provide a score "
+    "from -1.0 (very negative) to 1.0 (very positive). "
+    "Also provide a label (positive/negative/neutral).\n\n"
+    "Text: "
+)
+_SENTIMENT_PROMPT_TAIL = (
+    "\n\n"
+    "Respond in JSON format:\n"
+    "{\n"
+    '    "score": float,\n'
+    '    "label": string\n'
+    "}"
+)
+
+_MARKET_PROMPT_HEAD = (
+    "Analyze the following market conditions and provide insights:\n\n"
+    "Context: "
+)
+_MARKET_PROMPT_TAIL = (
+    "\n\n"
+    "Provide:\n"
+    "1. Overall market sentiment\n"
+    "2. Key trends\n"
+    "3. Risk assessment\n"
+    "4. Recommendations\n\n"
+    "Respond in JSON format."
+)
+
 
 class ClaudeAI:
     """Claude API integration for the AI agent"""
@@ -15,13 +49,31 @@ class ClaudeAI:
         model: str = "claude-3-opus-20240229",
         max_tokens: int = 1000,
         temperature: float = 0.7,
+        history_window: int = 5,
+        max_connections: int = 32,
     ):
-        self.client = Anthropic(api_key=api_key)
+        # One pooled client for the lifetime of the instance so TCP/TLS
+        # connections are reused across calls
+        self._http = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            )
+        )
+        self.client = AsyncAnthropic(api_key=api_key, http_client=self._http)
         self.model = model
         self.max_tokens = max_tokens
         self.temperature = temperature
-        self.conversation_history: List[Dict[str, Any]] = []
+        # Sliding window of the last history_window user/assistant turns;
+        # the deque evicts older messages and is sent to the model as is
+        self.conversation_history: Deque[Dict[str, Any]] = deque(
+            maxlen=2 * history_window
+        )
 
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=4, max=10)
+    )
     async def generate_response(
         self,
         prompt: str,
@@ -29,77 +81,118 @@ class ClaudeAI:
         context: Optional[Dict[str, Any]] = None,
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
+        use_history: bool = True,
     ) -> str:
         try:
-            messages = []
+            return "".join(
+                [
+                    chunk
+                    async for chunk in self.stream_response(
+                        prompt,
+                        system_prompt=system_prompt,
+                        context=context,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                        use_history=use_history,
+                    )
+                ]
+            )
 
-            if system_prompt:
-                messages.append({"role": "system", "content": system_prompt})
+        except Exception as e:
+            logger.error(f"Error generating response: {e}")
+            raise
 
-            if context:
-                messages.append(
-                    {"role": "system", "content": f"Context: {json.dumps(context)}"}
-                )
+    async def stream_response(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        context: Optional[Dict[str, Any]] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        use_history: bool = True,
+    ) -> AsyncIterator[str]:
+        """Yield response text as it is generated.
 
-            messages.extend(self.conversation_history[-5:])
-            messages.append({"role": "user", "content": prompt})
+        The exchange is added to the conversation history once the stream
+        has been fully consumed. With use_history=False the call neither
+        sees nor extends the history, so concurrent one-off requests can't
+        interleave their turns into it.
+        """
+        messages = []
 
-            response = await self.client.messages.create(
-                model=self.model,
-                messages=messages,
-                max_tokens=max_tokens or self.max_tokens,
-                temperature=temperature or self.temperature,
-            )
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
 
-            self.conversation_history.extend(
-                [
-                    {"role": "user", "content": prompt},
-                    {"role": "assistant", "content": response.content},
-                ]
+        if context:
+            messages.append(
+                {"role": "system", "content": f"Context: {orjson.dumps(context).decode()}"}
             )
 
-            return response.content
+        if use_history:
+            messages.extend(self.conversation_history)
+        messages.append({"role": "user", "content": prompt})
 
-        except Exception as e:
-            logger.error(f"Error generating response: {e}")
-            raise
+        chunks: List[str] = []
+        async with self.client.messages.stream(
+            model=self.model,
+            messages=messages,
+            max_tokens=max_tokens or self.max_tokens,
+            temperature=temperature or self.temperature,
+        ) as stream:
+            async for text in stream.text_stream:
+                chunks.append(text)
+                yield text
+
+        if not use_history:
+            return
+        self.conversation_history.extend(
+            [
+                {"role": "user", "content": prompt},
+                {"role": "assistant", "content": "".join(chunks)},
+            ]
+        )
 
     async def analyze_sentiment(self, text: str) -> Dict[str, Union[float, str]]:
         try:
-            prompt = (
-                "Analyze the sentiment of the following text and provide a score "
-                "from -1.0 (very negative) to 1.0 (very positive). "
-                "Also provide a label (positive/negative/neutral).\n\n"
-                f"Text: {text}\n\n"
-                "Respond in JSON format:\n"
-                "{\n"
-                '    "score": float,\n'
-                '    "label": string\n'
-                "}"
-            )
+            prompt = "".join((_SENTIMENT_PROMPT_HEAD, text, _SENTIMENT_PROMPT_TAIL))
 
+            # Stateless: batch_analyze_sentiment runs these concurrently
             response = await self.generate_response(
                 prompt=prompt,
                 temperature=0.1,
+                use_history=False,
             )
 
-            return json.loads(response)
+            return orjson.loads(response)
 
         except Exception as e:
             logger.error(f"Error analyzing sentiment: {e}")
             raise
 
+    async def batch_analyze_sentiment(
+        self,
+        texts: List[str],
+        max_inflight: int = 8,
+    ) -> List[Union[Dict[str, Union[float, str]], BaseException]]:
+        """Analyze many texts concurrently, keeping at most max_inflight requests open.
+
+        Results come back in input order; a failed text yields its exception
+        instead of aborting the whole batch.
+        """
+        semaphore = asyncio.Semaphore(max_inflight)
+
+        async def analyze(text: str) -> Dict[str, Union[float, str]]:
+            async with semaphore:
+                return await self.analyze_sentiment(text)
+
+        return await asyncio.gather(
+            *(analyze(text) for text in texts), return_exceptions=True
+        )
+
     async def analyze_market(self, context: Dict[str, Any]) -> Dict[str, Any]:
         try:
-            prompt = (
-                "Analyze the following market conditions and provide insights:\n\n"
-                f"Context: {json.dumps(context, indent=2)}\n\n"
-                "Provide:\n"
-                "1. Overall market sentiment\n"
-                "2. Key trends\n"
-                "3. Risk assessment\n"
-                "4. Recommendations\n\n"
-                "Respond in JSON format."
+            prompt = "".join(
+                (_MARKET_PROMPT_HEAD, orjson.dumps(context).decode(), _MARKET_PROMPT_TAIL)
             )
 
             response = await self.generate_response(
@@ -107,7 +200,7 @@ class ClaudeAI:
                 temperature=0.3,
             )
 
-            return json.loads(response)
+            return orjson.loads(response)
 
         except Exception as e:
             logger.error(f"Error analyzing market: {e}")
@@ -145,7 +238,7 @@ class ClaudeAI:
 
     def clear_history(self) -> None:
         """Clear conversation history"""
-        self.conversation_history = []
+        self.conversation_history.clear()
 
     async def get_embedding(self, text: str) -> List[float]:
         try:
@@ -159,3 +252,7 @@ class ClaudeAI:
         except Exception as e:
             logger.error(f"Error getting embedding: {e}")
             raise
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool"""
+        await self._http.aclose()
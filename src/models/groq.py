@@ -1,15 +1,189 @@
 # src/models/groq.py
 
-from groq import Groq
-from typing import Dict, List, Optional, Any, Union
+from groq import AsyncGroq
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, List, Optional, Set, Tuple, Union
+from collections import deque
 import logging
 import json
+import re
+import orjson
 import asyncio
-from tenacity import retry, stop_after_attempt, wait_exponential
-from functools import partial
+import random
+import time
+from contextlib import suppress
 
 logger = logging.getLogger(__name__)
 
+_JSON_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a market analysis AI. Always respond with valid JSON."
+}
+
+# Prompt shells are built once; only the JSON payload is spliced in per call
+_CONTEXT_TMPL = """Given the following context, analyze and generate strategic goals:
+Context: {payload}
+
+Respond with a JSON object containing:
+{{
+  "goals": [
+    {{
+      "id": "string",
+      "description": "string",
+      "priority": "number",
+      "timeframe": "string"
+    }}
+  ]
+}}"""
+
+_MARKET_TMPL = """Analyze the following market data and provide structured insights:
+Market Data: {payload}
+
+Respond with a JSON object containing:
+{{
+  "analysis": {{
+    "sentiment": "string",
+    "trend": "string",
+    "risk_level": "number",
+    "opportunities": ["string"],
+    "risks": ["string"]
+  }},
+  "recommendations": [
+    {{
+      "action": "string",
+      "reason": "string",
+      "confidence": "number"
+    }}
+  ]
+}}"""
+
+_SENTIMENT_BATCH_TMPL = """Analyze the sentiment of each item in this JSON array of texts:
+{payload}
+
+Return only JSON of the form {{"results": [...]}} with exactly one entry per
+text, in the same order:
+{{"score": float (-1 to 1), "label": "positive/negative/neutral", "confidence": float (0-1)}}"""
+
+
+# orjson has no raw_decode, so incremental parsing uses the stdlib decoder
+_decoder = json.JSONDecoder()
+_WHITESPACE = re.compile(r"\s*")
+
+
+def _parse_object_fields(buffer: str, pos: int) -> Tuple[List[Tuple[str, Any]], int]:
+    """Decode the complete top-level "key": value pairs of a partial JSON object.
+
+    pos must point just past the opening brace or a separating comma. Returns
+    the decoded pairs and the position to resume from once more text arrives.
+    A value is only accepted once the following "," or "}" has been seen, so
+    a number cut off mid-stream is never reported.
+    """
+    fields = []
+    while True:
+        start = _WHITESPACE.match(buffer, pos).end()
+        if start >= len(buffer) or buffer[start] == "}":
+            return fields, pos
+        try:
+            key, end = _decoder.raw_decode(buffer, start)
+            end = _WHITESPACE.match(buffer, end).end()
+            if buffer[end : end + 1] != ":":
+                return fields, pos
+            value_start = _WHITESPACE.match(buffer, end + 1).end()
+            value, end = _decoder.raw_decode(buffer, value_start)
+        except json.JSONDecodeError:
+            return fields, pos
+
+        end = _WHITESPACE.match(buffer, end).end()
+        if end >= len(buffer):
+            return fields, pos
+        fields.append((key, value))
+        pos = end + 1 if buffer[end] == "," else end
+
+
+class _SentimentBatcher:
+    """Coalesces concurrent sentiment requests into shared multi-item calls.
+
+    A request that finds the queue empty is sent straight away. When others
+    are already queued, requests arriving within max_wait_ms of the first are
+    sent together, up to max_batch texts per call.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[List[str]], Awaitable[List[Dict[str, Any]]]],
+        max_batch: int = 32,
+        max_wait_ms: float = 50,
+    ):
+        self._process_batch = process_batch
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._inflight: Set[asyncio.Task] = set()
+
+    async def submit(self, text: str) -> Dict[str, Any]:
+        if self._task is None or self._task.done():
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._batch_loop())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, future))
+        return await future
+
+    async def _batch_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+
+            # A lone request shouldn't pay max_wait; only wait for company
+            # when there is already a backlog to coalesce
+            if not self._queue.empty():
+                deadline = loop.time() + self.max_wait
+                while len(batch) < self.max_batch:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(
+                            await asyncio.wait_for(self._queue.get(), timeout)
+                        )
+                    except asyncio.TimeoutError:
+                        break
+
+            # Dispatch without waiting so the next batch can start filling
+            task = asyncio.create_task(self._dispatch(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _dispatch(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        texts = [text for text, _ in batch]
+        futures = [future for _, future in batch]
+        try:
+            results = await self._process_batch(texts)
+            if len(results) != len(texts):
+                raise ValueError(
+                    f"Expected {len(texts)} sentiment results, got {len(results)}"
+                )
+        except Exception as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for future, result in zip(futures, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def close(self) -> None:
+        tasks = [t for t in (self._task, *self._inflight) if t is not None]
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with suppress(asyncio.CancelledError):
+                await task
+        self._task = None
+        self._inflight.clear()
+
+
 class GroqAI:
     """Groq AI service for agent integration"""
 
@@ -20,18 +194,31 @@ class GroqAI:
         max_tokens: int = 1000,
         temperature: float = 0.7,
         retry_attempts: int = 3,
+        history_window: int = 5,
+        rate_limit: int = 10,
     ):
         if not api_key:
             raise ValueError("GROQ_API_KEY not provided")
+        if retry_attempts < 1:
+            raise ValueError("retry_attempts must be at least 1")
         
-        self.client = Groq(api_key=api_key)
+        self.client = AsyncGroq(api_key=api_key)
         self.model = model
         self.max_tokens = max_tokens
         self.temperature = temperature
         self.retry_attempts = retry_attempts
-        self.conversation_history: List[Dict[str, Any]] = []
+        # Caps in-flight completions so fan-out callers can't flood the API
+        self._sem = asyncio.Semaphore(rate_limit)
+        # Sliding window of the last history_window user/assistant turns;
+        # the deque evicts older messages and is sent to the model as is
+        self.conversation_history: Deque[Dict[str, Any]] = deque(
+            maxlen=2 * history_window
+        )
         self._initialized = False
-        self._loop = asyncio.get_event_loop()
+        # Circuit breaker: recent failure times, and when requests may resume
+        self._failure_window: Deque[float] = deque(maxlen=20)
+        self._circuit_open_until = 0.0
+        self._sentiment_batcher = _SentimentBatcher(self._analyze_sentiment_batch)
         
         # Initialize instance logger
         self.logger = logger
@@ -58,16 +245,13 @@ class GroqAI:
             raise
 
     async def _run_completion(self, **kwargs) -> Optional[str]:
-        """Run Groq completion in thread pool"""
+        """Run Groq completion"""
         try:
-            # Run the synchronous Groq API call in a thread pool
-            response = await asyncio.to_thread(
-                partial(
-                    self.client.chat.completions.create,
+            async with self._sem:
+                response = await self.client.chat.completions.create(
                     model=self.model,
                     **kwargs
                 )
-            )
             
             return response.choices[0].message.content if response.choices else None
             
@@ -75,10 +259,19 @@ class GroqAI:
             self.logger.error(f"Error in Groq completion: {e}")
             raise
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10)
-    )
+    def _check_circuit(self) -> None:
+        if time.monotonic() < self._circuit_open_until:
+            raise RuntimeError("Groq circuit open after repeated failures")
+
+    def _record_failure(self) -> None:
+        now = time.monotonic()
+        self._failure_window.append(now)
+        recent = sum(1 for t in self._failure_window if now - t < 30)
+        if recent > 10:
+            self._circuit_open_until = now + 30
+            self._failure_window.clear()
+            self.logger.warning("Groq circuit opened for 30s")
+
     async def generate_response(
         self,
         prompt: str,
@@ -91,38 +284,50 @@ class GroqAI:
         if not self._initialized:
             await self.initialize()
 
-        try:
-            messages = []
-
-            if system_prompt:
-                messages.append({"role": "system", "content": system_prompt})
-
-            if context:
-                messages.append(
-                    {"role": "system", "content": f"Context: {json.dumps(context)}"}
-                )
+        messages = []
 
-            messages.extend(self.conversation_history[-5:])
-            messages.append({"role": "user", "content": prompt})
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
 
-            response_text = await self._run_completion(
-                messages=messages,
-                max_tokens=max_tokens or self.max_tokens,
-                temperature=temperature or self.temperature
+        if context:
+            messages.append(
+                {"role": "system", "content": f"Context: {orjson.dumps(context).decode()}"}
             )
 
-            if response_text:
-                self.conversation_history.extend([
-                    {"role": "user", "content": prompt},
-                    {"role": "assistant", "content": response_text}
-                ])
-                return response_text
-            else:
-                raise RuntimeError("Empty response from Groq")
+        messages.extend(self.conversation_history)
+        messages.append({"role": "user", "content": prompt})
 
-        except Exception as e:
-            self.logger.error(f"Error generating response: {e}")
-            raise
+        for attempt in range(self.retry_attempts):
+            self._check_circuit()
+            try:
+                response_text = await self._run_completion(
+                    messages=messages,
+                    max_tokens=max_tokens or self.max_tokens,
+                    temperature=temperature or self.temperature
+                )
+                if not response_text:
+                    raise RuntimeError("Empty response from Groq")
+
+            except Exception as e:
+                self._record_failure()
+                self.logger.error(
+                    f"Error generating response "
+                    f"(attempt {attempt + 1}/{self.retry_attempts}): {e}"
+                )
+                # No point backing off if the breaker just tripped
+                if (
+                    attempt + 1 >= self.retry_attempts
+                    or time.monotonic() < self._circuit_open_until
+                ):
+                    raise
+                await asyncio.sleep(min(10, 4 * 2 ** attempt) + random.random())
+                continue
+
+            self.conversation_history.extend([
+                {"role": "user", "content": prompt},
+                {"role": "assistant", "content": response_text}
+            ])
+            return response_text
 
     async def analyze_market(self, market_data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze market data and provide insights"""
@@ -137,30 +342,90 @@ class GroqAI:
             self.logger.error(f"Market analysis error: {str(e)}")
             return {"analysis": {}, "error": str(e)}
 
-    async def analyze_sentiment(self, text: str) -> Dict[str, Union[float, str]]:
-        """Analyze sentiment of text"""
+    async def analyze_market_stream(
+        self, market_data: Dict[str, Any]
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """Stream a market analysis, yielding each top-level field once complete"""
         if not self._initialized:
             await self.initialize()
 
-        try:
-            prompt = f"""
-            Analyze sentiment of: {text}
-            Return only JSON:
-            {{"score": float (-1 to 1), "label": "positive/negative/neutral", "confidence": float (0-1)}}
-            """
-
-            response = await self.generate_response(
-                prompt=prompt,
+        prompt = self._build_market_prompt(market_data)
+        # Only the request is rate limited: holding the permit across yields
+        # would let a slow consumer starve every other completion
+        async with self._sem:
+            stream = await self.client.chat.completions.create(
+                model=self.model,
+                messages=[_JSON_SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
                 temperature=0.1,
-                max_tokens=100
+                response_format={"type": "json_object"},
+                stream=True
             )
 
-            return json.loads(response)
+        buffer = ""
+        pos = None
+        async for chunk in stream:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if not delta:
+                continue
+            buffer += delta
+
+            if pos is None:
+                brace = buffer.find("{")
+                if brace < 0:
+                    continue
+                pos = brace + 1
+
+            fields, pos = _parse_object_fields(buffer, pos)
+            for field in fields:
+                yield field
+
+    async def analyze_sentiment(self, text: str) -> Dict[str, Union[float, str]]:
+        """Analyze sentiment of text"""
+        if not self._initialized:
+            await self.initialize()
+
+        try:
+            return await self._sentiment_batcher.submit(text)
 
         except Exception as e:
             self.logger.error(f"Error in sentiment analysis: {e}")
             raise
 
+    async def _analyze_sentiment_batch(
+        self, texts: List[str]
+    ) -> List[Dict[str, Union[float, str]]]:
+        """Score a batch of texts with a single completion"""
+        prompt = _SENTIMENT_BATCH_TMPL.format(payload=orjson.dumps(texts).decode())
+        response = await self._run_completion(
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.1,
+            max_tokens=100 * len(texts),
+            response_format={"type": "json_object"},
+        )
+        if not response:
+            raise RuntimeError("Empty response from Groq")
+        return orjson.loads(response)["results"]
+
+    async def batch_analyze_sentiment(
+        self,
+        texts: List[str],
+        max_inflight: int = 32,
+    ) -> List[Union[Dict[str, Union[float, str]], BaseException]]:
+        """Analyze sentiment of many texts with bounded concurrency"""
+        if not self._initialized:
+            await self.initialize()
+
+        semaphore = asyncio.Semaphore(max_inflight)
+
+        async def analyze(text: str) -> Dict[str, Union[float, str]]:
+            async with semaphore:
+                return await self.analyze_sentiment(text)
+
+        # Failures are returned in place so one bad text doesn't sink the batch
+        return await asyncio.gather(
+            *(analyze(text) for text in texts), return_exceptions=True
+        )
+
     async def generate_content(self, 
                              template: str,
                              context: Optional[Dict[str, Any]] = None,
@@ -199,61 +464,22 @@ class GroqAI:
 
     def _build_context_prompt(self, context: Dict[str, Any]) -> str:
         """Build prompt for context analysis"""
-        return f"""Given the following context, analyze and generate strategic goals:
-Context: {json.dumps(context, indent=2)}
-
-Respond with a JSON object containing:
-{{
-  "goals": [
-    {{
-      "id": "string",
-      "description": "string",
-      "priority": "number",
-      "timeframe": "string"
-    }}
-  ]
-}}"""
+        return _CONTEXT_TMPL.format(payload=orjson.dumps(context).decode())
 
     def _build_market_prompt(self, market_data: Dict[str, Any]) -> str:
         """Build prompt for market analysis"""
-        return f"""Analyze the following market data and provide structured insights:
-Market Data: {json.dumps(market_data, indent=2)}
-
-Respond with a JSON object containing:
-{{
-  "analysis": {{
-    "sentiment": "string",
-    "trend": "string",
-    "risk_level": "number",
-    "opportunities": ["string"],
-    "risks": ["string"]
-  }},
-  "recommendations": [
-    {{
-      "action": "string",
-      "reason": "string",
-      "confidence": "number"
-    }}
-  ]
-}}"""
+        return _MARKET_TMPL.format(payload=orjson.dumps(market_data).decode())
 
     async def _get_completion(self, prompt: str) -> str:
         """Get completion from Groq API"""
         try:
-            # Run the synchronous Groq API call in a thread pool
-            completion = await asyncio.to_thread(
-                self.client.chat.completions.create,
-                model=self.model,
-                messages=[{
-                    "role": "system",
-                    "content": "You are a market analysis AI. Always respond with valid JSON."
-                }, {
-                    "role": "user",
-                    "content": prompt
-                }],
-                temperature=0.1,  # Lower temperature for more consistent JSON
-                response_format={"type": "json_object"}
-            )
+            async with self._sem:
+                completion = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=[_JSON_SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
+                    temperature=0.1,  # Lower temperature for more consistent JSON
+                    response_format={"type": "json_object"}
+                )
             return completion.choices[0].message.content
         except Exception as e:
             self.logger.error(f"Groq API error: {str(e)}")
@@ -265,25 +491,24 @@ Respond with a JSON object containing:
             if not response:
                 self.logger.warning("Empty response received")
                 return {}
-            
-            # Clean the response
-            cleaned = response.strip()
-            # Handle escape characters
-            cleaned = cleaned.encode('utf-8').decode('unicode_escape')
-            # Parse JSON
-            return json.loads(cleaned)
-        except json.JSONDecodeError as e:
+
+            # JSON mode already returns valid JSON; surrounding whitespace is
+            # accepted by the parser
+            return orjson.loads(response)
+        except orjson.JSONDecodeError as e:
             self.logger.error(f"JSON parsing error: {str(e)}")
             return {}
 
     def clear_history(self):
         """Clear conversation history"""
-        self.conversation_history = []
+        self.conversation_history.clear()
 
     async def cleanup(self) -> None:
         """Cleanup resources"""
         try:
             self.clear_history()
+            await self._sentiment_batcher.close()
+            await self.client.close()
             self._initialized = False
             self.logger.info("GroqAI cleaned up successfully")
         except Exception as e:
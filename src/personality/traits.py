@@ -1,8 +1,11 @@
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Any
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional, Any
 from datetime import datetime
 import logging
+from collections import deque
 from enum import Enum
+import orjson
+import pandas as pd
 
 logger = logging.getLogger(__name__)
 
@@ -24,15 +27,37 @@ class Trait:
     weight: float  # Importance weight
     adaptable: bool  # Whether trait can be modified through learning
     description: str
-    last_updated: datetime = datetime.now()
+    last_updated: datetime = field(default_factory=datetime.now)
+
+
+# Trait importance for different decision contexts
+CONTEXT_WEIGHTS: Dict[str, Dict[str, float]] = {
+    "market_analysis": {
+        "analytical_thinking": 1.0,
+        "risk_management": 0.8,
+        "decisiveness": 0.6,
+    },
+    "social_interaction": {
+        "social_awareness": 1.0,
+        "communication": 0.9,
+        "ethical_judgment": 0.7,
+    },
+    "crisis_management": {
+        "decisiveness": 1.0,
+        "adaptability": 0.9,
+        "risk_management": 0.8,
+    },
+}
 
 
 class TraitManager:
     """Manages agent personality traits"""
 
-    def __init__(self):
+    def __init__(self, max_history: int = 10_000):
         self.traits: Dict[str, Trait] = self._init_traits()
-        self.trait_history: List[Dict[str, Any]] = []
+        self._index_traits()
+        # Bounded so long-running agents don't grow history forever
+        self.trait_history: Deque[Dict[str, Any]] = deque(maxlen=max_history)
 
     def _init_traits(self) -> Dict[str, Trait]:
         """Initialize default traits"""
@@ -103,6 +128,23 @@ class TraitManager:
             ),
         }
 
+    def _index_traits(self):
+        """Precompute per-category and per-context trait lookups"""
+        self._category_traits: Dict[TraitCategory, List[Trait]] = {
+            category: [] for category in TraitCategory
+        }
+        for trait in self.traits.values():
+            self._category_traits[trait.category].append(trait)
+
+        self._context_traits: Dict[str, List[tuple]] = {
+            context_type: [
+                (self.traits[name], weight)
+                for name, weight in weights.items()
+                if name in self.traits
+            ]
+            for context_type, weights in CONTEXT_WEIGHTS.items()
+        }
+
     def get_trait(self, trait_name: str) -> Optional[Trait]:
         """Get specific trait"""
         return self.traits.get(trait_name)
@@ -128,58 +170,39 @@ class TraitManager:
                 "old_value": old_value,
                 "new_value": trait.value,
                 "reason": reason,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": trait.last_updated,
             }
         )
 
         return True
 
+    def history_df(self) -> pd.DataFrame:
+        """Materialize trait history as a DataFrame for analytics"""
+        return pd.DataFrame(
+            list(self.trait_history),
+            columns=["trait", "old_value", "new_value", "reason", "timestamp"],
+        )
+
     def get_category_score(self, category: TraitCategory) -> float:
         """Calculate weighted score for trait category"""
-        category_traits = [
-            trait for trait in self.traits.values() if trait.category == category
-        ]
+        weighted_sum = 0.0
+        weight_sum = 0.0
+        for trait in self._category_traits[category]:
+            weighted_sum += trait.value * trait.weight
+            weight_sum += trait.weight
 
-        if not category_traits:
-            return 0.0
-
-        weighted_sum = sum(t.value * t.weight for t in category_traits)
-        weight_sum = sum(t.weight for t in category_traits)
-
-        return weighted_sum / weight_sum
+        return weighted_sum / weight_sum if weight_sum > 0 else 0.0
 
     def evaluate_decision_capability(self, context: Dict[str, Any]) -> Dict[str, float]:
         """Evaluate decision-making capability"""
-        # Define trait importance for different contexts
-        context_weights = {
-            "market_analysis": {
-                "analytical_thinking": 1.0,
-                "risk_management": 0.8,
-                "decisiveness": 0.6,
-            },
-            "social_interaction": {
-                "social_awareness": 1.0,
-                "communication": 0.9,
-                "ethical_judgment": 0.7,
-            },
-            "crisis_management": {
-                "decisiveness": 1.0,
-                "adaptability": 0.9,
-                "risk_management": 0.8,
-            },
-        }
-
-        # Calculate capability scores
         scores = {}
-        for context_type, weights in context_weights.items():
-            weighted_sum = 0
-            weight_sum = 0
+        for context_type, trait_weights in self._context_traits.items():
+            weighted_sum = 0.0
+            weight_sum = 0.0
 
-            for trait_name, weight in weights.items():
-                trait = self.traits.get(trait_name)
-                if trait:
-                    weighted_sum += trait.value * weight
-                    weight_sum += weight
+            for trait, weight in trait_weights:
+                weighted_sum += trait.value * weight
+                weight_sum += weight
 
             scores[context_type] = weighted_sum / weight_sum if weight_sum > 0 else 0
 
@@ -227,8 +250,12 @@ class TraitManager:
                 name: {
                     "value": trait.value,
                     "category": trait.category.value,
-                    "last_updated": trait.last_updated.isoformat(),
+                    "last_updated": trait.last_updated,
                 }
                 for name, trait in self.traits.items()
             },
         }
+
+    def dumps_summary(self) -> bytes:
+        """Serialize trait summary to JSON; datetimes are formatted by orjson"""
+        return orjson.dumps(self.get_trait_summary())
@@ -17,6 +17,7 @@ class MetricsAnalyzer:
         self.config = config
         self.metrics_history = pd.DataFrame()
         self.scaler = StandardScaler()
+        self._fitted = False
 
     async def analyze_metrics(self, data: pd.DataFrame) -> Dict:
         normalized_data = self._normalize_data(data)
@@ -24,31 +25,68 @@ class MetricsAnalyzer:
 
         for timeframe in self.config.timeframes:
             timeframe_data = self._get_timeframe_data(normalized_data, timeframe)
+            returns = self._calculate_returns(timeframe_data)
             metrics[timeframe] = {
-                "growth": self._analyze_growth(timeframe_data),
-                "volatility": self._analyze_volatility(timeframe_data),
+                "growth": self._analyze_growth(timeframe_data, returns),
+                "volatility": self._analyze_volatility(timeframe_data, returns),
                 "correlation": self._analyze_correlation(timeframe_data),
                 "trends": self._analyze_trends(timeframe_data),
             }
 
         return metrics
 
+    def refit(self, data: pd.DataFrame) -> None:
+        """Re-baseline the scaler on data; later calls are scaled against it"""
+        self.scaler.fit(data)
+        self._fitted = True
+
     def _normalize_data(self, data: pd.DataFrame) -> pd.DataFrame:
-        return pd.DataFrame(
-            self.scaler.fit_transform(data), columns=data.columns, index=data.index
-        )
+        # Fit once so successive windows share the same scale
+        if not self._fitted:
+            self.refit(data)
+
+        # mean_/scale_ are positional, so line the columns up with the fit
+        fitted_columns = getattr(self.scaler, "feature_names_in_", None)
+        if fitted_columns is not None:
+            if set(data.columns) != set(fitted_columns):
+                raise ValueError(
+                    f"Columns {list(data.columns)} do not match the columns the "
+                    f"scaler was fitted on {list(fitted_columns)}; call refit()"
+                )
+            data = data[fitted_columns]
+        elif data.shape[1] != self.scaler.n_features_in_:
+            raise ValueError(
+                f"Expected {self.scaler.n_features_in_} columns, got {data.shape[1]}"
+            )
+
+        values = data.to_numpy(dtype=np.float64) - self.scaler.mean_
+        values /= self.scaler.scale_
+        return pd.DataFrame(values, columns=data.columns, index=data.index)
 
-    def _analyze_growth(self, data: pd.DataFrame) -> Dict:
+    def _calculate_returns(self, data: pd.DataFrame) -> np.ndarray:
+        """Period-over-period returns per column, one row shorter than data"""
+        values = data.to_numpy(dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            returns = np.diff(values, axis=0)
+            returns /= values[:-1]
+        return returns
+
+    def _analyze_growth(self, data: pd.DataFrame, returns: np.ndarray) -> Dict:
         return {
-            "total_growth": data.pct_change().sum(),
+            "total_growth": pd.Series(np.nansum(returns, axis=0), index=data.columns),
             "cagr": self._calculate_cagr(data),
             "growth_stability": self._calculate_growth_stability(data),
         }
 
-    def _analyze_volatility(self, data: pd.DataFrame) -> Dict:
-        returns = data.pct_change().dropna()
+    def _analyze_volatility(self, data: pd.DataFrame, returns: np.ndarray) -> Dict:
+        returns = returns[~np.isnan(returns).any(axis=1)]
         return {
-            "std_dev": returns.std(),
-            "var_95": self._calculate_var(returns, 0.95),
+            "std_dev": pd.Series(returns.std(axis=0, ddof=1), index=data.columns),
+            "var_95": pd.Series(
+                self._calculate_var(returns, 0.95), index=data.columns
+            ),
             "max_drawdown": self._calculate_max_drawdown(data),
         }
+
+    def _calculate_var(self, returns: np.ndarray, confidence: float) -> np.ndarray:
+        return np.quantile(returns, 1 - confidence, axis=0)
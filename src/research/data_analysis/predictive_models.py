@@ -1,21 +1,131 @@
+import asyncio
+import logging
+import os
+from functools import lru_cache
 import numpy as np
 import pandas as pd
 import xgboost as xgb
+from numba import njit
+from joblib import Parallel, delayed
+from sklearn.base import clone
 from sklearn.ensemble import RandomForestRegressor
 from sklearn.model_selection import train_test_split, cross_val_score, TimeSeriesSplit
 from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
-from typing import Dict, Any, Tuple
+from typing import Any, Dict, List, Tuple
+
+from investment.strategy.signals import _ema, _rsi
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def _xgb_device() -> str:
+    """Return "cuda" if xgboost can actually train on a GPU here, else "cpu" """
+    if not xgb.build_info().get("USE_CUDA"):
+        return "cpu"
+    try:
+        # A CUDA build can still be running on a host without a usable GPU
+        xgb.train(
+            {"device": "cuda", "tree_method": "hist"},
+            xgb.DMatrix(np.zeros((2, 1)), label=np.zeros(2)),
+            num_boost_round=1,
+        )
+    except xgb.core.XGBoostError:
+        return "cpu"
+    return "cuda"
+
+
+@lru_cache(maxsize=32)
+def _tscv_folds(n_samples: int, n_splits: int = 5) -> Tuple[Tuple[np.ndarray, np.ndarray], ...]:
+    """TimeSeriesSplit indices depend only on the sample count, so reuse them"""
+    return tuple(TimeSeriesSplit(n_splits=n_splits).split(np.empty((n_samples, 1))))
+
+
+def _rows(data, index: np.ndarray):
+    return data.iloc[index] if hasattr(data, "iloc") else data[index]
+
+
+@njit(cache=True)
+def _rolling_mean_std(values: np.ndarray, window: int):
+    """Rolling mean and sample std in one pass using a sliding Welford update.
+
+    Matches pandas rolling(window).mean()/std(): NaN until the window is full
+    and for any window containing a NaN.
+    """
+    n = values.shape[0]
+    mean_out = np.full(n, np.nan)
+    std_out = np.full(n, np.nan)
+
+    mean = 0.0
+    m2 = 0.0
+    stale = True
+    for i in range(window - 1, n):
+        if stale:
+            # (Re)seed from the whole window, e.g. once a NaN has left it
+            mean = 0.0
+            m2 = 0.0
+            stale = False
+            for k in range(window):
+                x = values[i - window + 1 + k]
+                if np.isnan(x):
+                    stale = True
+                    break
+                d = x - mean
+                mean += d / (k + 1)
+                m2 += d * (x - mean)
+            if stale:
+                continue
+        else:
+            x_new = values[i]
+            if np.isnan(x_new):
+                stale = True
+                continue
+            x_old = values[i - window]
+            new_mean = mean + (x_new - x_old) / window
+            m2 += (x_new - x_old) * (x_new - new_mean + x_old - mean)
+            mean = new_mean
+
+        mean_out[i] = mean
+        std_out[i] = np.sqrt(max(m2, 0.0) / (window - 1))
+    return mean_out, std_out
+
+
+def _single_threaded(model: Any) -> Any:
+    """Pin an estimator to one thread so parallel folds don't oversubscribe"""
+    if "n_jobs" in model.get_params():
+        model.set_params(n_jobs=1)
+    return model
+
+
+def _collect(results: Dict[str, Any], action: str) -> Dict[str, Any]:
+    """Return per-model results, raising every failure together if any model failed"""
+    failures = []
+    for model_name, result in results.items():
+        if isinstance(result, Exception):
+            logger.error(f"Failed to {action} {model_name}", exc_info=result)
+            failures.append(result)
+    if failures:
+        failed = [name for name, result in results.items() if isinstance(result, Exception)]
+        raise ExceptionGroup(f"Failed to {action} {', '.join(failed)}", failures)
+    return results
 
 
 class PredictiveModels:
     def __init__(self):
         self.models = self._get_models()
         self.trained_models = {}
+        # RF and XGBoost train side by side, each in its own worker thread
+        self.max_concurrent_models = 2
 
     def _get_models(self) -> Dict[str, Any]:
         return {
-            "rf": RandomForestRegressor(n_estimators=100),
-            "xgb": xgb.XGBRegressor(objective="reg:squarederror"),
+            "rf": RandomForestRegressor(n_estimators=100, n_jobs=-1, random_state=42),
+            "xgb": xgb.XGBRegressor(
+                objective="reg:squarederror",
+                tree_method="hist",
+                device=_xgb_device(),
+                n_jobs=-1,
+            ),
         }
 
     def train(self, X: np.ndarray, y: np.ndarray) -> Dict[str, float]:
@@ -55,32 +165,41 @@ class PredictiveModels:
 
     async def train_models(self, data: pd.DataFrame) -> Dict:
         X, y = self._prepare_data(data)
-        models_performance = {}
+        limit = asyncio.Semaphore(self.max_concurrent_models)
 
-        for model_name, model in self._get_models().items():
-            performance = await self._train_and_evaluate(model, X, y, model_name)
-            models_performance[model_name] = performance
+        async def train(model_name: str, model: object) -> Dict:
+            async with limit:
+                return await self._train_and_evaluate(model, X, y, model_name)
 
-        return models_performance
+        models = self._get_models()
+        results = await asyncio.gather(
+            *(train(name, model) for name, model in models.items()),
+            return_exceptions=True,
+        )
+
+        return _collect(dict(zip(models, results)), "train")
 
     async def generate_predictions(
         self, data: pd.DataFrame, horizon: int = 7
     ) -> Dict[str, pd.DataFrame]:
-        predictions = {}
         features = self._generate_features(data)
+        limit = asyncio.Semaphore(self.max_concurrent_models)
 
-        for model_name, model in self.models.items():
-            try:
-                pred = await self._generate_model_predictions(model, features, horizon)
-                predictions[model_name] = pred
-            except Exception as e:
-                print(f"Error generating predictions for {model_name}: {e}")
+        async def predict(model: object) -> pd.DataFrame:
+            async with limit:
+                return await self._generate_model_predictions(model, features, horizon)
+
+        results = await asyncio.gather(
+            *(predict(model) for model in self.models.values()),
+            return_exceptions=True,
+        )
 
+        predictions = _collect(dict(zip(self.models, results)), "predict with")
         return self._combine_predictions(predictions)
 
     def _prepare_data(self, data: pd.DataFrame) -> Tuple[pd.DataFrame, pd.Series]:
         features = self._generate_features(data)
-        target = self._generate_target(data)
+        target = self._generate_target(data).astype(np.float32)
         return features, target
 
     def _generate_features(self, data: pd.DataFrame) -> pd.DataFrame:
@@ -93,35 +212,125 @@ class PredictiveModels:
             data["close"]
         )
 
-        # Volume metrics
-        features["volume_sma"] = data["volume"].rolling(window=20).mean()
-        features["volume_std"] = data["volume"].rolling(window=20).std()
+        # Volume metrics; mean and std come out of the same pass
+        volume_sma, volume_std = _rolling_mean_std(
+            data["volume"].to_numpy(np.float64), 20
+        )
+        features["volume_sma"] = pd.Series(volume_sma, index=data.index)
+        features["volume_std"] = pd.Series(volume_std, index=data.index)
 
         # Price metrics
-        features["returns"] = data["close"].pct_change()
-        features["volatility"] = features["returns"].rolling(window=20).std()
+        returns = data["close"].pct_change()
+        features["returns"] = returns
+        _, volatility = _rolling_mean_std(returns.to_numpy(np.float64), 20)
+        features["volatility"] = pd.Series(volatility, index=data.index)
+
+        # Indicators are computed in float64; the models train fine on float32
+        # (~1e-7 relative error) at half the memory traffic
+        return features.dropna().astype(np.float32)
+
+    def _calculate_rsi(self, close: pd.Series, period: int = 14) -> pd.Series:
+        return pd.Series(_rsi(close.to_numpy(np.float64), period), index=close.index)
 
-        return features.dropna()
+    def _calculate_macd(
+        self, close: pd.Series, fast: int = 12, slow: int = 26
+    ) -> pd.Series:
+        # The EMA kernel skips NaN closes, so the two spans are NaN only
+        # until the first valid close
+        values = close.to_numpy(np.float64)
+        return pd.Series(_ema(values, fast) - _ema(values, slow), index=close.index)
+
+    def _calculate_bollinger_bands(
+        self, close: pd.Series, window: int = 20, num_std: float = 2.0
+    ) -> Tuple[pd.Series, pd.Series]:
+        mean, std = _rolling_mean_std(close.to_numpy(np.float64), window)
+        return (
+            pd.Series(mean + num_std * std, index=close.index),
+            pd.Series(mean - num_std * std, index=close.index),
+        )
 
     async def _train_and_evaluate(
         self, model: object, X: pd.DataFrame, y: pd.Series, model_name: str
     ) -> Dict:
-        tscv = TimeSeriesSplit(n_splits=5)
+        # Fit off the event loop so other coroutines keep running
+        metrics, fitted = await asyncio.to_thread(self._cross_validate, model, X, y)
+        self.models[model_name] = fitted
+        return metrics
+
+    def _cross_validate(self, model: object, X, y) -> Tuple[Dict[str, float], Any]:
+        """Score model over time-series folds, fitting a clone per fold in parallel.
+
+        Folds run on threads with single-threaded estimators, and the cores are
+        split between the models training concurrently so the pools don't nest.
+        Returns the mean metrics and the clone fitted on the last (largest) fold.
+        """
+        folds = _tscv_folds(len(X))
+        n_jobs = self._fold_jobs(len(folds))
+        if isinstance(model, xgb.XGBRegressor):
+            predictions, fitted = self._fit_xgb_folds(model, X, y, folds, n_jobs)
+        else:
+            fold_models = [_single_threaded(clone(model)) for _ in folds]
+            predictions = Parallel(n_jobs=n_jobs, prefer="threads")(
+                delayed(self._fit_and_predict)(
+                    fold_model, _rows(X, train_idx), _rows(y, train_idx), _rows(X, test_idx)
+                )
+                for fold_model, (train_idx, test_idx) in zip(fold_models, folds)
+            )
+            # The kept model predicts outside CV, so give it back its threads
+            fitted = fold_models[-1]
+            params = model.get_params()
+            if "n_jobs" in params:
+                fitted.set_params(n_jobs=params["n_jobs"])
+
         metrics = {"mae": [], "rmse": [], "r2": []}
+        for (_, test_idx), fold_predictions in zip(folds, predictions):
+            y_test = _rows(y, test_idx)
+            metrics["mae"].append(self._calculate_mae(y_test, fold_predictions))
+            metrics["rmse"].append(self._calculate_rmse(y_test, fold_predictions))
+            metrics["r2"].append(self._calculate_r2(y_test, fold_predictions))
 
-        for train_idx, test_idx in tscv.split(X):
-            X_train, X_test = X.iloc[train_idx], X.iloc[test_idx]
-            y_train, y_test = y.iloc[train_idx], y.iloc[test_idx]
+        return {k: np.mean(v) for k, v in metrics.items()}, fitted
 
-            model.fit(X_train, y_train)
-            predictions = model.predict(X_test)
+    def _fold_jobs(self, n_folds: int) -> int:
+        """Fold threads per model: this model's share of the cores, at most one per fold"""
+        return min(n_folds, max(1, (os.cpu_count() or 1) // self.max_concurrent_models))
 
-            metrics["mae"].append(self._calculate_mae(y_test, predictions))
-            metrics["rmse"].append(self._calculate_rmse(y_test, predictions))
-            metrics["r2"].append(self._calculate_r2(y_test, predictions))
+    def _fit_xgb_folds(
+        self, model: xgb.XGBRegressor, X, y, folds, n_jobs: int = 1
+    ) -> Tuple[List[np.ndarray], xgb.XGBRegressor]:
+        """Train XGBoost folds as row slices of one DMatrix over the full data.
 
-        self.models[model_name] = model
-        return {k: np.mean(v) for k, v in metrics.items()}
+        The sklearn wrapper would convert the fold's frame to a new DMatrix on
+        every fit and predict; here the conversion happens once.
+        """
+        # One booster thread per fold; parallelism comes from the folds
+        params = {**model.get_xgb_params(), "n_jobs": 1}
+        rounds = model.get_num_boosting_rounds()
+        dall = xgb.DMatrix(
+            np.asarray(X, dtype=np.float32),
+            label=np.asarray(y, dtype=np.float32),
+            feature_names=[str(c) for c in X.columns] if hasattr(X, "columns") else None,
+        )
+
+        def fit_fold(train_idx: np.ndarray, test_idx: np.ndarray):
+            booster = xgb.train(params, dall.slice(train_idx), num_boost_round=rounds)
+            return booster, booster.predict(dall.slice(test_idx))
+
+        results = Parallel(n_jobs=n_jobs, prefer="threads")(
+            delayed(fit_fold)(train_idx, test_idx) for train_idx, test_idx in folds
+        )
+
+        # Hand back a regular XGBRegressor so callers keep the sklearn API
+        fitted = clone(model)
+        fitted.load_model(bytearray(results[-1][0].save_raw(raw_format="json")))
+        return [predictions for _, predictions in results], fitted
+
+    @staticmethod
+    def _fit_and_predict(
+        model: object, X_train: pd.DataFrame, y_train: pd.Series, X_test: pd.DataFrame
+    ) -> np.ndarray:
+        model.fit(X_train, y_train)
+        return model.predict(X_test)
 
     def _calculate_mae(self, y_true: np.ndarray, y_pred: np.ndarray) -> float:
         return mean_absolute_error(y_true, y_pred)
@@ -137,17 +346,6 @@ class PredictiveModels:
     ) -> Dict[str, float]:
         if model_name not in self.trained_models:
             raise ValueError(f"Model {model_name} has not been trained.")
-        model = self.trained_models[model_name]
-        tscv = TimeSeriesSplit(n_splits=5)
-        metrics = {"mae": [], "rmse": [], "r2": []}
-        for train_index, test_index in tscv.split(X):
-            X_train, X_test = X[train_index], X[test_index]
-            y_train, y_test = y[train_index], y[test_index]
-            model.fit(X_train, y_train)
-            predictions = model.predict(X_test)
-            metrics["mae"].append(self._calculate_mae(y_test, predictions))
-            metrics["rmse"].append(self._calculate_rmse(y_test, predictions))
-            metrics["r2"].append(self._calculate_r2(y_test, predictions))
-
-        self.models[model_name] = model
-        return {k: np.mean(v) for k, v in metrics.items()}
+        metrics, fitted = self._cross_validate(self.trained_models[model_name], X, y)
+        self.models[model_name] = fitted
+        return metrics
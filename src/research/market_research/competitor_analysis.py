@@ -1,8 +1,18 @@
+import asyncio
 from dataclasses import dataclass
 from typing import Dict, List
+import numpy as np
 import pandas as pd
 
 
+def _shares(values: np.ndarray) -> np.ndarray:
+    """Percent of total per slot; all zeros when the total is zero"""
+    total = values.sum()
+    if not total:
+        return np.zeros_like(values)
+    return values / total * 100
+
+
 @dataclass
 class Competitor:
     name: str
@@ -16,15 +26,24 @@ class Competitor:
 
 class CompetitorAnalyzer:
     def __init__(self):
-        self.competitors = {}
+        self.competitors: Dict[str, Competitor] = {}
         self.metrics_history = pd.DataFrame()
+        # Numeric fields kept column-wise so shares are computed in one step;
+        # slot i of each array belongs to self._names[i]
+        self._names: List[str] = []
+        self._slots: Dict[str, int] = {}
+        self._tvl = np.zeros(16, dtype=np.float64)
+        self._volume_24h = np.zeros(16, dtype=np.float64)
+        self.max_concurrent_requests = 10
 
     async def analyze_competitor(self, competitor_id: str) -> Competitor:
-        metrics = await self._fetch_competitor_metrics(competitor_id)
-        features = await self._analyze_features(competitor_id)
-        users = await self._analyze_user_metrics(competitor_id)
+        metrics, features, users = await asyncio.gather(
+            self._fetch_competitor_metrics(competitor_id),
+            self._analyze_features(competitor_id),
+            self._analyze_user_metrics(competitor_id),
+        )
 
-        return Competitor(
+        competitor = Competitor(
             name=metrics["name"],
             token=metrics["token"],
             tvl=metrics["tvl"],
@@ -33,6 +52,34 @@ class CompetitorAnalyzer:
             features=features,
             metrics=metrics,
         )
+        self._store_competitor(competitor)
+        return competitor
+
+    async def analyze_competitors(self, competitor_ids: List[str]) -> List[Competitor]:
+        limit = asyncio.Semaphore(self.max_concurrent_requests)
+
+        async def analyze(competitor_id: str) -> Competitor:
+            async with limit:
+                return await self.analyze_competitor(competitor_id)
+
+        return list(await asyncio.gather(*(analyze(c) for c in competitor_ids)))
+
+    def _store_competitor(self, competitor: Competitor) -> None:
+        self.competitors[competitor.name] = competitor
+
+        slot = self._slots.get(competitor.name)
+        if slot is None:
+            slot = len(self._names)
+            if slot == self._tvl.shape[0]:
+                self._tvl = np.concatenate([self._tvl, np.zeros_like(self._tvl)])
+                self._volume_24h = np.concatenate(
+                    [self._volume_24h, np.zeros_like(self._volume_24h)]
+                )
+            self._names.append(competitor.name)
+            self._slots[competitor.name] = slot
+
+        self._tvl[slot] = competitor.tvl
+        self._volume_24h[slot] = competitor.volume_24h
 
     async def generate_competitive_analysis(self) -> Dict:
         market_share = self._calculate_market_share()
@@ -47,13 +94,16 @@ class CompetitorAnalyzer:
         }
 
     def _calculate_market_share(self) -> Dict:
-        total_tvl = sum(comp.tvl for comp in self.competitors.values())
-        total_volume = sum(comp.volume_24h for comp in self.competitors.values())
+        count = len(self._names)
+        tvl = self._tvl[:count]
+        volume = self._volume_24h[:count]
+
+        tvl_share = _shares(tvl)
+        volume_share = _shares(volume)
 
         return {
-            comp.name: {
-                "tvl_share": (comp.tvl / total_tvl) * 100,
-                "volume_share": (comp.volume_24h / total_volume) * 100,
-            }
-            for comp in self.competitors.values()
+            name: {"tvl_share": tvl_pct, "volume_share": volume_pct}
+            for name, tvl_pct, volume_pct in zip(
+                self._names, tvl_share.tolist(), volume_share.tolist()
+            )
         }
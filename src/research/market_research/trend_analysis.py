@@ -5,6 +5,15 @@ import numpy as np
 import pandas as pd
 
 
+OHLCV_AGG = {
+    "open": "first",
+    "high": "max",
+    "low": "min",
+    "close": "last",
+    "volume": "sum",
+}
+
+
 @dataclass
 class TrendMetrics:
     strength: float
@@ -50,31 +59,25 @@ class TrendAnalyzer:
 
     def _analyze_price_trends(self, data: pd.DataFrame) -> Dict:
         trends = {}
-        timeframes = ["1h", "4h", "1d", "1w"]
 
-        for tf in timeframes:
-            resampled = data.resample(tf).agg(
-                {
-                    "open": "first",
-                    "high": "max",
-                    "low": "min",
-                    "close": "last",
-                    "volume": "sum",
-                }
-            )
-
-            trends[tf] = self._identify_trend(resampled)
+        # OHLCV aggregates compose, so each timeframe is rolled up from the
+        # previous (already much smaller) one instead of from the raw data
+        frame = data
+        for tf in ("1h", "4h", "1d", "1w"):
+            frame = frame.resample(tf).agg(OHLCV_AGG)
+            trends[tf] = self._identify_trend(frame)
 
         return trends
 
     def _identify_trend(self, data: pd.DataFrame) -> TrendMetrics:
-        # Calculate moving averages
-        ma20 = data["close"].rolling(window=20).mean()
-        ma50 = data["close"].rolling(window=50).mean()
+        # Only the latest value of each moving average is used
+        close = data["close"].to_numpy(dtype=np.float64)
+        ma20 = self._last_moving_average(close, 20)
+        ma50 = self._last_moving_average(close, 50)
 
         # Determine trend direction and strength
-        trend_direction = 1 if ma20.iloc[-1] > ma50.iloc[-1] else -1
-        strength = abs(ma20.iloc[-1] - ma50.iloc[-1]) / ma50.iloc[-1]
+        trend_direction = 1 if ma20 > ma50 else -1
+        strength = abs(ma20 - ma50) / ma50
 
         # Calculate support and resistance
         support = self._calculate_support(data)
@@ -88,6 +91,12 @@ class TrendAnalyzer:
             resistance=resistance,
         )
 
+    def _last_moving_average(self, values: np.ndarray, window: int) -> float:
+        """Last value of rolling(window).mean() without building the whole series"""
+        if values.shape[0] < window:
+            return np.nan
+        return values[-window:].mean()
+
     def _generate_trend_signals(self, trends: Dict) -> List[Dict]:
         signals = []
 
@@ -1,6 +1,11 @@
 
 from .templates import TemplateManager
-from .report_generator import ReportGenerator, ReportConfig
+from .report_generator import ReportGenerator, ReportConfig, get_report_generator
 
 
-__all__ = ["ReportGenerator", "ReportConfig", "TemplateManager"]
+__all__ = [
+    "ReportGenerator",
+    "ReportConfig",
+    "TemplateManager",
+    "get_report_generator",
+]
@@ -1,37 +1,95 @@
 # src/research/reports/report_generator.py
 
 import logging
-from typing import Dict, Any, Optional
+import string
+from typing import Callable, Dict, Any, Mapping, Optional
 from datetime import datetime
+from types import MappingProxyType
+from collections import deque
+from itertools import islice
 import asyncio
 import json
-from dataclasses import dataclass
+from functools import lru_cache, partial
+
+import msgspec
+import orjson
 
 logger = logging.getLogger(__name__)
 
-@dataclass
-class ReportConfig:
+_ORJSON_INDENT_2 = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+
+def _dumps_indent_2(obj: Any) -> str:
+    """json.dumps(obj, indent=2) through orjson where it can encode obj.
+
+    orjson writes NaN/Infinity as null rather than json's NaN/Infinity.
+    Values it rejects, such as integers beyond 64 bits (token amounts),
+    fall back to the json module.
+    """
+    try:
+        return orjson.dumps(obj, option=_ORJSON_INDENT_2).decode()
+    except TypeError:
+        return json.dumps(obj, indent=2)
+
+
+_Renderer = Callable[[Dict[str, str]], str]
+
+
+def _compile_template(template: str) -> _Renderer:
+    """Compile a str.format template into a function that concatenates its parts
+
+    Templates using format specs, conversions or attribute/index lookups are
+    rendered by str.format itself.
+    """
+    parts = []
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        if literal:
+            parts.append(repr(literal))
+        if field is not None:
+            if spec or conversion or not field.isidentifier():
+                return lambda sections: template.format(**sections)
+            # a missing section raises KeyError like str.format
+            parts.append(f"sections[{field!r}]")
+    namespace: Dict[str, Any] = {}
+    exec(f"def render(sections):\n    return ''.join([{', '.join(parts)}])", namespace)
+    return namespace["render"]
+
+
+# Read-only template; each ReportConfig gets its own plain-dict copy
+_DEFAULT_FORMATTING: Mapping[str, Any] = MappingProxyType({
+    'indent': 2,
+    'line_length': 80,
+    'timestamp_format': '%Y-%m-%d %H:%M:%S'
+})
+
+
+class ReportConfig(msgspec.Struct):
     """Configuration for report generator"""
     templates_path: Optional[str] = None
     storage_path: Optional[str] = None
     max_history: int = 100
     default_type: str = 'research_report'
-    formatting: Dict[str, Any] = None
+    formatting: Optional[Dict[str, Any]] = None
 
     def __post_init__(self):
         if self.formatting is None:
-            self.formatting = {
-                'indent': 2,
-                'line_length': 80,
-                'timestamp_format': '%Y-%m-%d %H:%M:%S'
-            }
+            # A plain dict so the config still round-trips through msgspec
+            self.formatting = dict(_DEFAULT_FORMATTING)
 
 class ReportGenerator:
     def __init__(self, config: Optional[ReportConfig] = None):
         self.config = config or ReportConfig()
+        self._ts_fmt = self.config.formatting['timestamp_format']
+        # orjson only indents by two spaces; other widths keep the json module
+        indent = self.config.formatting['indent']
+        self._dumps = (
+            _dumps_indent_2 if indent == 2 else partial(json.dumps, indent=indent)
+        )
         self._initialized = False
         self.report_templates = {}
-        self.report_history = []
+        # One compiled renderer per template, built by _load_templates
+        self._renderers: Dict[str, _Renderer] = {}
+        self.report_history = deque(maxlen=self.config.max_history)
 
     async def initialize(self) -> None:
         """Initialize the report generator"""
@@ -93,6 +151,10 @@ class ReportGenerator:
                 {recommendations}
                 """
             }
+            self._renderers = {
+                name: _compile_template(template)
+                for name, template in self.report_templates.items()
+            }
         except Exception as e:
             logger.error(f"Failed to load templates: {e}")
             raise
@@ -104,37 +166,32 @@ class ReportGenerator:
             
         try:
             report_type = report_type or self.config.default_type
-            template = self.report_templates.get(report_type)
-            if not template:
+            render = self._renderers.get(report_type)
+            if not render:
                 raise ValueError(f"Unknown report type: {report_type}")
                 
             # Generate report content
-            content = await self._generate_content(data, template)
+            content = await self._generate_content(data, render)
             
             # Generate summary
             summary = await self._generate_summary(content)
             
+            timestamp = datetime.now().strftime(self._ts_fmt)
             report = {
                 'type': report_type,
-                'timestamp': datetime.now().strftime(self.config.formatting['timestamp_format']),
+                'timestamp': timestamp,
                 'content': content,
                 'summary': summary,
                 'metadata': {
-                    'source_data': list(data.keys()),
+                    'source_data': list(data),
                     'template_used': report_type
                 }
             }
             
             # Store in history
-            self.report_history.append({
-                'timestamp': report['timestamp'],
-                'type': report_type,
-                'summary': summary
-            })
-            
-            # Trim history if needed
-            if len(self.report_history) > self.config.max_history:
-                self.report_history = self.report_history[-self.config.max_history:]
+            self.report_history.append(
+                {'timestamp': timestamp, 'type': report_type, 'summary': summary}
+            )
             
             return report
             
@@ -142,25 +199,22 @@ class ReportGenerator:
             logger.error(f"Failed to generate report: {e}")
             raise
 
-    async def _generate_content(self, data: Dict[str, Any], template: str) -> str:
+    async def _generate_content(
+        self, data: Dict[str, Any], render: _Renderer
+    ) -> str:
         """Generate report content from template"""
         try:
             # Process data into template sections
             sections = {}
             for key in data:
                 if isinstance(data[key], dict):
-                    sections[key] = json.dumps(
-                        data[key],
-                        indent=self.config.formatting['indent']
-                    )
+                    sections[key] = self._dumps(data[key])
                 elif isinstance(data[key], list):
                     sections[key] = "\n".join(f"- {item}" for item in data[key])
                 else:
                     sections[key] = str(data[key])
                     
-            # Fill template
-            content = template.format(**sections)
-            return content
+            return render(sections)
             
         except Exception as e:
             logger.error(f"Failed to generate content: {e}")
@@ -169,20 +223,17 @@ class ReportGenerator:
     async def _generate_summary(self, content: str) -> str:
         """Generate summary of report content"""
         try:
-            # Split content into sections
-            sections = content.split("\n## ")
-            
-            # Extract key points
+            # One pass over the lines: the title plus every section header
             summary_points = []
-            for section in sections:
-                if section.strip():
-                    lines = section.strip().split("\n")
-                    if lines:
-                        summary_points.append(lines[0])
-                        
+            for line in content.splitlines():
+                line = line.strip()
+                if line.startswith("## "):
+                    summary_points.append(line[3:])
+                elif line and not summary_points:
+                    summary_points.append(line)
+
             # Combine into summary
-            summary = "\n".join(f"- {point}" for point in summary_points)
-            return summary
+            return "\n".join(f"- {point}" for point in summary_points)
             
         except Exception as e:
             logger.error(f"Failed to generate summary: {e}")
@@ -194,15 +245,26 @@ class ReportGenerator:
             raise RuntimeError("Report Generator not initialized")
         
         limit = limit or self.config.max_history
-        return self.report_history[-limit:]
+        start = max(0, len(self.report_history) - limit)
+        return list(islice(self.report_history, start, None))
 
     async def cleanup(self) -> None:
         """Cleanup report generator resources"""
         try:
             self.report_history.clear()
             self.report_templates.clear()
+            self._renderers.clear()
             self._initialized = False
             logger.info("Report Generator cleaned up successfully")
         except Exception as e:
             logger.error(f"Error cleaning up Report Generator: {e}")
 
+
+@lru_cache(maxsize=1)
+def get_report_generator() -> ReportGenerator:
+    """Process-wide ReportGenerator with the default config.
+
+    Callers share one instance, so templates are prepared once and the
+    report history is common to all of them.
+    """
+    return ReportGenerator()
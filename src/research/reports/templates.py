@@ -58,15 +58,21 @@ INVESTMENT_REPORT_TEMPLATE = """
 """
 
 
+# Compiled once per process and shared by every TemplateManager
+_ENV = jinja2.Environment(trim_blocks=True, lstrip_blocks=True)
+_TEMPLATES = {
+    "market_report": _ENV.from_string(MARKET_REPORT_TEMPLATE),
+    "investment_report": _ENV.from_string(INVESTMENT_REPORT_TEMPLATE),
+}
+
+
 class TemplateManager:
     def __init__(self):
-        self.env = jinja2.Environment(trim_blocks=True, lstrip_blocks=True)
-        self.templates = {
-            "market_report": self.env.from_string(MARKET_REPORT_TEMPLATE),
-            "investment_report": self.env.from_string(INVESTMENT_REPORT_TEMPLATE),
-        }
+        self.env = _ENV
+        self.templates = _TEMPLATES
 
     def render_template(self, template_name: str, data: Dict) -> str:
-        if template_name not in self.templates:
+        template = _TEMPLATES.get(template_name)
+        if template is None:
             raise ValueError(f"Template {template_name} not found")
-        return self.templates[template_name].render(**data)
+        return template.render(**data)
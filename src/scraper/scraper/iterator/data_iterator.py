@@ -1,6 +1,4 @@
 import re
-import sys
-import os
 from pathlib import Path
 
 import numpy as np
@@ -9,6 +7,31 @@ from pandas import DataFrame
 
 from scraper.utils.common import constants
 
+_INT_RE = re.compile(r"\d+")
+
+# scraper project root, three levels up from this file
+_PKG_ROOT = Path(__file__).resolve().parents[2]
+_DATA_PATHS = {
+    "btc": _PKG_ROOT
+    / constants.DATA_DIR
+    / constants.OfflineDataStream.BITCOIN_DATA_FNAME.value,
+}
+
+PRICE_COLUMNS = [
+    "Open",
+    "High",
+    "Low",
+    "Close",
+    "Volume_(BTC)",
+    "Volume_(Currency)",
+    "Weighted_Price",
+]
+_DISPLAY_COLUMNS = frozenset(("Date", "Year"))
+# normalized [0, 1] outputs do not need double precision
+PRICE_DTYPES = dict.fromkeys(PRICE_COLUMNS, np.float32)
+# 2018-01-01T00:00:00Z; earlier rows are excluded from the dataset
+START_TIMESTAMP = 1514764800
+
 
 class DataIterator:
     """
@@ -28,91 +51,84 @@ class DataIterator:
         self.crypto_type = crypto_type
         self.time_interval = time_interval
         self.day_count = day_count
+        # time_interval and day_count are fixed, so the slide is computed once
+        self._window_slide = int(
+            1440 / int(_INT_RE.search(time_interval).group()) * day_count
+        )
         self.data_directory = self._fetch_data_directory()
         self.data = self._preprocess_data(self.data_directory)
 
     def _fetch_data_directory(self) -> Path:
         """Get crypto data directory"""
-
-        current_file_dir = os.path.abspath(
-            sys.modules[DataIterator.__module__].__file__
-        )
-        target_dir = current_file_dir.split(os.sep)[:-3]
-        path_to_scraper = Path(os.path.join(*target_dir))
-        if self.crypto_type == "btc":
-            return (
-                Path("/")
-                / path_to_scraper
-                / constants.DATA_DIR
-                / constants.OfflineDataStream.BITCOIN_DATA_FNAME.value
-            )
-        else:
-            return None
+        return _DATA_PATHS.get(self.crypto_type)
 
     def _preprocess_data(self, data_path: Path) -> DataFrame:
         """open and preprocess csv file"""
-        crypto_df = pd.read_csv(data_path)
-        crypto_interpolated_df = crypto_df[
-            [
-                "Open",
-                "High",
-                "Low",
-                "Close",
-                "Volume_(BTC)",
-                "Volume_(Currency)",
-                "Weighted_Price",
-            ]
-        ].interpolate()
+        crypto_df = pd.read_csv(
+            data_path,
+            usecols=["Timestamp", *PRICE_COLUMNS],
+            dtype=PRICE_DTYPES,
+        )
+        crypto_interpolated_df = crypto_df[PRICE_COLUMNS].interpolate()
         crypto_interpolated_df["Timestamp"] = crypto_df["Timestamp"]
 
-        crypto_interpolated_df["Date"] = pd.to_datetime(
-            crypto_interpolated_df["Timestamp"], unit="s"
-        )
-        crypto_interpolated_df.set_index("Timestamp", inplace=True)
-        crypto_interpolated_df["Year"] = crypto_interpolated_df["Date"].dt.year
+        # Drop pre-2018 rows before deriving dates; the dump is in time order,
+        # so that is a slice at the first kept row rather than a row mask
+        timestamps = crypto_df["Timestamp"]
+        if timestamps.is_monotonic_increasing:
+            start = timestamps.searchsorted(START_TIMESTAMP)
+            crypto_interpolated_df = crypto_interpolated_df.iloc[start:]
+        else:
+            crypto_interpolated_df = crypto_interpolated_df[
+                ~(timestamps < START_TIMESTAMP)
+            ]
 
-        crypto_correct_data_df = crypto_interpolated_df[
-            ~(crypto_interpolated_df["Date"] < "2018-01-01")
-        ]
-        return crypto_correct_data_df
+        dates = pd.to_datetime(crypto_interpolated_df["Timestamp"], unit="s")
+        return crypto_interpolated_df.assign(
+            Date=dates, Year=dates.dt.year
+        ).set_index("Timestamp")
 
     def _hit_data_tail(self, start: int, block_step: int, max_index: int) -> bool:
         """check wheter there is no jump to the past once computing slice"""
-        overlap = (start + block_step) / max_index
-        if overlap > 1.0:
-            return True
-        else:
-            return False
+        return start + block_step > max_index
 
     def _compute_window_slide(self):
         """compute slice properties based on parameters in ctor"""
-        int_time_interval = int(re.search(r"\d+", self.time_interval).group())
-        minutes_x_freq = 1440 / int_time_interval
-        window_slide = int(minutes_x_freq * self.day_count)
-        return window_slide
+        return self._window_slide
 
     def _normalize_data_window(self, dataframe: DataFrame) -> DataFrame:
         """normalize dataframe"""
-        normalized_df = dataframe.copy()
-        column_names = normalized_df.columns.tolist()
-        for column in column_names:
-            if column == "Date" or column == "Year":
-                raise TypeError(
-                    "Could not normalize Year and Data series - consider dropping "
-                    "before normalizing"
-                )
-            else:
-                next_shift = normalized_df[column].shift(1)
-                normalized_df[column] = np.log(normalized_df[column]) - np.log(
-                    next_shift
-                )
-                min_col = normalized_df[column].min()
-                max_col = normalized_df[column].max()
-                normalized_df[column] = (normalized_df[column] - min_col) / (
-                    max_col - min_col
-                )
-        clean_normalized_df = normalized_df.dropna()
-        is_nan = clean_normalized_df.isna().sum()
-        if is_nan.any():
-            raise SystemError("NaN value found")
+        # Date and Year are carried through untouched rather than normalized
+        display_columns = [c for c in dataframe.columns if c in _DISPLAY_COLUMNS]
+        numeric_df = dataframe.drop(columns=display_columns)
+
+        # Log returns and min-max scaling for every column in one block, in
+        # float64 so the difference of two nearby logs keeps its precision.
+        # Volumes can be zero, so they use log1p to stay finite
+        values = numeric_df.to_numpy(dtype=np.float64)
+        is_volume = numeric_df.columns.str.startswith("Volume")
+        log_values = np.empty_like(values)
+        log_values[:, ~is_volume] = np.log(values[:, ~is_volume])
+        log_values[:, is_volume] = np.log1p(values[:, is_volume])
+        log_returns = np.empty_like(log_values)
+        log_returns[0] = np.nan
+        np.subtract(log_values[1:], log_values[:-1], out=log_returns[1:])
+
+        min_col = np.nanmin(log_returns, axis=0)
+        max_col = np.nanmax(log_returns, axis=0)
+        # scale in place rather than through two full-size temporaries
+        np.subtract(max_col, min_col, out=max_col)
+        np.subtract(log_returns, min_col, out=log_returns)
+        np.divide(log_returns, max_col, out=log_returns)
+        keep = ~np.isnan(log_returns).any(axis=1)
+        clean_normalized_df = DataFrame(
+            log_returns[keep].astype(np.float32),
+            columns=numeric_df.columns,
+            index=dataframe.index[keep],
+            copy=False,
+        )
+        if display_columns:
+            clean_normalized_df = pd.concat(
+                [clean_normalized_df, dataframe[display_columns].iloc[keep]], axis=1
+            )
         return clean_normalized_df
@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from scraper.iterator import data_iterator
+from scraper.iterator.data_iterator import (
+    PRICE_COLUMNS,
+    START_TIMESTAMP,
+    DataIterator,
+)
+
+VOLUME_COLUMNS = [c for c in PRICE_COLUMNS if c.startswith("Volume")]
+
+
+@pytest.fixture
+def iterator(tmp_path, monkeypatch):
+    rng = np.random.default_rng(0)
+    n = 200
+    returns = rng.normal(0, 0.001, (n, len(PRICE_COLUMNS)))
+    prices = 10_000 * np.exp(returns.cumsum(axis=0))
+    frame = pd.DataFrame(prices, columns=PRICE_COLUMNS)
+    frame.loc[100:102, PRICE_COLUMNS] = np.nan
+    # Minutes without trades report zero volume
+    frame.loc[[20, 21], VOLUME_COLUMNS] = 0.0
+    frame.insert(0, "Timestamp", START_TIMESTAMP - 600 + 60 * np.arange(n))
+
+    csv_path = tmp_path / "bitcoin_data.csv"
+    frame.to_csv(csv_path, index=False)
+    monkeypatch.setitem(data_iterator._DATA_PATHS, "btc", csv_path)
+    return DataIterator("btc", "1min", 1)
+
+
+def test_preprocess_drops_pre_2018_rows_and_interpolates(iterator):
+    data = iterator.data
+
+    assert data.index[0] == START_TIMESTAMP
+    assert len(data) == 190
+    assert not data[PRICE_COLUMNS].isna().any().any()
+    assert (data[PRICE_COLUMNS].dtypes == np.float32).all()
+    assert (data["Year"] == 2018).all()
+    assert data["Date"].iloc[0] == pd.Timestamp("2018-01-01")
+    assert iterator._compute_window_slide() == 1440
+
+
+def test_normalize_window_matches_float64_reference(iterator):
+    window = iterator.data.iloc[:60]
+
+    normalized = iterator._normalize_data_window(window)
+
+    # Column-wise pandas reference in float64; volumes go through log1p
+    numeric = window[PRICE_COLUMNS].astype(np.float64)
+    logs = np.log1p(numeric)
+    price_only = [c for c in PRICE_COLUMNS if c not in VOLUME_COLUMNS]
+    logs[price_only] = np.log(numeric[price_only])
+    log_returns = logs - logs.shift(1)
+    col_min, col_max = log_returns.min(), log_returns.max()
+    expected = ((log_returns - col_min) / (col_max - col_min)).dropna()
+
+    prices = normalized[PRICE_COLUMNS]
+    assert (prices.dtypes == np.float32).all()
+    assert prices.index.equals(expected.index)
+    np.testing.assert_allclose(prices.to_numpy(), expected.to_numpy(), atol=1e-6)
+    assert np.isfinite(prices.to_numpy()).all()
+    assert prices.min().min() == 0.0
+    assert prices.max().max() == pytest.approx(1.0)
+
+
+def test_normalize_window_carries_display_columns(iterator):
+    window = iterator.data.iloc[:60]
+
+    normalized = iterator._normalize_data_window(window)
+
+    assert list(normalized.columns) == [*PRICE_COLUMNS, "Date", "Year"]
+    # Display columns are carried through untouched for the kept rows
+    assert normalized["Date"].equals(window["Date"].iloc[1:])
+    assert normalized["Year"].equals(window["Year"].iloc[1:])
+
+
+def test_hit_data_tail(iterator):
+    assert not iterator._hit_data_tail(0, 100, 189)
+    assert not iterator._hit_data_tail(89, 100, 189)
+    assert iterator._hit_data_tail(100, 100, 189)
@@ -1,17 +1,20 @@
-from dataclasses import dataclass
-from typing import Dict
+import asyncio
+from typing import Dict, List
 
+import msgspec
 
-@dataclass
-class DistributionConfig:
+
+class DistributionConfig(msgspec.Struct):
     vesting_schedules: Dict[str, Dict]
     allocations: Dict[str, float]
     lockup_periods: Dict[str, int]
 
 
 class TokenDistributor:
-    def __init__(self, token_address: str):
+    def __init__(self, token_address: str, max_concurrent_transfers: int = 20):
         self.token_address = token_address
+        # transfers in flight at once, to stay under RPC rate limits
+        self.max_concurrent_transfers = max_concurrent_transfers
         self.distributions = {}
         self.vesting_schedules = {}
 
@@ -58,20 +61,39 @@ class TokenDistributor:
     async def _create_vesting_accounts(
         self, schedules: Dict[str, Dict]
     ) -> Dict[str, str]:
-        vesting_accounts = {}
-
-        for recipient, schedule in schedules.items():
-            account = await self._create_vesting_account(recipient, schedule)
-            vesting_accounts[recipient] = account
-
-        return vesting_accounts
+        # Recipients are independent, so the account RPCs run concurrently
+        accounts = await asyncio.gather(
+            *(
+                self._create_vesting_account(recipient, schedule)
+                for recipient, schedule in schedules.items()
+            )
+        )
+        return dict(zip(schedules, accounts))
 
     async def _setup_allocations(self, allocations: Dict[str, float]) -> Dict[str, str]:
-        accounts = {}
+        accounts = await asyncio.gather(
+            *(self._create_token_account(recipient) for recipient in allocations)
+        )
+        # Fund only once every account exists
+        await asyncio.gather(
+            *(
+                self._transfer_initial_allocation(account, amount)
+                for account, amount in zip(accounts, allocations.values())
+            )
+        )
+        return dict(zip(allocations, accounts))
+
+    async def _execute_transfers(self, releasable: Dict[str, float]) -> List[str]:
+        # One transfer per recipient; recipients are independent, so the
+        # transfers run concurrently up to max_concurrent_transfers
+        limit = asyncio.Semaphore(self.max_concurrent_transfers)
 
-        for recipient, amount in allocations.items():
-            account = await self._create_token_account(recipient)
-            await self._transfer_initial_allocation(account, amount)
-            accounts[recipient] = account
+        async def send(recipient: str, amount: float) -> str:
+            async with limit:
+                return await self._transfer_tokens(recipient, amount)
 
-        return accounts
+        return list(
+            await asyncio.gather(
+                *(send(recipient, amount) for recipient, amount in releasable.items())
+            )
+        )
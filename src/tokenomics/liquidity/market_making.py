@@ -2,7 +2,6 @@ from dataclasses import dataclass
 from typing import Dict, List, Optional
 import numpy as np
 import pandas as pd
-from decimal import Decimal
 
 @dataclass
 class MarketMakingConfig:
@@ -16,6 +15,9 @@ class MarketMakingConfig:
 class MarketMaker:
     def __init__(self, config: MarketMakingConfig):
         self.config = config
+        # The ladder depends only on the config, so it is built once
+        spread_step = config.spread / config.num_orders
+        self._ladder_offsets = spread_step * np.arange(1, config.num_orders + 1)
         self.active_orders = {}
         self.order_history = pd.DataFrame()
         
@@ -52,18 +54,33 @@ class MarketMaker:
     def _generate_bid_orders(self, 
                            mid_price: float,
                            inventory: Dict[str, float]) -> List[Dict]:
-        orders = []
-        spread_step = self.config.spread / self.config.num_orders
-        
-        for i in range(self.config.num_orders):
-            price = mid_price * (1 - (spread_step * (i + 1)))
-            size = self._calculate_order_size(price, "bid", inventory)
-            
-            if size >= self.config.min_order_size:
-                orders.append({
-                    "side": "bid",
-                    "price": price,
-                    "size": size
-                })
-        
-        return orders
\ No newline at end of file
+        prices = mid_price * (1 - self._ladder_offsets)
+        return self._ladder_orders("bid", prices, inventory)
+
+    def _generate_ask_orders(self, 
+                           mid_price: float,
+                           inventory: Dict[str, float]) -> List[Dict]:
+        prices = mid_price * (1 + self._ladder_offsets)
+        return self._ladder_orders("ask", prices, inventory)
+
+    def _ladder_orders(self,
+                       side: str,
+                       prices: np.ndarray,
+                       inventory: Dict[str, float]) -> List[Dict]:
+        sizes = self._calculate_order_sizes(prices, side, inventory)
+        mask = sizes >= self.config.min_order_size
+        return [
+            {"side": side, "price": price, "size": size}
+            for price, size in zip(prices[mask].tolist(), sizes[mask].tolist())
+        ]
+
+    def _calculate_order_sizes(self,
+                               prices: np.ndarray,
+                               side: str,
+                               inventory: Dict[str, float]) -> np.ndarray:
+        return np.fromiter(
+            (self._calculate_order_size(price, side, inventory)
+             for price in prices.tolist()),
+            dtype=np.float64,
+            count=len(prices)
+        )
@@ -2,7 +2,6 @@ from dataclasses import dataclass
 from typing import Dict, List, Optional
 import numpy as np
 import pandas as pd
-from decimal import Decimal
 @dataclass
 class PoolConfig:
     token_a: str
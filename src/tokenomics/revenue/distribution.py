@@ -1,10 +1,27 @@
-from dataclasses import dataclass
-from typing import Dict, List, Optional
-from decimal import Decimal
+import asyncio
+from typing import Dict, List, Optional, Union
+import msgspec
+import numpy as np
 import pandas as pd
+from numba import njit
 
-@dataclass
-class DistributionConfig:
+
+@njit(cache=True, error_model="numpy")
+def _apportion(stakes: np.ndarray, total: float) -> np.ndarray:
+    """Split total pro rata to stakes; nothing is paid out on zero stake"""
+    stake_sum = 0.0
+    for i in range(stakes.shape[0]):
+        stake_sum += stakes[i]
+    rewards = np.zeros_like(stakes)
+    if stake_sum <= 0.0:
+        return rewards
+    per_unit = total / stake_sum
+    for i in range(stakes.shape[0]):
+        rewards[i] = stakes[i] * per_unit
+    return rewards
+
+
+class DistributionConfig(msgspec.Struct):
     treasury_share: float
     staking_share: float
     team_share: float
@@ -12,10 +29,32 @@ class DistributionConfig:
     distribution_interval: int
 
 class RevenueDistributor:
+    __slots__ = (
+        "config", "_share_keys", "_shares", "pending_distributions", "stakes",
+        "max_concurrent_requests", "_distribution_frame",
+        "_distribution_buffer", "_distribution_buffer_limit"
+    )
+
     def __init__(self, config: DistributionConfig):
         self.config = config
+        # Stakeholder shares as one vector so a batch splits in one multiply
+        self._share_keys = ("treasury", "staking", "team", "community")
+        self._shares = np.array([
+            config.treasury_share,
+            config.staking_share,
+            config.team_share,
+            config.community_share
+        ], dtype=np.float64)
         self.pending_distributions = {}
-        self.distribution_history = pd.DataFrame()
+        # Stake per staker address, used to apportion rewards when the
+        # pending-rewards payload carries no "stakes"; set via update_stakes
+        self.stakes: Dict[str, float] = {}
+        self.max_concurrent_requests = 64
+        # Rows are buffered and concatenated in chunks rather than copying
+        # the whole frame for every distribution
+        self._distribution_frame = pd.DataFrame()
+        self._distribution_buffer: List[Dict] = []
+        self._distribution_buffer_limit = 4096
 
     async def distribute_revenue(self, revenue: Dict) -> Dict:
         """Distribute collected revenue according to configuration"""
@@ -36,23 +75,51 @@ class RevenueDistributor:
             print(f"Error distributing revenue: {e}")
             raise
 
-    def _calculate_distribution(self, total_amount: float) -> Dict:
-        """Calculate distribution amounts for each stakeholder"""
-        return {
-            "treasury": total_amount * self.config.treasury_share,
-            "staking": total_amount * self.config.staking_share,
-            "team": total_amount * self.config.team_share,
-            "community": total_amount * self.config.community_share
-        }
+    @property
+    def distribution_history(self) -> pd.DataFrame:
+        self._flush_distribution_history()
+        return self._distribution_frame
+
+    def _flush_distribution_history(self) -> None:
+        if self._distribution_buffer:
+            self._distribution_frame = pd.concat(
+                [self._distribution_frame, pd.DataFrame(self._distribution_buffer)],
+                ignore_index=True
+            )
+            self._distribution_buffer.clear()
+
+    async def _update_distribution_history(self,
+                                           distribution: Dict,
+                                           tx_hashes: List[str]) -> None:
+        self._distribution_buffer.append({
+            "timestamp": pd.Timestamp.now(),
+            **distribution,
+            "transactions": tx_hashes
+        })
+        if len(self._distribution_buffer) >= self._distribution_buffer_limit:
+            self._flush_distribution_history()
+
+    def _calculate_distribution(self,
+                                total_amount: Union[float, np.ndarray]) -> Dict:
+        """Calculate distribution amounts for each stakeholder
+
+        Accepts a single amount or an array of amounts; for an array every
+        stakeholder maps to an array of the same length.
+        """
+        amounts = np.asarray(total_amount, dtype=np.float64)
+        split = amounts[..., None] * self._shares
+        return dict(zip(self._share_keys, split.T))
 
     async def process_staking_rewards(self) -> Dict:
         """Process and distribute staking rewards"""
         try:
             pending_rewards = await self._get_pending_staking_rewards()
             
-            # Calculate rewards for each staker
+            # Calculate rewards for each staker, preferring the stake snapshot
+            # the rewards were accrued against
             distributions = self._calculate_staking_distributions(
-                pending_rewards["total"]
+                pending_rewards["total"],
+                pending_rewards.get("stakes", self.stakes)
             )
             
             # Process distributions
@@ -67,6 +134,21 @@ class RevenueDistributor:
             print(f"Error processing staking rewards: {e}")
             raise
 
+    def update_stakes(self, stakes: Dict[str, float]) -> None:
+        """Replace the stake per staker address used for reward splits"""
+        self.stakes = dict(stakes)
+
+    def _calculate_staking_distributions(self,
+                                         total: float,
+                                         stakes: Dict[str, float]) -> Dict[str, float]:
+        """Apportion total rewards across stakers by stake"""
+        addresses = list(stakes)
+        stake_vec = np.fromiter(
+            stakes.values(), dtype=np.float64, count=len(addresses)
+        )
+        rewards = _apportion(stake_vec, float(total))
+        return dict(zip(addresses, rewards.tolist()))
+
     async def get_distribution_metrics(self) -> Dict:
         """Get metrics about revenue distribution"""
         return {
@@ -78,12 +160,17 @@ class RevenueDistributor:
 
     async def _distribute_staking_rewards(self, distributions: Dict) -> List[str]:
         """Process the actual distribution of staking rewards"""
-        tx_hashes = []
-        for address, amount in distributions.items():
-            try:
-                tx_hash = await self._send_reward(address, amount)
-                tx_hashes.append(tx_hash)
-            except Exception as e:
-                print(f"Error distributing to {address}: {e}")
-                continue
-        return tx_hashes
\ No newline at end of file
+        limit = asyncio.Semaphore(self.max_concurrent_requests)
+
+        async def send(address: str, amount: float) -> Optional[str]:
+            async with limit:
+                try:
+                    return await self._send_reward(address, amount)
+                except Exception as e:
+                    print(f"Error distributing to {address}: {e}")
+                    return None
+
+        results = await asyncio.gather(
+            *(send(address, amount) for address, amount in distributions.items())
+        )
+        return [tx_hash for tx_hash in results if tx_hash is not None]
\ No newline at end of file
@@ -1,9 +1,9 @@
 from dataclasses import dataclass
-from typing import Dict, List, Optional
-from decimal import Decimal
+from typing import Dict, List, Optional, Union
+import numpy as np
 import pandas as pd
 
-@dataclass
+@dataclass(slots=True)
 class FeeConfig:
     trading_fee: float
     protocol_fee: float
@@ -12,10 +12,30 @@ class FeeConfig:
     minimum_fee: float
 
 class FeeCollector:
+    __slots__ = (
+        "config", "_fee_keys", "_fee_coeffs", "collected_fees",
+        "_fee_frame", "_fee_buffer", "_fee_buffer_limit"
+    )
+
     def __init__(self, config: FeeConfig):
         self.config = config
+        # Each fee component is a fixed multiple of the base fee
+        self._fee_keys = (
+            "trading_fee", "protocol_fee", "staking_fee", "burn_amount", "total"
+        )
+        self._fee_coeffs = np.array([
+            1 - config.protocol_fee,
+            config.protocol_fee,
+            config.staking_fee,
+            config.burn_rate,
+            1.0
+        ], dtype=np.float64)
         self.collected_fees = {}
-        self.fee_history = pd.DataFrame()
+        # New rows are buffered and concatenated in chunks; appending to
+        # the frame one row at a time would copy it on every fee
+        self._fee_frame = pd.DataFrame()
+        self._fee_buffer: List[Dict] = []
+        self._fee_buffer_limit = 4096
 
     async def collect_fees(self, transaction: Dict) -> Dict:
         """Collect fees from a transaction"""
@@ -26,31 +46,87 @@ class FeeCollector:
             )
             
             await self._process_fees(fee_breakdown)
-            await self._update_fee_history(fee_breakdown)
+            await self._update_fee_history(fee_breakdown, transaction["type"])
             
             return fee_breakdown
         except Exception as e:
             print(f"Error collecting fees: {e}")
             raise
 
-    def _calculate_fees(self, amount: float, tx_type: str) -> Dict:
-        """Calculate fee breakdown based on transaction type"""
-        base_fee = max(amount * self.config.trading_fee, self.config.minimum_fee)
-        
-        return {
-            "trading_fee": base_fee * (1 - self.config.protocol_fee),
-            "protocol_fee": base_fee * self.config.protocol_fee,
-            "staking_fee": base_fee * self.config.staking_fee,
-            "burn_amount": base_fee * self.config.burn_rate,
-            "total": base_fee
-        }
+    def _calculate_fees(self,
+                        amount: Union[float, np.ndarray],
+                        tx_type: str) -> Dict:
+        """Calculate fee breakdown based on transaction type
+
+        Accepts a single amount or an array of amounts; for an array every
+        component maps to an array of the same length.
+        """
+        base_fee = np.maximum(
+            np.asarray(amount, dtype=np.float64) * self.config.trading_fee,
+            self.config.minimum_fee
+        )
+        breakdown = base_fee[..., None] * self._fee_coeffs
+        return dict(zip(self._fee_keys, breakdown.T))
+
+    @property
+    def fee_history(self) -> pd.DataFrame:
+        self._flush_fee_history()
+        return self._fee_frame
+
+    def _flush_fee_history(self) -> None:
+        if self._fee_buffer:
+            self._fee_frame = pd.concat(
+                [self._fee_frame, pd.DataFrame(self._fee_buffer)],
+                ignore_index=True
+            )
+            self._fee_buffer.clear()
+
+    async def _update_fee_history(self, fee_breakdown: Dict, tx_type: str) -> None:
+        self._fee_buffer.append(
+            {"timestamp": pd.Timestamp.now(), "type": tx_type, **fee_breakdown}
+        )
+        if len(self._fee_buffer) >= self._fee_buffer_limit:
+            self._flush_fee_history()
+
+    def _filter_fee_history(self, timeframe: str) -> pd.DataFrame:
+        """Fee history rows recorded within the timeframe, e.g. '24h'"""
+        history = self.fee_history
+        if history.empty:
+            return history
+        cutoff = pd.Timestamp.now() - pd.Timedelta(timeframe)
+        return history[history["timestamp"] >= cutoff]
 
     async def get_fee_statistics(self, timeframe: str = "24h") -> Dict:
         """Get fee collection statistics for a timeframe"""
         filtered_history = self._filter_fee_history(timeframe)
         
+        if filtered_history.empty:
+            return {
+                "total_collected": 0.0,
+                "by_type": pd.DataFrame(),
+                "trends": pd.DataFrame()
+            }
+
         return {
             "total_collected": filtered_history["total"].sum(),
             "by_type": self._group_fees_by_type(filtered_history),
             "trends": self._analyze_fee_trends(filtered_history)
         }
+
+    def _group_fees_by_type(self, history: pd.DataFrame) -> pd.DataFrame:
+        """Per transaction type sum of every fee component"""
+        # String aggregations keep pandas on its compiled groupby kernels
+        return history.groupby("type", sort=False, observed=True)[
+            list(self._fee_keys)
+        ].sum()
+
+    def _analyze_fee_trends(self,
+                            history: pd.DataFrame,
+                            freq: str = "1h") -> pd.DataFrame:
+        """Total fees per period: sum, mean and transaction count"""
+        return (
+            history.set_index("timestamp")
+            .sort_index()
+            .resample(freq)["total"]
+            .agg(["sum", "mean", "count"])
+        )
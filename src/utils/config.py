@@ -1,6 +1,9 @@
 import yaml
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
+
+# libyaml's C loader when PyYAML was built with it
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 class Config:
@@ -9,29 +12,43 @@ class Config:
     def __init__(self, config_dir: str = "config"):
         self.config_dir = Path(config_dir)
         self.settings: Dict[str, Any] = {}
+        # Every dotted key path mapped to its value, so get() is one lookup
+        self._flat: Dict[str, Any] = {}
+        # (mtime_ns, size) of each file as last parsed
+        self._file_stats: Dict[Path, Tuple[int, int]] = {}
         self.load_configs()
 
     def load_configs(self):
         """Load all configuration files from the config directory."""
         for config_file in self.config_dir.glob("*.yaml"):
+            st = config_file.stat()
+            stats = (st.st_mtime_ns, st.st_size)
+            if self._file_stats.get(config_file) == stats:
+                continue
             with open(config_file, "r") as f:
-                self.settings[config_file.stem] = yaml.safe_load(f)
-
-    def get(self, key: str, default: Any = None) -> Any:
-        """Get a configuration value using dot notation."""
-        keys = key.split(".")
-        value = self.settings
+                self.settings[config_file.stem] = yaml.load(f, Loader=_SafeLoader)
+            self._file_stats[config_file] = stats
+            self._reindex(config_file.stem)
 
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-            else:
-                return default
+    def _reindex(self, section: str):
+        """Rebuild the dotted-key index for one top-level section."""
+        stale = [k for k in self._flat if k == section or k.startswith(f"{section}.")]
+        for k in stale:
+            del self._flat[k]
+        self._flatten("", {section: self.settings[section]})
 
-            if value is None:
-                return default
+    def _flatten(self, prefix: str, node: Dict[str, Any]):
+        """Index every value under node by its dotted key path."""
+        for k, v in node.items():
+            path = f"{prefix}{k}"
+            self._flat[path] = v
+            if isinstance(v, dict):
+                self._flatten(f"{path}.", v)
 
-        return value
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a configuration value using dot notation."""
+        value = self._flat.get(key)
+        return default if value is None else value
 
     def set(self, key: str, value: Any):
         """Set a configuration value using dot notation."""
@@ -43,6 +60,11 @@ class Config:
 
         target[keys[-1]] = value
 
+        section = keys[0]
+        self._reindex(section)
+        # The next load_configs re-reads this file rather than keeping the edit
+        self._file_stats.pop(self.config_dir / f"{section}.yaml", None)
+
     def save(self):
         """Save current configuration to files."""
         for config_name, config_data in self.settings.items():
@@ -1,42 +1,63 @@
-from typing import Any, Dict, Optional
-import redis
-from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Optional, Tuple
+import redis.asyncio as aioredis
+from contextlib import asynccontextmanager
 
 
 class Database:
     """Database operations wrapper supporting both Redis and future expansions."""
 
     def __init__(self, redis_url: str):
-        self.redis = redis.from_url(redis_url)
+        self.redis = aioredis.from_url(redis_url)
 
-    def set(self, key: str, value: Any, expire: Optional[int] = None):
+    async def set(self, key: str, value: Any, expire: Optional[int] = None):
         """Set a key-value pair with optional expiration."""
-        self.redis.set(key, value, ex=expire)
+        await self.redis.set(key, value, ex=expire)
 
-    def get(self, key: str) -> Optional[str]:
+    async def get(self, key: str) -> Optional[str]:
         """Get value for a key."""
-        return self.redis.get(key)
+        return await self.redis.get(key)
 
-    def delete(self, key: str):
+    async def delete(self, key: str):
         """Delete a key."""
-        self.redis.delete(key)
+        await self.redis.delete(key)
 
-    @contextmanager
-    def lock(self, lock_name: str, expire: int = 60):
+    @asynccontextmanager
+    async def lock(self, lock_name: str, expire: int = 60):
         """Distributed lock implementation."""
         lock = self.redis.lock(f"lock:{lock_name}", timeout=expire)
         try:
-            lock.acquire()
+            await lock.acquire()
             yield
         finally:
-            lock.release()
+            await lock.release()
 
-    def store_memory(self, key: str, memory: Dict[str, Any], ttl: Optional[int] = None):
+    async def store_memory(self, key: str, memory: Dict[str, Any], ttl: Optional[int] = None):
         """Store agent memory with optional TTL."""
-        self.redis.hmset(f"memory:{key}", memory)
-        if ttl:
-            self.redis.expire(f"memory:{key}", ttl)
-
-    def get_memory(self, key: str) -> Dict[str, Any]:
+        await self.store_memory_many({key: (memory, ttl)})
+
+    async def store_memory_many(
+        self, items: Dict[str, Tuple[Dict[str, Any], Optional[int]]]
+    ):
+        """Store several memories, each with optional TTL, in one round trip."""
+        pipe = self.redis.pipeline(transaction=False)
+        for key, (memory, ttl) in items.items():
+            pipe.hset(f"memory:{key}", mapping=memory)
+            if ttl:
+                pipe.expire(f"memory:{key}", ttl)
+        await pipe.execute()
+
+    async def get_memory(self, key: str) -> Dict[str, Any]:
         """Retrieve agent memory."""
-        return self.redis.hgetall(f"memory:{key}")
+        return await self.redis.hgetall(f"memory:{key}")
+
+    async def get_memory_many(self, keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Retrieve several memories in one round trip."""
+        keys = list(keys)
+        pipe = self.redis.pipeline(transaction=False)
+        for key in keys:
+            pipe.hgetall(f"memory:{key}")
+        return dict(zip(keys, await pipe.execute()))
+
+    async def close(self):
+        """Close the connection pool."""
+        await self.redis.aclose()
@@ -1,7 +1,6 @@
 import logging
-import traceback
+import time
 from typing import Optional, Dict, Any
-from datetime import datetime
 import asyncio
 
 from .errors import BaseError
@@ -9,6 +8,10 @@ from .errors import BaseError
 logger = logging.getLogger(__name__)
 
 class ErrorHandler:
+    __slots__ = (
+        'config', 'error_counts', 'last_errors', 'max_retries', 'cooldown_period'
+    )
+
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.error_counts = {}
@@ -28,14 +31,14 @@ class ErrorHandler:
             self._log_error(error, context)
             
             # Update error tracking
-            await self._track_error(error_type)
+            self._track_error(error_type)
             
             # Handle retries if function provided
-            if retry_function and await self._should_retry(error_type):
+            if retry_function and self._should_retry(error_type):
                 await self._retry_operation(retry_function)
             
             # Cleanup if needed
-            await self._error_cleanup(error)
+            self._error_cleanup(error)
             
         except Exception as e:
             logger.error(f"Error in error handler: {e}")
@@ -45,19 +48,17 @@ class ErrorHandler:
 
     def _log_error(self, error: Exception, context: Optional[Dict] = None) -> None:
         """Log error with full context"""
-        error_info = {
-            'error_type': type(error).__name__,
-            'error_message': str(error),
-            'timestamp': datetime.now().isoformat(),
-            'traceback': traceback.format_exc(),
-            'context': context
-        }
-        
-        logger.error(f"Error occurred: {error_info}")
+        # The record carries the exception itself; handlers format the
+        # message and traceback only if they emit it
+        logger.error(
+            "Error occurred: type=%s message=%s context=%r",
+            type(error).__name__, error, context,
+            exc_info=error
+        )
 
-    async def _track_error(self, error_type: str) -> None:
+    def _track_error(self, error_type: str) -> None:
         """Track error frequency"""
-        current_time = datetime.now()
+        current_time = time.monotonic()
         
         if error_type in self.error_counts:
             self.error_counts[error_type] += 1
@@ -66,7 +67,7 @@ class ErrorHandler:
             
         self.last_errors[error_type] = current_time
 
-    async def _should_retry(self, error_type: str) -> bool:
+    def _should_retry(self, error_type: str) -> bool:
         """Determine if operation should be retried"""
         if error_type not in self.error_counts:
             return True
@@ -85,7 +86,7 @@ class ErrorHandler:
         except Exception as e:
             logger.error(f"Retry failed: {e}")
 
-    async def _error_cleanup(self, error: Exception) -> None:
+    def _error_cleanup(self, error: Exception) -> None:
         """Perform any necessary cleanup after error"""
         try:
             # Add cleanup logic specific to error type
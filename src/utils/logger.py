@@ -1,7 +1,15 @@
+import atexit
 import logging
+import queue
 import sys
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+
+def _stop_listener(listener: QueueListener) -> None:
+    """Flush and stop a listener unless it was already stopped"""
+    if listener._thread is not None:
+        listener.stop()
 
 
 def setup_logger(name: str, log_dir: str = "logs", level=logging.INFO):
@@ -29,8 +37,15 @@ def setup_logger(name: str, log_dir: str = "logs", level=logging.INFO):
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(console_formatter)
 
-    # Add handlers
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # Callers only enqueue records; a listener thread does the file and
+    # console writes
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(_stop_listener, listener)
+    logger.log_listener = listener
+    logger.addHandler(QueueHandler(log_queue))
 
     return logger
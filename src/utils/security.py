@@ -6,13 +6,43 @@ from datetime import datetime
 import hashlib
 import hmac
 import json
+import secrets
+import time
 
+import orjson
 
 from .errors import SecurityError
 
 logger = logging.getLogger(__name__)
 
+_SENSITIVE_FIELDS = frozenset({
+    'private_key', 'secret', 'password', 'key', 'api_key', 'token', 'mnemonic'
+})
+
+_SIGN_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+
+def _canonical_json(data: Dict) -> bytes:
+    """Sorted, compact JSON bytes to sign.
+
+    Payloads orjson rejects, such as integers beyond 64 bits, are
+    serialized by the json module in the same sorted, compact layout. A
+    given payload always takes the same path, so its signature is stable.
+    """
+    try:
+        return orjson.dumps(data, option=_SIGN_OPTIONS)
+    except TypeError:
+        return json.dumps(
+            data, sort_keys=True, separators=(',', ':'), ensure_ascii=False
+        ).encode()
+
+
 class SecurityService:
+    __slots__ = (
+        'config', '_initialized', 'max_retries', 'error_cooldown',
+        '_error_counts', '_last_errors', '_hmac_template'
+    )
+
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self._initialized = False
@@ -20,6 +50,10 @@ class SecurityService:
         self.error_cooldown = config.get('error_cooldown', 5)
         self._error_counts = {}
         self._last_errors = {}
+        # Keyed HMAC state is set up once; each signature works on a copy
+        self._hmac_template = hmac.new(
+            config.get('signing_key', 'default_key').encode(), None, hashlib.sha256
+        )
         
     async def initialize(self) -> None:
         """Initialize the security service"""
@@ -33,14 +67,23 @@ class SecurityService:
 
     async def verify_data_sources(self, sources: List[Any]) -> bool:
         """Verify the integrity and authenticity of data sources"""
+        # All checks run at once; the first failure cancels the rest
+        tasks = [
+            asyncio.create_task(self._verify_single_source(source))
+            for source in sources
+        ]
         try:
-            for source in sources:
-                if not await self._verify_single_source(source):
+            for verified in asyncio.as_completed(tasks):
+                if not await verified:
                     return False
             return True
         except Exception as e:
             logger.error(f"Data source verification failed: {e}")
             return False
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
     async def _verify_single_source(self, source: Any) -> bool:
         """Verify a single data source"""
@@ -77,7 +120,7 @@ class SecurityService:
     async def handle_analysis_error(self, error: Exception) -> None:
         """Handle analysis-related errors with rate limiting"""
         error_type = type(error).__name__
-        current_time = datetime.now()
+        current_time = time.monotonic()
         
         if error_type in self._error_counts:
             self._error_counts[error_type] += 1
@@ -85,8 +128,8 @@ class SecurityService:
             # Check if we need to cool down
             if self._error_counts[error_type] >= self.max_retries:
                 last_error_time = self._last_errors.get(error_type)
-                if last_error_time:
-                    time_diff = (current_time - last_error_time).total_seconds()
+                if last_error_time is not None:
+                    time_diff = current_time - last_error_time
                     if time_diff < self.error_cooldown:
                         await asyncio.sleep(self.error_cooldown - time_diff)
                 
@@ -100,16 +143,14 @@ class SecurityService:
 
     def _generate_session_id(self) -> str:
         """Generate a unique session ID"""
-        return hashlib.sha256(
-            f"{datetime.now().isoformat()}-{id(self)}".encode()
-        ).hexdigest()
+        return secrets.token_hex(16)
 
     def _sign_data(self, data: Dict) -> str:
         """Sign data with HMAC"""
         try:
-            key = self.config.get('signing_key', 'default_key').encode()
-            message = json.dumps(data, sort_keys=True).encode()
-            return hmac.new(key, message, hashlib.sha256).hexdigest()
+            signer = self._hmac_template.copy()
+            signer.update(_canonical_json(data))
+            return signer.hexdigest()
         except Exception as e:
             logger.error(f"Data signing failed: {e}")
             raise SecurityError(f"Data signing failed: {e}")
@@ -117,9 +158,8 @@ class SecurityService:
     def _sanitize_data(self, data: Dict) -> Dict:
         """Remove sensitive information from data"""
         try:
-            sensitive_fields = ['private_key', 'secret', 'password', 'key']
             return {
-                k: '***' if k in sensitive_fields else v
+                k: '***' if k in _SENSITIVE_FIELDS else v
                 for k, v in data.items()
             }
         except Exception as e:
@@ -0,0 +1,29 @@
+import pytest
+
+from dealflow.evaluation.team_analysis import TeamAnalyzer, TeamMember
+
+
+def _member(role: str, score: float) -> TeamMember:
+    return TeamMember(
+        name=role, role=role, experience=[], github="", linkedin="", score=score
+    )
+
+
+@pytest.mark.asyncio
+async def test_team_score_takes_best_member_per_category():
+    team = [
+        _member("CTO", 0.6),
+        _member("Engineer", 0.9),
+        _member("founder", 0.5),
+        _member("Designer", 0.7),
+        _member("intern", 0.8),  # unknown roles count as business
+    ]
+    score = await TeamAnalyzer().calculate_team_score(team)
+    assert score == pytest.approx(0.9 * 0.4 + 0.8 * 0.3 + 0.7 * 0.3)
+
+
+@pytest.mark.asyncio
+async def test_team_score_keeps_negative_best_and_zero_for_empty():
+    team = [_member("cto", -0.5), _member("developer", -0.2)]
+    score = await TeamAnalyzer().calculate_team_score(team)
+    assert score == pytest.approx(-0.2 * 0.4)
@@ -0,0 +1,22 @@
+import pandas as pd
+
+from dealflow.sourcing.project_scanner import ProjectScanner
+
+
+def test_projects_on_chains_returns_mask():
+    scanner = ProjectScanner({})
+    scanner.scanned_projects = pd.DataFrame(
+        {
+            "name": ["a", "b", "c", "d"],
+            "chains": [["solana"], ["solana", "ethereum"], [], ["ethereum"]],
+        }
+    )
+    scanner.chain_matrix = scanner._build_chain_matrix(scanner.scanned_projects)
+
+    mask = scanner.projects_on_chains(["solana", "ethereum"])
+
+    assert isinstance(mask, pd.Series)
+    assert mask.tolist() == [False, True, False, False]
+    assert scanner.projects_on_chains(["solana"]).tolist() == [True, True, False, False]
+    assert not scanner.projects_on_chains(["base"]).any()
+    assert scanner.projects_on_chains([]).all()
@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from investment.analysis.technical_analysis import HISTORY_DTYPE, SentimentAnalyzer
+
+
+class _Analyzer(SentimentAnalyzer):
+    def _load_nlp_model(self):
+        return None
+
+
+def _history(scores, start=1_700_000_000.0, step=600.0) -> np.ndarray:
+    history = np.empty(len(scores), dtype=HISTORY_DTYPE)
+    history["t"] = start + step * np.arange(len(scores))
+    history["s"] = scores
+    return history
+
+
+def test_resample_history_matches_pandas():
+    history = _history(np.random.default_rng(0).normal(size=500))
+
+    resampled = _Analyzer()._resample_history(history, "1h")
+
+    expected = (
+        pd.Series(history["s"], index=pd.to_datetime(history["t"], unit="s"))
+        .resample("1h")
+        .mean()
+        .dropna()
+    )
+    assert resampled.dtype == HISTORY_DTYPE
+    np.testing.assert_allclose(resampled["s"], expected.to_numpy())
+    np.testing.assert_allclose(
+        resampled["t"], expected.index.to_numpy("datetime64[s]").astype(np.float64)
+    )
+
+
+@pytest.mark.asyncio
+async def test_sentiment_trends_read_token_ring_buffer():
+    analyzer = _Analyzer(max_history=100)
+    scores = np.zeros(150)
+    scores[140] = 10.0
+    analyzer.sentiment_history["SOL"].extend(zip(_history(scores)["t"], scores))
+    analyzer.sentiment_history["ETH"].append((1_700_000_000.0, -1.0))
+
+    trends = await analyzer.analyze_sentiment_trends("SOL", "10m")
+
+    assert len(analyzer.sentiment_history["SOL"]) == 100
+    assert trends["extremes"]["max"]["score"] == 10.0
+    assert [a["score"] for a in trends["anomalies"]] == [10.0]
+    assert trends["sentiment_change"] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_sentiment_trends_for_unknown_token():
+    trends = await _Analyzer().analyze_sentiment_trends("BONK", "1d")
+    assert trends == {
+        "sentiment_change": 0.0,
+        "volatility": 0.0,
+        "momentum": 0.0,
+        "extremes": {},
+    }
+
+
+@pytest.mark.parametrize("timeframe", ["", "1y", "xh", "0d", "-1h"])
+def test_resample_history_rejects_bad_timeframe(timeframe):
+    with pytest.raises(ValueError, match="Invalid timeframe"):
+        _Analyzer()._resample_history(_history([1.0]), timeframe)
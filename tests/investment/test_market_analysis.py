@@ -0,0 +1,51 @@
+import asyncio
+
+import aiohttp
+import pytest
+from tenacity import wait_none
+
+from investment.analysis import market_analysis
+
+
+def test_session_is_per_event_loop():
+    async def open_session():
+        session = await market_analysis.get_session()
+        assert await market_analysis.get_session() is session
+        await market_analysis.close_session()
+        return session
+
+    first = asyncio.run(open_session())
+    second = asyncio.run(open_session())
+
+    assert first is not second
+    assert first.closed and second.closed
+
+
+class _FailingSession:
+    def __init__(self):
+        self.calls = 0
+
+    def get(self, *args, **kwargs):
+        self.calls += 1
+        raise aiohttp.ClientConnectionError("connection refused")
+
+
+class _Analyzer(market_analysis.MarketAnalyzer):
+    def __init__(self, session):
+        super().__init__()
+        self._session = session
+
+    @property
+    async def session(self):
+        return self._session
+
+
+@pytest.mark.asyncio
+async def test_exhausted_retries_reraise_the_network_error():
+    session = _FailingSession()
+    fetch = market_analysis.MarketAnalyzer._fetch_price.retry_with(wait=wait_none())
+
+    with pytest.raises(aiohttp.ClientConnectionError):
+        await fetch(_Analyzer(session), "solana")
+
+    assert session.calls == 3
@@ -0,0 +1,119 @@
+import asyncio
+
+import numpy as np
+import pandas as pd
+import pytest
+from cachetools import TTLCache
+
+from investment.portfolio.allocation import AllocationStrategy, PortfolioAllocator
+from investment.portfolio.performance import (
+    PortfolioPerformance,
+    _drawdowns,
+    calculate_portfolio_value,
+)
+from investment.portfolio.rebalancing import PortfolioRebalancer, RebalanceConfig
+from investment.portfolio.risk_management import RiskManager, _portfolio_stats
+
+
+def test_portfolio_value_is_shared():
+    positions = {"SOL": 2.0, "ETH": 0.5}
+    prices = {"SOL": 150.0, "ETH": 3000.0, "BTC": 60000.0}
+    assert calculate_portfolio_value(positions, prices) == pytest.approx(1800.0)
+    assert calculate_portfolio_value({}, prices) == 0.0
+
+
+def test_performance_history_flushes_buffered_rows():
+    performance = PortfolioPerformance(history_batch_size=4)
+    for value in (100.0, 110.0, 99.0):
+        performance._history_buffer.append({"portfolio_value": value})
+
+    history = performance.performance_history
+
+    assert isinstance(history, pd.DataFrame)
+    assert history["portfolio_value"].tolist() == [100.0, 110.0, 99.0]
+    assert performance._history_buffer == []
+    # Returns read the last value whether it is buffered or flushed
+    assert performance._calculate_returns(108.9) == pytest.approx(0.1)
+
+
+def test_weights_are_value_weights_and_not_shared():
+    allocator = PortfolioAllocator(AllocationStrategy({}, 0.05, 1.0, 0.0))
+    positions = {"SOL": 2.0, "ETH": 1.0}
+    prices = {"SOL": 100.0, "ETH": 200.0}
+
+    first = allocator._calculate_weights(positions, prices)
+    first["SOL"] = 1.0
+    assert allocator._calculate_weights(positions, prices) == {"SOL": 0.5, "ETH": 0.5}
+
+    rebalancer = PortfolioRebalancer(RebalanceConfig(0.05, 0.1, 1.0, {"SOL": 1.0}))
+    assert rebalancer._calculate_weights(positions, prices) == {"SOL": 0.5, "ETH": 0.5}
+
+
+@pytest.mark.asyncio
+async def test_rebalance_trades_use_value_weights():
+    rebalancer = PortfolioRebalancer(
+        RebalanceConfig(0.05, 0.1, 1.0, {"SOL": 0.75, "ETH": 0.25})
+    )
+    positions = {"SOL": 2.0, "ETH": 1.0}
+    prices = {"SOL": 100.0, "ETH": 200.0}
+
+    assert await rebalancer.check_rebalance_needed(positions, prices)
+
+    # 400 of value split 200/200; SOL goes to 300 and ETH to 100
+    weights = rebalancer._calculate_weights(positions, prices)
+    buy = rebalancer._calculate_trade("SOL", weights["SOL"], 0.75, 400.0, prices)
+    sell = rebalancer._calculate_trade("ETH", weights["ETH"], 0.25, 400.0, prices)
+
+    assert (buy["side"], buy["amount"]) == ("buy", pytest.approx(1.0))
+    assert (sell["side"], sell["amount"]) == ("sell", pytest.approx(0.5))
+
+
+def test_drawdowns_match_pandas_and_skip_nan():
+    returns = pd.Series(np.random.default_rng(0).normal(0, 0.02, 300))
+    returns[[0, 50, 51, 299]] = np.nan
+
+    cumulative = (1 + returns).cumprod()
+    expected = cumulative / cumulative.expanding(min_periods=1).max() - 1
+
+    drawdowns = _drawdowns(returns.to_numpy())
+    np.testing.assert_allclose(drawdowns, expected.to_numpy(), equal_nan=True)
+    assert not np.isnan(drawdowns[52:299]).any()
+
+    summary = PortfolioPerformance()._calculate_drawdown(returns)
+    assert summary["max_drawdown"] == pytest.approx(expected.min())
+    assert summary["avg_drawdown"] == pytest.approx(expected.mean())
+
+
+def test_portfolio_stats():
+    returns = np.random.default_rng(1).normal(0, 0.03, 500)
+
+    volatility, var, shortfall = _portfolio_stats(returns, 0.95)
+
+    tail = np.sort(returns)[: int(0.05 * 500) + 1]
+    assert volatility == pytest.approx(returns.std(ddof=1) * np.sqrt(365))
+    assert var == pytest.approx(tail[-1])
+    assert shortfall == pytest.approx(tail.mean())
+    assert all(np.isnan(_portfolio_stats(np.empty(0), 0.95)))
+
+
+@pytest.mark.asyncio
+async def test_cached_lookup_fetches_once_and_releases_locks():
+    manager = RiskManager({})
+    cache = TTLCache(maxsize=8, ttl=60)
+    calls = []
+
+    async def fetch(token: str) -> float:
+        calls.append(token)
+        await asyncio.sleep(0)
+        return 0.5
+
+    results = await asyncio.gather(
+        *(
+            manager._cached_lookup("volatility", cache, token, fetch)
+            for token in ["SOL", "ETH"] * 5
+        )
+    )
+
+    assert results == [0.5] * 10
+    assert sorted(calls) == ["ETH", "SOL"]
+    assert manager._lookup_locks == {}
@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from investment.strategy.signals import _ema, _wilder_mean
+
+
+def _with_gap(n=120, seed=0):
+    values = np.random.default_rng(seed).normal(100.0, 5.0, n)
+    values[[30, 31, 32, 77]] = np.nan
+    return values
+
+
+@pytest.mark.parametrize("span", [3, 12, 26])
+def test_ema_skips_nan_like_pandas(span):
+    values = _with_gap()
+    values[0] = np.nan
+
+    expected = pd.Series(values).ewm(span=span, adjust=True, ignore_na=False).mean()
+
+    np.testing.assert_allclose(_ema(values, span), expected.to_numpy(), equal_nan=True)
+
+
+@pytest.mark.parametrize("period", [5, 14])
+def test_wilder_mean_skips_nan_like_pandas(period):
+    values = _with_gap()
+
+    smoothed = _wilder_mean(values, period)
+
+    assert np.isnan(smoothed[:period]).all()
+    seeded = pd.Series(values[period:])
+    seeded[0] = values[1 : period + 1].mean()
+    expected = seeded.ewm(alpha=1.0 / period, adjust=False, ignore_na=False).mean()
+    np.testing.assert_allclose(smoothed[period:], expected.to_numpy())
@@ -0,0 +1,39 @@
+import orjson
+import pandas as pd
+
+from personality.traits import TraitManager
+
+
+def test_history_is_bounded_and_exported_as_frame():
+    manager = TraitManager(max_history=3)
+    for value in (0.1, 0.2, 0.3, 0.4):
+        assert manager.update_trait("analytical_thinking", value, "test")
+
+    history = manager.history_df()
+
+    assert isinstance(history, pd.DataFrame)
+    assert history["new_value"].tolist() == [0.2, 0.3, 0.4]
+    assert list(history.columns) == [
+        "trait",
+        "old_value",
+        "new_value",
+        "reason",
+        "timestamp",
+    ]
+    assert TraitManager().history_df().empty
+
+
+def test_dumps_summary_returns_json_bytes():
+    manager = TraitManager()
+
+    payload = manager.dumps_summary()
+
+    assert isinstance(payload, bytes)
+    summary = orjson.loads(payload)
+    assert summary["traits"]["analytical_thinking"]["value"] == 0.8
+    assert set(summary["categories"]) == {
+        "cognitive",
+        "operational",
+        "social",
+        "ethical",
+    }
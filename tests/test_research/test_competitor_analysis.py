@@ -0,0 +1,20 @@
+import pytest
+
+from research.market_research.competitor_analysis import CompetitorAnalyzer, Competitor
+
+
+def _competitor(name, tvl, volume):
+    return Competitor(name, name.upper(), tvl, volume, 0, [], {})
+
+
+def test_market_share_splits_totals():
+    analyzer = CompetitorAnalyzer()
+    analyzer._store_competitor(_competitor("a", 30.0, 0.0))
+    analyzer._store_competitor(_competitor("b", 10.0, 0.0))
+
+    shares = analyzer._calculate_market_share()
+
+    assert shares["a"]["tvl_share"] == pytest.approx(75.0)
+    assert shares["b"]["tvl_share"] == pytest.approx(25.0)
+    # A zero total gives zero shares, not NaN
+    assert shares["a"]["volume_share"] == shares["b"]["volume_share"] == 0.0
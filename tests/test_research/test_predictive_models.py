@@ -0,0 +1,128 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("xgboost")
+
+from research.data_analysis.predictive_models import PredictiveModels, _rolling_mean_std
+
+
+@pytest.fixture
+def models():
+    # The indicator helpers need no estimators, so skip building them
+    return object.__new__(PredictiveModels)
+
+
+def _pandas_macd(close: np.ndarray) -> np.ndarray:
+    s = pd.Series(close)
+    fast = s.ewm(span=12, adjust=True, ignore_na=False).mean()
+    slow = s.ewm(span=26, adjust=True, ignore_na=False).mean()
+    return (fast - slow).to_numpy()
+
+
+def test_macd_matches_pandas_ewm(models):
+    close = 100 + np.random.default_rng(0).standard_normal(500).cumsum()
+    macd = models._calculate_macd(pd.Series(close))
+    np.testing.assert_allclose(macd.to_numpy(), _pandas_macd(close))
+
+
+def test_macd_skips_nan_closes(models):
+    close = 100 + np.random.default_rng(1).standard_normal(500).cumsum()
+    close[:3] = np.nan
+    close[100] = np.nan
+    close[250:253] = np.nan
+
+    macd = models._calculate_macd(pd.Series(close)).to_numpy()
+
+    # Only the leading gap stays NaN; later gaps must not poison the EMAs
+    assert np.isnan(macd[:3]).all()
+    assert not np.isnan(macd[3:]).any()
+    np.testing.assert_allclose(macd, _pandas_macd(close), equal_nan=True)
+
+
+def test_rsi_matches_wilder_smoothing(models):
+    close = 100 + np.random.default_rng(2).standard_normal(200).cumsum()
+    period = 14
+    deltas = np.diff(close)
+    gains = np.clip(deltas, 0, None)
+    losses = np.clip(-deltas, 0, None)
+
+    expected = np.full(close.shape, np.nan)
+    avg_gain = gains[:period].mean()
+    avg_loss = losses[:period].mean()
+    expected[period] = 100 - 100 / (1 + avg_gain / avg_loss)
+    for i in range(period + 1, close.shape[0]):
+        avg_gain = (avg_gain * (period - 1) + gains[i - 1]) / period
+        avg_loss = (avg_loss * (period - 1) + losses[i - 1]) / period
+        expected[i] = 100 - 100 / (1 + avg_gain / avg_loss)
+
+    rsi = models._calculate_rsi(pd.Series(close), period)
+    np.testing.assert_allclose(rsi.to_numpy(), expected, equal_nan=True)
+
+
+def test_rolling_mean_std_matches_pandas_with_gap():
+    values = 100 + np.random.default_rng(3).standard_normal(300).cumsum()
+    values[120] = np.nan
+
+    mean, std = _rolling_mean_std(values, 20)
+
+    rolling = pd.Series(values).rolling(20)
+    np.testing.assert_allclose(mean, rolling.mean().to_numpy(), equal_nan=True)
+    np.testing.assert_allclose(std, rolling.std().to_numpy(), equal_nan=True)
+
+
+class _Broken:
+    def get_params(self, deep=True):
+        return {}
+
+    def fit(self, X, y):
+        raise RuntimeError("fit failed")
+
+
+class _Models(PredictiveModels):
+    def _get_models(self):
+        from sklearn.linear_model import LinearRegression
+
+        return {"linear": LinearRegression(), "broken": _Broken()}
+
+    def _generate_target(self, data):
+        return data["close"].shift(-1).fillna(data["close"].iloc[-1])
+
+
+@pytest.mark.asyncio
+async def test_train_models_raises_the_failed_models(caplog):
+    rng = np.random.default_rng(4)
+    data = pd.DataFrame(
+        {
+            "close": 100 + rng.standard_normal(300).cumsum(),
+            "volume": rng.uniform(1e3, 1e4, 300),
+        }
+    )
+
+    with pytest.raises(ExceptionGroup, match="broken") as excinfo:
+        await _Models().train_models(data)
+
+    assert [str(e) for e in excinfo.value.exceptions] == ["fit failed"]
+    assert "Failed to train broken" in caplog.text
+
+
+def test_cross_validate_fits_single_threaded_folds_in_parallel():
+    from sklearn.ensemble import RandomForestRegressor
+    from sklearn.model_selection import TimeSeriesSplit
+
+    rng = np.random.default_rng(5)
+    X = pd.DataFrame(rng.standard_normal((200, 3)), columns=["a", "b", "c"])
+    y = pd.Series(X["a"] * 2 + rng.standard_normal(200) * 0.1)
+    model = RandomForestRegressor(n_estimators=10, n_jobs=-1, random_state=0)
+
+    metrics, fitted = _Models()._cross_validate(model, X, y)
+
+    expected = []
+    for train_idx, test_idx in TimeSeriesSplit(n_splits=5).split(X):
+        fold = RandomForestRegressor(n_estimators=10, n_jobs=1, random_state=0)
+        fold.fit(X.iloc[train_idx], y.iloc[train_idx])
+        expected.append(
+            np.sqrt(np.mean((fold.predict(X.iloc[test_idx]) - y.iloc[test_idx]) ** 2))
+        )
+    assert metrics["rmse"] == pytest.approx(np.mean(expected))
+    assert fitted.n_jobs == -1 and model.n_jobs == -1
@@ -0,0 +1,94 @@
+import json
+
+import msgspec
+import pytest
+
+from research.reports.report_generator import (
+    ReportConfig,
+    ReportGenerator,
+    _compile_template,
+    _dumps_indent_2,
+)
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        "",
+        "plain text",
+        "{a}",
+        "# Title\n{a} and {b}\n{a}",
+        "{{literal}} {a} '''quotes''' \\n {b}",
+        "{x:.2f} and {a!r}",
+        "{a:>8}|{b!s:<14}|",
+        "{pair[0]} {pair[1]} {x.real}",
+    ],
+)
+def test_compiled_template_matches_str_format(template):
+    sections = {"a": "alpha", "b": "{not a field}", "x": 3.14159, "pair": ("p", "q")}
+    assert _compile_template(template)(sections) == template.format(**sections)
+
+
+def test_compiled_template_raises_on_missing_section():
+    with pytest.raises(KeyError):
+        _compile_template("{a} {b}")({"a": "x"})
+
+
+def test_dumps_indent_2_falls_back_for_big_ints():
+    data = {"supply": 2**70, "nested": {"price": 1.5}}
+    assert _dumps_indent_2(data) == json.dumps(data, indent=2)
+    assert json.loads(_dumps_indent_2({"price": 1.5})) == {"price": 1.5}
+
+
+def test_report_config_round_trips_through_msgspec():
+    config = ReportConfig()
+    decoded = msgspec.json.decode(msgspec.json.encode(config), type=ReportConfig)
+
+    assert decoded == config
+    assert config.formatting["indent"] == 2
+    # Each config owns its formatting dict
+    config.formatting["indent"] = 4
+    assert ReportConfig().formatting["indent"] == 2
+
+
+@pytest.mark.asyncio
+async def test_generate_report_renders_sections_and_summary():
+    generator = ReportGenerator()
+    await generator.initialize()
+
+    report = await generator.generate_report(
+        {
+            "summary": "Strong quarter",
+            "analysis": {"tvl": 10},
+            "findings": ["growth", "risk"],
+            "conclusions": "Hold",
+        }
+    )
+
+    assert '{\n  "tvl": 10\n}' in report["content"]
+    assert "- growth\n- risk" in report["content"]
+    assert report["summary"].splitlines() == [
+        "- # Research Report",
+        "- Executive Summary",
+        "- Analysis",
+        "- Findings",
+        "- Conclusions",
+    ]
+
+    with pytest.raises(KeyError):
+        await generator.generate_report({"summary": "missing sections"})
+
+
+@pytest.mark.asyncio
+async def test_report_history_is_bounded():
+    generator = ReportGenerator(ReportConfig(max_history=2))
+    await generator.initialize()
+
+    for _ in range(3):
+        await generator.generate_report(
+            {"summary": "", "analysis": "", "findings": "", "conclusions": ""}
+        )
+
+    history = await generator.get_report_history()
+    assert len(history) == 2
+    assert await generator.get_report_history(limit=1) == history[-1:]
@@ -0,0 +1,76 @@
+import os
+
+import pytest
+import yaml
+
+from utils.config import Config
+
+
+@pytest.fixture
+def config_dir(tmp_path):
+    (tmp_path / "agent.yaml").write_text(
+        yaml.safe_dump({"name": "omni", "limits": {"rate": 10, "burst": None}})
+    )
+    (tmp_path / "redis.yaml").write_text(yaml.safe_dump({"url": "redis://localhost"}))
+    return tmp_path
+
+
+def test_get_reads_flat_dotted_index(config_dir):
+    config = Config(str(config_dir))
+
+    assert config.get("agent.name") == "omni"
+    assert config.get("agent.limits") == {"rate": 10, "burst": None}
+    assert config.get("agent.limits.rate") == 10
+    assert config.get("redis.url") == "redis://localhost"
+    # Missing keys and explicit nulls both fall back to the default
+    assert config.get("agent.limits.burst", 5) == 5
+    assert config.get("agent.missing.key", "x") == "x"
+
+
+def test_set_reindexes_section(config_dir):
+    config = Config(str(config_dir))
+
+    config.set("agent.limits.rate", 20)
+    config.set("agent.limits.window.seconds", 60)
+    config.set("cache.ttl", 30)
+
+    assert config.get("agent.limits.rate") == 20
+    assert config.get("agent.limits.window") == {"seconds": 60}
+    assert config.get("agent.limits.window.seconds") == 60
+    assert config.get("cache.ttl") == 30
+    assert config.get("agent.name") == "omni"
+
+
+def test_reload_skips_unchanged_files(config_dir, monkeypatch):
+    config = Config(str(config_dir))
+    parsed = []
+    load = yaml.load
+
+    def counting_load(stream, Loader):
+        parsed.append(os.path.basename(stream.name))
+        return load(stream, Loader=Loader)
+
+    monkeypatch.setattr(yaml, "load", counting_load)
+
+    config.load_configs()
+    assert parsed == []
+
+    agent = config_dir / "agent.yaml"
+    agent.write_text(yaml.safe_dump({"name": "renamed"}))
+    stat = agent.stat()
+    os.utime(agent, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    config.load_configs()
+
+    assert parsed == ["agent.yaml"]
+    assert config.get("agent.name") == "renamed"
+    # Keys from the previous version of the file are dropped from the index
+    assert config.get("agent.limits.rate") is None
+
+
+def test_set_forces_reparse_of_edited_section(config_dir):
+    config = Config(str(config_dir))
+
+    config.set("redis.url", "redis://elsewhere")
+    config.load_configs()
+
+    assert config.get("redis.url") == "redis://localhost"
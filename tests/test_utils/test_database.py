@@ -0,0 +1,104 @@
+import pytest
+
+from utils.database import Database
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def hset(self, key, mapping):
+        self.commands.append(("hset", key, mapping))
+
+    def expire(self, key, ttl):
+        self.commands.append(("expire", key, ttl))
+
+    def hgetall(self, key):
+        self.commands.append(("hgetall", key))
+
+    async def execute(self):
+        self.redis.round_trips += 1
+        results = []
+        for name, key, *args in self.commands:
+            if name == "hset":
+                self.redis.hashes.setdefault(key, {}).update(args[0])
+                results.append(len(args[0]))
+            elif name == "expire":
+                self.redis.ttls[key] = args[0]
+                results.append(True)
+            else:
+                results.append(dict(self.redis.hashes.get(key, {})))
+        return results
+
+
+class _FakeRedis:
+    """Just enough of redis.asyncio.Redis for the Database wrapper"""
+
+    def __init__(self):
+        self.values = {}
+        self.hashes = {}
+        self.ttls = {}
+        self.round_trips = 0
+        self.closed = False
+
+    async def set(self, key, value, ex=None):
+        self.values[key] = value
+        if ex:
+            self.ttls[key] = ex
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def delete(self, key):
+        self.values.pop(key, None)
+
+    async def hgetall(self, key):
+        self.round_trips += 1
+        return dict(self.hashes.get(key, {}))
+
+    def pipeline(self, transaction=True):
+        assert transaction is False
+        return _FakePipeline(self)
+
+    async def aclose(self):
+        self.closed = True
+
+
+@pytest.fixture
+def db():
+    database = Database("redis://localhost:6379/0")
+    database.redis = _FakeRedis()
+    return database
+
+
+@pytest.mark.asyncio
+async def test_key_value_methods_are_awaitable(db):
+    await db.set("price", "150", expire=30)
+    assert await db.get("price") == "150"
+    assert db.redis.ttls["price"] == 30
+
+    await db.delete("price")
+    assert await db.get("price") is None
+
+
+@pytest.mark.asyncio
+async def test_memories_are_pipelined(db):
+    await db.store_memory_many(
+        {"a": ({"mood": "calm"}, 60), "b": ({"mood": "alert"}, None)}
+    )
+    assert db.redis.round_trips == 1
+    assert db.redis.ttls == {"memory:a": 60}
+
+    memories = await db.get_memory_many(["a", "b", "missing"])
+    assert db.redis.round_trips == 2
+    assert memories == {"a": {"mood": "calm"}, "b": {"mood": "alert"}, "missing": {}}
+
+    await db.store_memory("c", {"mood": "bored"}, ttl=5)
+    assert await db.get_memory("c") == {"mood": "bored"}
+
+
+@pytest.mark.asyncio
+async def test_close_releases_pool(db):
+    await db.close()
+    assert db.redis.closed
@@ -0,0 +1,38 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("solana")
+
+from tokenomics.creation.distribution import TokenDistributor
+
+
+class _Distributor(TokenDistributor):
+    def __init__(self, releasable, **kwargs):
+        super().__init__("token", **kwargs)
+        self.releasable = releasable
+        self.in_flight = 0
+        self.peak = 0
+
+    async def _calculate_releasable_amounts(self, distribution):
+        return self.releasable
+
+    async def _transfer_tokens(self, recipient: str, amount: float) -> str:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        return f"tx-{recipient}-{amount}"
+
+
+@pytest.mark.asyncio
+async def test_execute_distribution_sends_one_bounded_transfer_per_recipient():
+    releasable = {f"r{i}": float(i) for i in range(10)}
+    distributor = _Distributor(releasable, max_concurrent_transfers=3)
+    distributor.distributions["d1"] = {}
+
+    result = await distributor.execute_distribution("d1")
+
+    assert result["transactions"] == [f"tx-r{i}-{float(i)}" for i in range(10)]
+    assert result["released_amounts"] == releasable
+    assert distributor.peak == 3
@@ -0,0 +1,124 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from tokenomics.revenue.distribution import (
+    DistributionConfig,
+    RevenueDistributor,
+    _apportion,
+)
+from tokenomics.revenue.fee_collection import FeeCollector, FeeConfig
+
+
+@pytest.fixture
+def collector() -> FeeCollector:
+    return FeeCollector(
+        FeeConfig(
+            trading_fee=0.003,
+            protocol_fee=0.1,
+            staking_fee=0.05,
+            burn_rate=0.02,
+            minimum_fee=1.0,
+        )
+    )
+
+
+class _Distributor(RevenueDistributor):
+    __slots__ = ("pending", "sent")
+
+    async def _get_pending_staking_rewards(self):
+        return self.pending
+
+    async def _send_reward(self, address: str, amount: float) -> str:
+        self.sent.append((address, amount))
+        return f"tx-{address}"
+
+
+def _distributor() -> _Distributor:
+    distributor = _Distributor(DistributionConfig(0.4, 0.3, 0.2, 0.1, 3600))
+    distributor.sent = []
+    return distributor
+
+
+def test_fee_breakdown_for_scalar_and_array(collector):
+    fees = collector._calculate_fees(10_000.0, "swap")
+    assert fees["trading_fee"] == pytest.approx(27.0)
+    assert fees["protocol_fee"] == pytest.approx(3.0)
+    assert fees["total"] == pytest.approx(30.0)
+
+    batch = collector._calculate_fees(np.array([10_000.0, 10.0]), "swap")
+    # The small trade is raised to minimum_fee
+    np.testing.assert_allclose(batch["total"], [30.0, 1.0])
+
+
+@pytest.mark.asyncio
+async def test_fee_history_is_buffered_until_read(collector):
+    collector._fee_buffer_limit = 3
+    for tx_type in ("swap", "swap"):
+        fees = collector._calculate_fees(1000.0, tx_type)
+        await collector._update_fee_history(fees, tx_type)
+    assert collector._fee_frame.empty
+
+    await collector._update_fee_history(collector._calculate_fees(1000.0, "lp"), "lp")
+    assert len(collector._fee_frame) == 3 and not collector._fee_buffer
+
+    await collector._update_fee_history(collector._calculate_fees(1000.0, "lp"), "lp")
+    history = collector.fee_history
+    assert isinstance(history, pd.DataFrame)
+    assert history["type"].tolist() == ["swap", "swap", "lp", "lp"]
+
+
+@pytest.mark.asyncio
+async def test_fee_statistics_by_type_and_trend(collector):
+    for tx_type in ("swap", "swap", "lp", "lp"):
+        fees = collector._calculate_fees(1000.0, tx_type)
+        await collector._update_fee_history(fees, tx_type)
+
+    stats = await collector.get_fee_statistics("1h")
+    assert stats["total_collected"] == pytest.approx(4 * 3.0)
+    assert stats["by_type"].loc["lp", "total"] == pytest.approx(6.0)
+    assert stats["trends"]["count"].sum() == 4
+
+
+@pytest.mark.asyncio
+async def test_fee_statistics_without_history(collector):
+    stats = await collector.get_fee_statistics()
+    assert stats["total_collected"] == 0.0
+    assert stats["by_type"].empty and stats["trends"].empty
+
+
+def test_apportion_by_stake():
+    np.testing.assert_allclose(_apportion(np.array([1.0, 3.0]), 100.0), [25.0, 75.0])
+    np.testing.assert_allclose(_apportion(np.zeros(2), 100.0), [0.0, 0.0])
+
+
+@pytest.mark.asyncio
+async def test_distribution_history_is_buffered_until_read():
+    distributor = _distributor()
+    distributor._distribution_buffer_limit = 2
+
+    distribution = distributor._calculate_distribution(1000.0)
+    assert distribution["treasury"] == pytest.approx(400.0)
+    await distributor._update_distribution_history(distribution, ["tx-1"])
+    assert distributor._distribution_frame.empty
+
+    await distributor._update_distribution_history(distribution, ["tx-2"])
+    await distributor._update_distribution_history(distribution, ["tx-3"])
+    history = distributor.distribution_history
+    assert isinstance(history, pd.DataFrame)
+    assert history["transactions"].tolist() == [["tx-1"], ["tx-2"], ["tx-3"]]
+
+
+@pytest.mark.asyncio
+async def test_staking_rewards_use_payload_stakes_then_update_stakes():
+    distributor = _distributor()
+
+    distributor.pending = {"total": 100.0, "stakes": {"a": 1.0, "b": 3.0}}
+    result = await distributor.process_staking_rewards()
+    assert result["distributions"] == {"a": 25.0, "b": 75.0}
+    assert result["transactions"] == ["tx-a", "tx-b"]
+
+    distributor.pending = {"total": 10.0}
+    distributor.update_stakes({"c": 2.0, "d": 2.0})
+    result = await distributor.process_staking_rewards()
+    assert result["distributions"] == {"c": 5.0, "d": 5.0}